@@ -1,11 +1,11 @@
 import streamlit as st
-from services.domain_service import check_domain_availability
-from services.similar_domain_service import find_similar_domains
+from services.domain_service import iter_domain_availability
+from services.similar_domain_service import iter_similar_domains
 from services.ai_domain_advisor import get_domain_suggestions
 import time
 from config.settings import DEMO_MODE
 
-# Run configuration check
+# Run configuration check (once per process, not on every rerun)
 try:
     from services.config_checker import check_config
     config_ok = check_config()
@@ -149,6 +149,35 @@ def select_suggestion(suggestion):
 def set_active_tab(tab):
     st.session_state.active_tab = tab
 
+def render_domain_rows(placeholder, domains):
+    """Redraw the available-domain rows inside a placeholder"""
+    with placeholder.container():
+        for domain in domains:
+            # Format price in Indian Rupees
+            price = f"₹{int(domain['price'] * usd_to_inr_rate)}"
+            
+            # Create columns for domain row
+            col1, col2, col3 = st.columns([5, 2, 2])
+            
+            with col1:
+                # Domain name with optional badge
+                if "similarity" in domain:
+                    st.write(f"**{domain['name']}.{domain['tld']}**")
+                else:
+                    st.write(f"**{domain['name']}.{domain['tld']}** 🟢")
+            
+            with col2:
+                # Price
+                st.write(f"**{price}**")
+            
+            with col3:
+                # Action button
+                domain_url = f"https://in.godaddy.com/domainsearch/find?domainToCheck={domain['name']}.{domain['tld']}"
+                st.markdown(f'<a href="{domain_url}" target="_blank"><button style="background-color: #28a745; color: white; border: none; padding: 5px 10px; border-radius: 5px; cursor: pointer;">Visit</button></a>', unsafe_allow_html=True)
+            
+            # Add separator
+            st.markdown("---")
+
 # Main header
 st.markdown('<h1 class="main-title">SEARCH DOMAIN.<br>Build your business.</h1>', unsafe_allow_html=True)
 
@@ -226,93 +255,47 @@ if st.session_state.active_tab == "direct_search":
             else:
                 tld_list = [tld.replace(".", "") for tld in tld_options]
             
-            # Show progress
-            st.markdown('<style>.stSpinner p { color: green !important; }</style>', unsafe_allow_html=True)
-            with st.spinner(f"Checking availability for {domain_query}..."):
-                # Check domain availability
-                results = check_domain_availability(domain_query, tld_list)
-                
-                # Group results by availability
-                available_domains = [r for r in results if r["available"]]
-                unavailable_domains = [r for r in results if not r["available"]]
-            
             # Display results
             st.markdown("<h3 style='color: green;'>Available Domains</h3>", unsafe_allow_html=True)
+            st.markdown('<style>.stSpinner p { color: green !important; }</style>', unsafe_allow_html=True)
             
-            # Create a clean container for results
-            results_container = st.container()
+            # Rows are drawn as each TLD comes back, then put in TLD order once all are in
+            exact_placeholder = st.empty()
+            available_domains = []
+            with st.spinner(f"Checking availability for {domain_query}..."):
+                for domain in iter_domain_availability(domain_query, tld_list):
+                    if domain["available"]:
+                        available_domains.append(domain)
+                        render_domain_rows(exact_placeholder, available_domains)
             
-            with results_container:
-                # Display exact domain results
-                for domain in results:
-                    # Format price in Indian Rupees
-                    price = f"₹{int(domain['price'] * usd_to_inr_rate)}"
-                    
-                    # Create columns for domain row
-                    col1, col2, col3 = st.columns([5, 2, 2])
-                    
-                    with col1:
-                        # Domain name with optional badge
-                        if domain["available"]:
-                            st.write(f"**{domain['name']}.{domain['tld']}** 🟢")
-                        
-                    with col2:
-                        # Price
-                        if domain["available"]:
-                            st.write(f"**{price}**")
-                    
-                    with col3:
-                        # Action button
-                        if domain["available"]:
-                            domain_url = f"https://in.godaddy.com/domainsearch/find?domainToCheck={domain['name']}.{domain['tld']}"
-                            st.markdown(f'<a href="{domain_url}" target="_blank"><button style="background-color: #28a745; color: white; border: none; padding: 5px 10px; border-radius: 5px; cursor: pointer;">Visit</button></a>', unsafe_allow_html=True)
-                            # Add separator
-                            st.markdown("---")
+            available_domains.sort(key=lambda d: tld_list.index(d["tld"]))
+            render_domain_rows(exact_placeholder, available_domains)
+            
+            try:
+                # Use a lower similarity threshold to get more results
+                similarity_threshold = 70
                 
-                try:
-                    # Use a lower similarity threshold to get more results
-                    similarity_threshold = 70
-                    
-                    st.markdown('<style>.stSpinner p { color: green !important; }</style>', unsafe_allow_html=True)
+                # Find similar domain suggestions, showing each as soon as it is confirmed
+                similar_placeholder = st.empty()
+                similar_results = []
+                with st.spinner("Finding similar available domains..."):
+                    for domain in iter_similar_domains(
+                        domain_query, 
+                        tld_list, 
+                        max_count=15,
+                        similarity_threshold=similarity_threshold
+                    ):
+                        similar_results.append(domain)
+                        render_domain_rows(similar_placeholder, similar_results)
                 
-                    # Find similar domain suggestions
-                    with st.spinner("Finding similar available domains..."):
-                        similar_results = find_similar_domains(
-                            domain_query, 
-                            tld_list, 
-                            max_count=15,
-                            similarity_threshold=similarity_threshold
-                        )
-                    
-                    # Display similar domain results
-                    if similar_results and len(similar_results) > 0:
-                        for domain in similar_results:
-                            # Format price in Indian Rupees
-                            price = f"₹{int(domain['price'] * usd_to_inr_rate)}"
-                            similarity = domain.get('similarity', 0)
-                            
-                            # Create columns for domain row
-                            col1, col2, col3 = st.columns([5, 2, 2])
-                            
-                            with col1:
-                                # Domain name with similarity
-                                st.write(f"**{domain['name']}.{domain['tld']}**")
-                            
-                            with col2:
-                                # Price
-                                st.write(f"**{price}**")
-                            
-                            with col3:
-                                # Action button
-                                domain_url = f"https://in.godaddy.com/domainsearch/find?domainToCheck={domain['name']}.{domain['tld']}"
-                                st.markdown(f'<a href="{domain_url}" target="_blank"><button style="background-color: #28a745; color: white; border: none; padding: 5px 10px; border-radius: 5px; cursor: pointer;">Visit</button></a>', unsafe_allow_html=True)
-                            
-                            # Add separator
-                            st.markdown("---")
-                    else:
-                        st.info("No similar available domains found. Try a different search term.")
-                except Exception as e:
-                    st.error(f"Error finding similar domains: {str(e)}")
+                # Display similar domain results, most similar first
+                if similar_results:
+                    similar_results.sort(key=lambda d: d.get('similarity', 0), reverse=True)
+                    render_domain_rows(similar_placeholder, similar_results)
+                else:
+                    similar_placeholder.info("No similar available domains found. Try a different search term.")
+            except Exception as e:
+                st.error(f"Error finding similar domains: {str(e)}")
 
 # Domain Advisor Tab
 elif st.session_state.active_tab == "advisor":
@@ -0,0 +1,55 @@
+"""
+Benchmark cold-start import time of the config and service entry points.
+
+Each statement runs in a fresh interpreter (so nothing is cached in
+sys.modules) and is timed from inside the process, excluding interpreter
+startup. Reports the median over several runs and whether Streamlit ended
+up imported, which is the main cost a worker or CLI should not pay.
+
+Usage (from the repository root):
+    python -m benchmarks.import_benchmark [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "from config.settings import DEMO_MODE",
+    "import config",
+    "import services",
+    "from services import check_domain_availability",
+    "from services.domain_service import check_domain_availability",
+    "import services.bulk_checker",
+    "import streamlit",
+]
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started, "streamlit" in sys.modules)
+"""
+
+def time_import(statement, runs, root):
+    """Median seconds to run an import statement in a fresh interpreter, and whether Streamlit was loaded"""
+    times = []
+    streamlit_loaded = False
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)],
+                                cwd=root, capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        streamlit_loaded = output[1] == "True"
+    return statistics.median(times), streamlit_loaded
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    print(f"Median of {runs} cold imports")
+    for statement in STATEMENTS:
+        elapsed, streamlit_loaded = time_import(statement, runs, root)
+        print(f"{statement:<64}{elapsed * 1000:>9.1f} ms  streamlit {'loaded' if streamlit_loaded else 'not loaded'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark batch similarity scoring against the difflib baseline.
+
+Scores one query against a few thousand domain-like candidates with
+difflib.SequenceMatcher (the previous implementation) and with each metric
+in services.similarity, with and without a threshold.
+
+Usage (from the repository root):
+    python -m benchmarks.similarity_benchmark [query] [candidate_count]
+"""
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+from services.similarity import METRICS, similarity_scores
+
+SUFFIXES = ["hub", "spot", "zone", "app", "site", "web", "now", "pro", "hq", "online", "center", "tech", "place"]
+PREFIXES = ["my", "the", "get", "try", "go", "best", "top", "pro", "smart", "easy", "e"]
+
+def make_candidates(query, count, seed=7):
+    """Mix of mutated and unrelated names, like the suggestion generator produces"""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    candidates = []
+    while len(candidates) < count:
+        kind = rng.random()
+        if kind < 0.3:
+            candidates.append(rng.choice(PREFIXES) + query)
+        elif kind < 0.6:
+            candidates.append(query + rng.choice(SUFFIXES))
+        elif kind < 0.85:
+            chars = list(query)
+            position = rng.randrange(len(chars))
+            chars[position] = rng.choice(letters)
+            candidates.append("".join(chars))
+        else:
+            candidates.append("".join(rng.choice(letters) for _ in range(rng.randint(4, 16))))
+    return candidates
+
+def timed(func, repeat=3):
+    """Best wall time of a few runs, and the last result"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    query = sys.argv[1] if len(sys.argv) > 1 else "mithaimagic"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    candidates = make_candidates(query, count)
+    
+    baseline_time, baseline = timed(lambda: [int(SequenceMatcher(None, query, c).ratio() * 100) for c in candidates])
+    print(f"{count} candidates for '{query}'")
+    print(f"{'difflib':<14}{'':>12}{baseline_time * 1000:>10.1f} ms")
+    
+    for metric in METRICS:
+        for threshold in (0, 70):
+            elapsed, scores = timed(lambda: similarity_scores(query, candidates, metric, threshold))
+            label = f"threshold={threshold}"
+            line = f"{metric:<14}{label:>12}{elapsed * 1000:>10.1f} ms  {baseline_time / elapsed:>6.1f}x"
+            if metric == "indel" and threshold == 0:
+                agree = sum(int(score) == expected for score, expected in zip(scores, baseline))
+                line += f"  same score as difflib: {agree / count:.1%}"
+            print(line)
+
+if __name__ == "__main__":
+    main()
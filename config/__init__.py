@@ -4,19 +4,27 @@ Domain Finder Configuration Package
 This package contains configuration settings for the domain finder application.
 """
 
-from config.settings import (
-    AZURE_OPENAI_KEY,
-    AZURE_OPENAI_ENDPOINT,
-    AZURE_OPENAI_DEPLOYMENT,
-    AZURE_OPENAI_API_VERSION,
-    WHOIS_API_KEY,
-    GODADDY_API_KEY,
-    GODADDY_API_SECRET,
-    APP_NAME,
-    APP_VERSION,
-    DEFAULT_TLDS,
-    DEMO_MODE
+import importlib
+
+# Settings re-exported here; they are read from config.settings on first access
+_SETTINGS = (
+    "AZURE_OPENAI_KEY",
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_DEPLOYMENT",
+    "AZURE_OPENAI_API_VERSION",
+    "WHOIS_API_KEY",
+    "GODADDY_API_KEY",
+    "GODADDY_API_SECRET",
+    "APP_NAME",
+    "APP_VERSION",
+    "DEFAULT_TLDS",
+    "DEMO_MODE"
 )
 
+def __getattr__(name):
+    if name in _SETTINGS:
+        return getattr(importlib.import_module("config.settings"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Version
 __version__ = '1.0.0'
\ No newline at end of file
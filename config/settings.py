@@ -1,28 +1,140 @@
-import streamlit as st
-from dotenv import load_dotenv
+"""
+Application settings.
+
+Settings are resolved on first access rather than at import, so importing
+this module is cheap: nothing (not even Streamlit) is loaded until a
+setting is read. Each value is looked up in SETTING_SOURCES in order
+(Streamlit secrets, then environment variables, then the .env file) and
+kept for the life of the process. Register extra sources with
+add_setting_source() before the settings they provide are first read.
+"""
 import os
+import sys
+import threading
+from functools import lru_cache
+
+# Setting name -> function computing its value, for settings read from the sources
+_definitions = {}
+_resolve_lock = threading.RLock()
+
+def streamlit_secrets_source(key):
+    """
+    Streamlit secrets
+    
+    Uses st.secrets when Streamlit is already loaded (the app); otherwise
+    reads the same secrets.toml files directly instead of importing it.
+    """
+    streamlit = sys.modules.get("streamlit")
+    if streamlit is not None:
+        try:
+            if key in streamlit.secrets:
+                return streamlit.secrets[key]
+        except Exception:
+            pass  # No secrets file
+        return None
+    return _secrets_files().get(key)
+
+def environment_source(key):
+    """Environment variables"""
+    return os.environ.get(key)
 
-# Try to load from .env file for local development
-load_dotenv()
+def dotenv_source(key):
+    """The .env file, for local development"""
+    return _dotenv_values().get(key)
+
+# Sources are functions taking a setting name and returning its value, or None
+# if they don't have it; the first source with a value wins
+SETTING_SOURCES = [streamlit_secrets_source, environment_source, dotenv_source]
+
+def add_setting_source(source, first=True):
+    """
+    Add a source of setting values
+    
+    Args:
+        source (callable): Function taking a setting name and returning its value or None
+        first (bool): Consult it before the existing sources (otherwise after them)
+    """
+    if first:
+        SETTING_SOURCES.insert(0, source)
+    else:
+        SETTING_SOURCES.append(source)
 
-# API Keys (try to get from Streamlit secrets first, then fall back to environment variables)
 def get_setting(key, default=""):
-    # Check Streamlit secrets first
-    if hasattr(st, "secrets") and key in st.secrets:
-        return st.secrets[key]
-    # Fall back to environment variables
-    return os.getenv(key, default)
+    """
+    Look a setting up in the sources
+    
+    Args:
+        key (str): Setting name
+        default: Value if no source has it
+    
+    Returns:
+        The first value found, or the default
+    """
+    for source in SETTING_SOURCES:
+        value = source(key)
+        if value is not None:
+            return value
+    return default
+
+@lru_cache(maxsize=None)
+def _secrets_files():
+    """Values from the global and project secrets.toml files Streamlit reads"""
+    try:
+        import tomllib
+    except ImportError:
+        return {}  # Python < 3.11; the app still reads them through st.secrets
+    
+    secrets = {}
+    for path in (os.path.expanduser("~/.streamlit/secrets.toml"), os.path.join(os.getcwd(), ".streamlit", "secrets.toml")):
+        try:
+            with open(path, "rb") as f:
+                secrets.update(tomllib.load(f))
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Error reading secrets file {path}: {str(e)}")
+    return secrets
+
+@lru_cache(maxsize=None)
+def _dotenv_values():
+    try:
+        from dotenv import dotenv_values, find_dotenv
+    except ImportError:
+        return {}
+    return {key: value for key, value in dotenv_values(find_dotenv()).items() if value is not None}
+
+def _define(**definitions):
+    """Register settings computed from the sources on first access"""
+    _definitions.update(definitions)
+
+def _resolve(name):
+    """Compute a setting once and keep it as a module attribute"""
+    with _resolve_lock:
+        if name not in globals():
+            globals()[name] = _definitions[name]()
+        return globals()[name]
+
+def __getattr__(name):
+    if name in _definitions:
+        return _resolve(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_definitions))
 
 # API Keys
-WHOIS_API_KEY = get_setting("WHOIS_API_KEY", "")
-GODADDY_API_KEY = get_setting("GODADDY_API_KEY", "")
-GODADDY_API_SECRET = get_setting("GODADDY_API_SECRET", "")
+_define(
+    WHOIS_API_KEY=lambda: get_setting("WHOIS_API_KEY", ""),
+    GODADDY_API_KEY=lambda: get_setting("GODADDY_API_KEY", ""),
+    GODADDY_API_SECRET=lambda: get_setting("GODADDY_API_SECRET", "")
+)
 
 # Azure OpenAI settings
-AZURE_OPENAI_KEY = get_setting("AZURE_OPENAI_KEY", "")
-AZURE_OPENAI_ENDPOINT = get_setting("AZURE_OPENAI_ENDPOINT", "https://access-01.openai.azure.com")
-AZURE_OPENAI_DEPLOYMENT = get_setting("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
-AZURE_OPENAI_API_VERSION = get_setting("AZURE_OPENAI_API_VERSION", "2025-01-01-preview")
+_define(
+    AZURE_OPENAI_KEY=lambda: get_setting("AZURE_OPENAI_KEY", ""),
+    AZURE_OPENAI_ENDPOINT=lambda: get_setting("AZURE_OPENAI_ENDPOINT", "https://access-01.openai.azure.com"),
+    AZURE_OPENAI_DEPLOYMENT=lambda: get_setting("AZURE_OPENAI_DEPLOYMENT", "gpt-4o"),
+    AZURE_OPENAI_API_VERSION=lambda: get_setting("AZURE_OPENAI_API_VERSION", "2025-01-01-preview")
+)
 
 # Application settings
 APP_NAME = "Domain Finder"
@@ -32,13 +144,147 @@ APP_VERSION = "1.0.0"
 # Default domain TLDs to check
 DEFAULT_TLDS = ["com", "net", "org", "io"]
 
+# Maximum number of (name, TLD) lookups run in parallel by check_domain_availability
+_define(MAX_CONCURRENT_LOOKUPS=lambda: int(get_setting("MAX_CONCURRENT_LOOKUPS", "8")))
+
+# Maximum number of in-flight requests per availability provider
+_define(
+    PROVIDER_CONCURRENCY=lambda: {
+        "godaddy": int(get_setting("GODADDY_CONCURRENCY", "4")),
+        "whois": int(get_setting("WHOIS_CONCURRENCY", "2"))
+    }
+)
+
+# Token-bucket rate limits per provider: sustained requests per second and burst size
+# (GoDaddy allows 60 requests per minute per endpoint)
+_define(
+    PROVIDER_RATE_LIMITS=lambda: {
+        "godaddy_ote": (float(get_setting("GODADDY_OTE_RATE_LIMIT", "1")), int(get_setting("GODADDY_OTE_BURST", "60"))),
+        "godaddy_prod": (float(get_setting("GODADDY_PROD_RATE_LIMIT", "1")), int(get_setting("GODADDY_PROD_BURST", "60"))),
+        "whois": (float(get_setting("WHOIS_RATE_LIMIT", "20")), int(get_setting("WHOIS_BURST", "20"))),
+        "azure_openai": (float(get_setting("AZURE_OPENAI_RATE_LIMIT", "5")), int(get_setting("AZURE_OPENAI_BURST", "10")))
+    }
+)
+
+# Provider circuit breakers: trip when the failure or slow-call rate over the last
+# CIRCUIT_WINDOW calls reaches its threshold, then stay open for CIRCUIT_OPEN_SECONDS
+_define(
+    CIRCUIT_WINDOW=lambda: int(get_setting("CIRCUIT_WINDOW", "20")),
+    CIRCUIT_MIN_CALLS=lambda: int(get_setting("CIRCUIT_MIN_CALLS", "5")),
+    CIRCUIT_FAILURE_RATE=lambda: float(get_setting("CIRCUIT_FAILURE_RATE", "0.5")),
+    CIRCUIT_SLOW_CALL_SECONDS=lambda: float(get_setting("CIRCUIT_SLOW_CALL_SECONDS", "5")),
+    CIRCUIT_SLOW_CALL_RATE=lambda: float(get_setting("CIRCUIT_SLOW_CALL_RATE", "0.8")),
+    CIRCUIT_OPEN_SECONDS=lambda: float(get_setting("CIRCUIT_OPEN_SECONDS", "30")),
+    CIRCUIT_HALF_OPEN_PROBES=lambda: int(get_setting("CIRCUIT_HALF_OPEN_PROBES", "1"))
+)
+
+# Hedged lookups: if the primary provider hasn't answered after a delay, also ask the
+# secondary one and use whichever answers first. An empty HEDGE_DELAY uses the
+# primary's observed HEDGE_PERCENTILE latency instead of a fixed delay. A batched
+# GoDaddy lookup (see micro-batching) is hedged too; its delay also counts the batch window.
+_define(
+    HEDGE_REQUESTS=lambda: get_setting("HEDGE_REQUESTS", "false").lower() in ["true", "yes", "1", "t", "y"],
+    HEDGE_DELAY=lambda: float(get_setting("HEDGE_DELAY", "") or 0),
+    HEDGE_PERCENTILE=lambda: float(get_setting("HEDGE_PERCENTILE", "95")),
+    HEDGE_MIN_DELAY=lambda: float(get_setting("HEDGE_MIN_DELAY", "0.05")),
+    HEDGE_DEFAULT_DELAY=lambda: float(get_setting("HEDGE_DEFAULT_DELAY", "1.0"))
+)
+
+# DNS pre-filter: names whose NS lookup resolves are marked taken without a paid API call.
+# DNS_RESOLVER is "host" or "host:port" (defaults to the system resolver).
+_define(
+    DNS_PREFILTER=lambda: get_setting("DNS_PREFILTER", "false").lower() in ["true", "yes", "1", "t", "y"],
+    DNS_RESOLVER=lambda: get_setting("DNS_RESOLVER", ""),
+    DNS_TIMEOUT=lambda: float(get_setting("DNS_TIMEOUT", "1.0")),
+    DNS_RETRIES=lambda: int(get_setting("DNS_RETRIES", "1")),
+    DNS_CONCURRENCY=lambda: int(get_setting("DNS_CONCURRENCY", "50"))
+)
+
+# Comma-separated Bloom filter files built from zone files with
+# `python -m services.registered_filter build` (names in them are treated as taken)
+_define(REGISTERED_FILTER_PATHS=lambda: [path.strip() for path in get_setting("REGISTERED_FILTER_PATHS", "").split(",") if path.strip()])
+
+# Word list (most common first) and the sound-alike index built from it
+# with `python -m services.phonetic build` (built on first use if missing)
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+_define(
+    WORD_LIST_PATH=lambda: get_setting("WORD_LIST_PATH", "") or os.path.join(DATA_DIR, "words.txt"),
+    PHONETIC_INDEX_PATH=lambda: get_setting("PHONETIC_INDEX_PATH", "") or os.path.join(DATA_DIR, "phonetic.idx")
+)
+
+# Availability model trained from the store's history with
+# `python -m services.availability_model train`. When the file exists, similar
+# domains are checked in order of similarity x P(available) and TLDs whose
+# expected value is below AVAILABILITY_MIN_EXPECTED_VALUE are skipped.
+_define(
+    AVAILABILITY_MODEL_PATH=lambda: get_setting("AVAILABILITY_MODEL_PATH", "") or os.path.join(DATA_DIR, "availability_model.npz"),
+    AVAILABILITY_MIN_EXPECTED_VALUE=lambda: float(get_setting("AVAILABILITY_MIN_EXPECTED_VALUE", "0.02"))
+)
+
+# Shared HTTP connection pool settings (per host)
+_define(
+    HTTP_POOL_SIZE=lambda: int(get_setting("HTTP_POOL_SIZE", "10")),
+    HTTP_POOL_HOSTS=lambda: int(get_setting("HTTP_POOL_HOSTS", "10")),
+    HTTP_CONNECT_TIMEOUT=lambda: float(get_setting("HTTP_CONNECT_TIMEOUT", "3.05")),
+    HTTP_READ_TIMEOUT=lambda: float(get_setting("HTTP_READ_TIMEOUT", "15"))
+)
+
+# Transport-level retries for 429/5xx responses and connection errors
+_define(
+    HTTP_MAX_RETRIES=lambda: int(get_setting("HTTP_MAX_RETRIES", "2")),
+    HTTP_BACKOFF_FACTOR=lambda: float(get_setting("HTTP_BACKOFF_FACTOR", "0.3")),
+    HTTP_MAX_RETRY_AFTER=lambda: float(get_setting("HTTP_MAX_RETRY_AFTER", "30"))
+)
+
+# Result cache bounds and lifetimes (seconds)
+_define(
+    CACHE_MAX_ENTRIES=lambda: int(get_setting("CACHE_MAX_ENTRIES", "10000")),
+    CACHE_MAX_BYTES=lambda: int(get_setting("CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    CACHE_TTL_AVAILABLE=lambda: int(get_setting("CACHE_TTL_AVAILABLE", "600")),
+    CACHE_TTL_TAKEN=lambda: int(get_setting("CACHE_TTL_TAKEN", "86400")),
+    CACHE_TTL_SUGGESTIONS=lambda: int(get_setting("CACHE_TTL_SUGGESTIONS", "3600")),
+    CACHE_STALE_TTL=lambda: int(get_setting("CACHE_STALE_TTL", "3600"))
+)
+
+# Optional SQLite file shared by all worker processes (empty disables it)
+_define(
+    AVAILABILITY_STORE_PATH=lambda: get_setting("AVAILABILITY_STORE_PATH", ""),
+    AVAILABILITY_STORE_FLUSH_INTERVAL=lambda: float(get_setting("AVAILABILITY_STORE_FLUSH_INTERVAL", "0.5")),
+    AVAILABILITY_STORE_BATCH_SIZE=lambda: int(get_setting("AVAILABILITY_STORE_BATCH_SIZE", "500")),
+    AVAILABILITY_STORE_SWEEP_INTERVAL=lambda: int(get_setting("AVAILABILITY_STORE_SWEEP_INTERVAL", "600"))
+)
+
 # Demo mode (if True, uses mock data instead of real API calls)
-DEMO_MODE = get_setting("DEMO_MODE", "true").lower() in ["true", "yes", "1", "t", "y"]
+_define(DEMO_MODE=lambda: get_setting("DEMO_MODE", "true").lower() in ["true", "yes", "1", "t", "y"])
 
 # GoDaddy API endpoints based on environment
-GODADDY_API_ENV = get_setting("GODADDY_API_ENV", "OTE").upper()  # OTE or PROD
+_define(GODADDY_API_ENV=lambda: get_setting("GODADDY_API_ENV", "OTE").upper())  # OTE or PROD
 GODADDY_ENDPOINTS = {
     "OTE": "https://api.ote-godaddy.com",
     "PROD": "https://api.godaddy.com"
 }
-GODADDY_API_URL = GODADDY_ENDPOINTS.get(GODADDY_API_ENV, GODADDY_ENDPOINTS["OTE"])
+# An explicit GODADDY_API_URL overrides the environment endpoint (e.g. for a local stub server)
+_define(GODADDY_API_URL=lambda: get_setting("GODADDY_API_URL", "") or GODADDY_ENDPOINTS.get(_resolve("GODADDY_API_ENV"), GODADDY_ENDPOINTS["OTE"]))
+
+# Maximum number of domains per GoDaddy bulk availability request
+_define(GODADDY_BULK_LIMIT=lambda: int(get_setting("GODADDY_BULK_LIMIT", "500")))
+
+# Micro-batching: GoDaddy lookups from every caller in the process are collected for
+# up to LOOKUP_BATCH_WINDOW_MS milliseconds (or LOOKUP_BATCH_MAX_SIZE pairs) and sent
+# as one bulk request. The window is the most latency batching adds; 0 disables it.
+# With HEDGE_REQUESTS on, a lookup whose batch hasn't answered within the batch window
+# plus the hedge delay is also sent to the secondary provider.
+_define(
+    LOOKUP_BATCH_WINDOW_MS=lambda: float(get_setting("LOOKUP_BATCH_WINDOW_MS", "15")),
+    LOOKUP_BATCH_MAX_SIZE=lambda: int(get_setting("LOOKUP_BATCH_MAX_SIZE", "") or _resolve("GODADDY_BULK_LIMIT"))
+)
+
+# Headless API server (server.py): listen address, worker processes sharing the
+# port, and the most request objects accepted in one batch body
+_define(
+    SERVER_HOST=lambda: get_setting("SERVER_HOST", "0.0.0.0"),
+    SERVER_PORT=lambda: int(get_setting("SERVER_PORT", "8080")),
+    SERVER_WORKERS=lambda: int(get_setting("SERVER_WORKERS", "1")),
+    SERVER_MAX_BATCH=lambda: int(get_setting("SERVER_MAX_BATCH", "100"))
+)
+
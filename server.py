@@ -0,0 +1,276 @@
+"""
+Headless HTTP/JSON API for the domain services.
+
+Serves the same async service core as the Streamlit app without a UI, so
+other services can call it and it can sit behind a load balancer. Each
+worker process runs one aiohttp event loop, and every request in a process
+shares its caches, connection pools, single-flight and micro-batching
+layers; the availability store (if configured) is shared by all workers.
+
+Endpoints (POST bodies are one request object, or a list of them):
+    POST /v1/availability  {"name": "mithaimagic", "tlds": ["com", "io"]}
+    POST /v1/similar       {"name": "mithaimagic", "tlds": ["com"], "max_count": 15, "similarity_threshold": 70}
+    POST /v1/suggestions   {"description": "An online sweet shop", "max_suggestions": 5}
+    POST /v1/generate      {"query": "organic tea", "filters": {"max_length": 15}}
+    GET  /health
+    GET  /stats
+
+Responses are JSON: {"results": [...]} for one request object, or
+{"batch": [{"results": [...]} or {"error": "..."}, ...]} for a list. With
+"Accept: application/x-ndjson" or ?stream=1 the response is NDJSON instead,
+one {"request": index, "result": ...} line per result as soon as it is
+ready (availability and similar domains arrive in completion order).
+
+Usage (from the repository root):
+    python server.py [--host HOST] [--port PORT] [--workers N]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import signal
+import sys
+
+from aiohttp import web
+
+from config.settings import (
+    DEFAULT_TLDS,
+    DEMO_MODE,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKERS,
+    SERVER_MAX_BATCH
+)
+from services.ai_domain_advisor import get_domain_suggestions_async
+from services.ai_service import generate_domain_suggestions
+from services.batcher import get_batcher_stats
+from services.domain_service import check_domain_availability_async, iter_domain_availability_async, get_provider_health
+from services.http_client import close_async_session, get_http_stats
+from services.rate_limiter import get_rate_limit_stats
+from services.similar_domain_service import find_similar_domains_async, iter_similar_domains_async
+from services.single_flight import get_single_flight_stats
+from services.utils import clean_domain_name, get_cache_stats, validate_domain_name
+
+NDJSON = "application/x-ndjson"
+
+# Limits on a single request object
+MAX_TLDS = 50
+MAX_TEXT_LENGTH = 2000
+MAX_SIMILAR_COUNT = 100
+
+async def check_availability(params, stream):
+    """Availability of one name across TLDs"""
+    name, tlds = _domain_name(params), _tlds(params)
+    if stream:
+        return iter_domain_availability_async(name, tlds)
+    return await check_domain_availability_async(name, tlds)
+
+async def similar_domains(params, stream):
+    """Available domains similar to one name"""
+    name, tlds = _domain_name(params), _tlds(params)
+    max_count = _integer(params, "max_count", 15, 1, MAX_SIMILAR_COUNT)
+    similarity_threshold = _integer(params, "similarity_threshold", 70, 0, 100)
+    if stream:
+        return iter_similar_domains_async(name, tlds, max_count, similarity_threshold)
+    return await find_similar_domains_async(name, tlds, max_count, similarity_threshold)
+
+async def domain_suggestions(params, stream):
+    """AI domain name suggestions for a business description"""
+    description = _text(params, "description")
+    max_suggestions = _integer(params, "max_suggestions", 5, 1, 20)
+    return await get_domain_suggestions_async(description, max_suggestions)
+
+async def generated_suggestions(params, stream):
+    """Suggestions from ai_service (which makes blocking calls, so runs in a thread)"""
+    query = _text(params, "query")
+    filters = params.get("filters") or {}
+    if not isinstance(filters, dict):
+        raise ValueError("'filters' must be an object")
+    return await asyncio.get_running_loop().run_in_executor(None, generate_domain_suggestions, query, filters)
+
+def endpoint(operation):
+    """
+    Build a handler running an operation for each request object in the body
+    
+    Operations take (params, stream) and return a list of results, or an
+    async iterator of them when streaming. ValueError means a bad request.
+    """
+    async def handle(request):
+        try:
+            body = await request.json()
+        except ValueError:
+            return _error_response("Request body must be JSON")
+        
+        batch = isinstance(body, list)
+        items = body if batch else [body]
+        if not items or not all(isinstance(item, dict) for item in items):
+            return _error_response("Request body must be an object or a non-empty list of objects")
+        if len(items) > SERVER_MAX_BATCH:
+            return _error_response(f"At most {SERVER_MAX_BATCH} requests per batch")
+        
+        if request.query.get("stream") in ("1", "true") or NDJSON in request.headers.get("Accept", ""):
+            return await _stream(request, operation, items)
+        
+        responses = await asyncio.gather(*(_collect(operation, item) for item in items))
+        if batch:
+            return web.json_response({"batch": responses})
+        return web.json_response(responses[0], status=400 if "error" in responses[0] else 200)
+    
+    handle.__name__ = operation.__name__
+    return handle
+
+async def health(request):
+    return web.json_response({"status": "ok", "demo_mode": DEMO_MODE})
+
+async def stats(request):
+    return web.json_response({
+        "providers": get_provider_health(),
+        "caches": get_cache_stats(),
+        "single_flight": get_single_flight_stats(),
+        "batchers": get_batcher_stats(),
+        "rate_limits": get_rate_limit_stats(),
+        "http": get_http_stats()
+    }, dumps=lambda data: json.dumps(data, default=str))
+
+def create_app():
+    """
+    Build the aiohttp application
+    
+    Returns:
+        aiohttp.web.Application: The API app
+    """
+    app = web.Application()
+    app.add_routes([
+        web.post("/v1/availability", endpoint(check_availability)),
+        web.post("/v1/similar", endpoint(similar_domains)),
+        web.post("/v1/suggestions", endpoint(domain_suggestions)),
+        web.post("/v1/generate", endpoint(generated_suggestions)),
+        web.get("/health", health),
+        web.get("/stats", stats)
+    ])
+    app.on_cleanup.append(lambda app: close_async_session())
+    return app
+
+async def _collect(operation, params):
+    """Run one request object to completion"""
+    try:
+        return {"results": await operation(params, False)}
+    except ValueError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        print(f"Error handling {operation.__name__} request: {str(e)}")
+        return {"error": "Internal error"}
+
+async def _stream(request, operation, items):
+    """Write each result as an NDJSON line as soon as any request object produces it"""
+    response = web.StreamResponse(headers={"Content-Type": NDJSON})
+    await response.prepare(request)
+    
+    lines = asyncio.Queue()
+    finished = object()
+    
+    async def produce(index, params):
+        try:
+            results = await operation(params, True)
+            if isinstance(results, list):
+                for result in results:
+                    await lines.put({"request": index, "result": result})
+            else:
+                async for result in results:
+                    await lines.put({"request": index, "result": result})
+        except ValueError as e:
+            await lines.put({"request": index, "error": str(e)})
+        except Exception as e:
+            print(f"Error handling {operation.__name__} request: {str(e)}")
+            await lines.put({"request": index, "error": "Internal error"})
+        finally:
+            await lines.put(finished)
+    
+    producers = [asyncio.ensure_future(produce(index, params)) for index, params in enumerate(items)]
+    try:
+        remaining = len(producers)
+        while remaining:
+            line = await lines.get()
+            if line is finished:
+                remaining -= 1
+            else:
+                await response.write((json.dumps(line) + "\n").encode("utf-8"))
+        await response.write_eof()
+    finally:
+        # The client may disconnect mid-stream; stop the lookups it no longer needs
+        for producer in producers:
+            producer.cancel()
+    return response
+
+def _error_response(message):
+    return web.json_response({"error": message}, status=400)
+
+def _domain_name(params):
+    name = params.get("name")
+    if not isinstance(name, str):
+        raise ValueError("'name' must be a string")
+    
+    # Drop any TLD the caller included, like the UI does
+    name = clean_domain_name(name.strip().split(".")[0])
+    if len(name) < 3 or not validate_domain_name(name):
+        raise ValueError("'name' must be a valid domain name of at least 3 characters")
+    return name
+
+def _tlds(params):
+    tlds = params.get("tlds") or DEFAULT_TLDS
+    if not isinstance(tlds, list) or not all(isinstance(tld, str) and tld.strip(".") for tld in tlds):
+        raise ValueError("'tlds' must be a list of TLDs")
+    if len(tlds) > MAX_TLDS:
+        raise ValueError(f"At most {MAX_TLDS} TLDs per request")
+    return list(dict.fromkeys(tld.strip(".").lower() for tld in tlds))
+
+def _text(params, field):
+    text = params.get(field)
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError(f"'{field}' must be a non-empty string")
+    if len(text) > MAX_TEXT_LENGTH:
+        raise ValueError(f"'{field}' must be at most {MAX_TEXT_LENGTH} characters")
+    return text.strip()
+
+def _integer(params, field, default, minimum, maximum):
+    value = params.get(field, default)
+    if isinstance(value, bool) or not isinstance(value, int) or not minimum <= value <= maximum:
+        raise ValueError(f"'{field}' must be an integer from {minimum} to {maximum}")
+    return value
+
+def _serve(host, port, reuse_port):
+    web.run_app(create_app(), host=host, port=port, reuse_port=reuse_port, print=None)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the headless domain services API")
+    parser.add_argument("--host", default=SERVER_HOST, help=f"Listen address (default {SERVER_HOST})")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help=f"Listen port (default {SERVER_PORT})")
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS,
+                        help=f"Worker processes sharing the port (default {SERVER_WORKERS})")
+    args = parser.parse_args(argv)
+    
+    print(f"Serving on http://{args.host}:{args.port} with {args.workers} worker(s)")
+    if args.workers <= 1:
+        _serve(args.host, args.port, False)
+        return
+    
+    # Each worker is its own process with its own event loop; the kernel
+    # spreads connections across them (SO_REUSEPORT)
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_serve, args=(args.host, args.port, True)) for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    
+    # Stopping the parent (Ctrl+C or SIGTERM from a supervisor) stops the workers
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            worker.terminate()
+
+if __name__ == "__main__":
+    main()
@@ -8,21 +8,49 @@ This package contains all service modules for the domain finder application:
 - utils: Helper functions and utilities
 """
 
-from services.domain_service import check_domain_availability
-from services.similar_domain_service import find_similar_domains
-try:
-    from services.config_checker import check_config
-except ImportError:
-    # Define a dummy function if the module is missing
-    def check_config():
-        return True
+import importlib
 
-from services.utils import (
-    validate_domain_name,
-    clean_domain_name,
-    cached,
-    rate_limit
-)
+# Public names and the modules they come from; each module is imported the
+# first time one of its names is used, so importing the package is cheap
+_EXPORTS = {
+    "check_domain_availability": "services.domain_service",
+    "check_domain_availability_async": "services.domain_service",
+    "iter_domain_availability": "services.domain_service",
+    "get_provider_health": "services.domain_service",
+    "find_similar_domains": "services.similar_domain_service",
+    "find_similar_domains_async": "services.similar_domain_service",
+    "iter_similar_domains": "services.similar_domain_service",
+    "single_flight": "services.single_flight",
+    "get_single_flight_stats": "services.single_flight",
+    "get_batcher_stats": "services.batcher",
+    "check_config": "services.config_checker",
+    "validate_domain_name": "services.utils",
+    "clean_domain_name": "services.utils",
+    "cached": "services.utils",
+    "rate_limit": "services.utils",
+    "run_sync": "services.utils",
+    "iterate_sync": "services.utils"
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module), name)
+    except ImportError:
+        if name != "check_config":
+            raise
+        # Define a dummy function if the module is missing
+        def value():
+            return True
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
 # Version
 __version__ = '1.0.0'
\ No newline at end of file
@@ -1,21 +1,38 @@
 """
 AI Domain Advisor - Uses Azure OpenAI to generate domain name suggestions.
 """
-import requests
-import json
 import re
 from config.settings import (
     AZURE_OPENAI_KEY, 
     AZURE_OPENAI_ENDPOINT, 
     AZURE_OPENAI_DEPLOYMENT, 
     AZURE_OPENAI_API_VERSION,
-    DEMO_MODE
+    DEMO_MODE,
+    CACHE_TTL_SUGGESTIONS
 )
+from services.http_client import request_async
+from services.rate_limiter import throttle_async
+from services.utils import cached, run_sync
 
 def get_domain_suggestions(business_description, max_suggestions=5):
     """
     Generate domain name suggestions based on a business description.
     
+    Synchronous wrapper around get_domain_suggestions_async().
+    
+    Args:
+        business_description (str): Description of the business
+        max_suggestions (int): Maximum number of suggestions to return
+    
+    Returns:
+        list: List of domain name suggestions (without TLDs)
+    """
+    return run_sync(get_domain_suggestions_async(business_description, max_suggestions))
+
+async def get_domain_suggestions_async(business_description, max_suggestions=5):
+    """
+    Generate domain name suggestions based on a business description.
+    
     Args:
         business_description (str): Description of the business
         max_suggestions (int): Maximum number of suggestions to return
@@ -28,21 +45,25 @@ def get_domain_suggestions(business_description, max_suggestions=5):
         return _mock_domain_suggestions(business_description)
     
     try:
-        # Prepare the AI prompt
-        prompt = _prepare_prompt(business_description)
-        
-        # Call Azure OpenAI API
-        suggestions = _call_azure_openai(prompt)
-        
-        # Process and clean suggestions
-        cleaned_suggestions = _process_suggestions(suggestions, max_suggestions)
-        
-        return cleaned_suggestions
+        # Copy so callers can't modify the cached list
+        return list(await _generate_suggestions(business_description, max_suggestions))
     
     except Exception as e:
         print(f"Error generating domain suggestions: {str(e)}")
         return _mock_domain_suggestions(business_description)  # Fallback to mock suggestions
 
+@cached(expiration=CACHE_TTL_SUGGESTIONS)
+async def _generate_suggestions(business_description, max_suggestions):
+    """Generate suggestions with Azure OpenAI (failures are raised, not cached)"""
+    # Prepare the AI prompt
+    prompt = _prepare_prompt(business_description)
+    
+    # Call Azure OpenAI API
+    suggestions = await _call_azure_openai(prompt)
+    
+    # Process and clean suggestions
+    return _process_suggestions(suggestions, max_suggestions)
+
 def _prepare_prompt(business_description):
     """Prepare the prompt for the Azure OpenAI API"""
     
@@ -71,7 +92,7 @@ def _prepare_prompt(business_description):
     Domain name suggestions:
     """
 
-def _call_azure_openai(prompt):
+async def _call_azure_openai(prompt):
     """Call Azure OpenAI API to generate domain suggestions"""
     
     # Prepare the request
@@ -96,7 +117,9 @@ def _call_azure_openai(prompt):
     url = f"{AZURE_OPENAI_ENDPOINT}/openai/deployments/{AZURE_OPENAI_DEPLOYMENT}/chat/completions?api-version={AZURE_OPENAI_API_VERSION}"
     
     # Make the API request
-    response = requests.post(url, headers=headers, json=payload)
+    await throttle_async("azure_openai")
+    # A completion is billed per call, so a timed-out request is not re-sent
+    response = await request_async("POST", url, retry=False, headers=headers, json=payload)
     response_data = response.json()
     
     # Extract suggestions from response
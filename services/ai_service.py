@@ -1,8 +1,8 @@
 import os
 import random
-import requests
 import json
 from config.settings import AZURE_OPENAI_KEY
+from services.segmentation import split_compound
 
 def generate_domain_suggestions(query, filters=None):
     """
@@ -42,8 +42,8 @@ def generate_domain_suggestions(query, filters=None):
 
 def _generate_with_openai(query, filters):
     """Generate domain suggestions using Azure OpenAI API"""
-    import requests
-    import json
+    from services.http_client import request
+    from services.rate_limiter import throttle
     from config.settings import AZURE_OPENAI_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_DEPLOYMENT, AZURE_OPENAI_API_VERSION
     
     # Construct prompt based on query and filters
@@ -72,7 +72,9 @@ def _generate_with_openai(query, filters):
     url = f"{AZURE_OPENAI_ENDPOINT}/openai/deployments/{AZURE_OPENAI_DEPLOYMENT}/chat/completions?api-version={AZURE_OPENAI_API_VERSION}"
     
     # Make the API request
-    response = requests.post(url, headers=headers, json=payload)
+    throttle("azure_openai")
+    # A completion is billed per call, so a timed-out request is not re-sent
+    response = request("POST", url, retry=False, headers=headers, json=payload)
     response_data = response.json()
     
     # Parse response from Azure OpenAI
@@ -189,8 +191,9 @@ def _extract_keywords(query):
                    "will", "would", "should", "could", "can", "may", "might", "must",
                    "that", "this", "these", "those", "it", "they", "them", "their"}
     
-    # Split and clean keywords
+    # Split and clean keywords, then split run-together names ("mithaimagic")
     words = query.lower().replace(',', ' ').replace('.', ' ').split()
+    words = [part for word in words for part in split_compound(word)]
     keywords = [word for word in words if word not in common_words and len(word) > 2]
     
     return list(set(keywords))
@@ -0,0 +1,438 @@
+"""
+Availability-probability model for ordering availability checks.
+
+A logistic regression over hashed features of a (name, TLD) pair: the TLD,
+name length, dictionary-word content from the segmenter, digits, hyphens
+and character n-grams, with the structural features also crossed with the
+TLD (a short .com behaves nothing like a short .dev). It is trained offline
+from the availability store's history and scores whole candidate x TLD
+matrices with NumPy, so the similar-domain scheduler can check the most
+promising cells first and skip hopeless ones.
+
+Usage (from the repository root):
+    python -m services.availability_model train [--store PATH] [--output PATH]
+    python -m services.availability_model evaluate [--store PATH | --synthetic COUNT]
+"""
+import argparse
+import io
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from config.settings import (
+    AVAILABILITY_MODEL_PATH,
+    AVAILABILITY_MIN_EXPECTED_VALUE,
+    AVAILABILITY_STORE_PATH,
+    WORD_LIST_PATH
+)
+from services.availability_store import AvailabilityStore
+from services.segmentation import get_segmenter
+
+# The model has 2 ** HASH_BITS weights
+HASH_BITS = 20
+
+# Character n-gram sizes
+NGRAM_SIZES = (2, 3)
+
+# Longer names share the last length feature
+MAX_LENGTH_FEATURE = 20
+
+# Results from these providers are simulated, not observed
+UNTRUSTED_PROVIDERS = ("mock",)
+
+_model = None
+_model_loaded = False
+_model_lock = threading.Lock()
+
+class AvailabilityModel:
+    """Hashed-feature logistic regression estimating P(available) for (name, tld) pairs"""
+    
+    def __init__(self, weights, metadata=None):
+        """
+        Args:
+            weights (numpy.ndarray): One weight per hashed feature (a power of two of them)
+            metadata (dict): Training details kept with the model
+        """
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.mask = len(self.weights) - 1
+        self.metadata = metadata or {}
+    
+    def predict(self, pairs):
+        """
+        Estimate P(available) for many pairs at once
+        
+        Args:
+            pairs (list): List of (name, tld) tuples
+        
+        Returns:
+            numpy.ndarray: Probabilities in input order
+        """
+        if not pairs:
+            return np.zeros(0)
+        indices, offsets = _encode_pairs(pairs, self.mask)
+        return _sigmoid(np.add.reduceat(self.weights[indices], offsets))
+    
+    def predict_matrix(self, names, tlds):
+        """
+        Estimate P(available) for every name with every TLD
+        
+        Returns:
+            numpy.ndarray: Probabilities, shape (len(names), len(tlds))
+        """
+        pairs = [(name, tld) for name in names for tld in tlds]
+        return self.predict(pairs).reshape(len(names), len(tlds))
+    
+    def save(self, path):
+        """Write the model to a .npz file (atomically)"""
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, weights=self.weights, metadata=np.array(json.dumps(self.metadata)))
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(buffer.getvalue())
+        os.replace(temp_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        """Read a model written by save()"""
+        with np.load(path) as data:
+            return cls(data["weights"], json.loads(str(data["metadata"])))
+
+def get_availability_model():
+    """
+    Get the model at AVAILABILITY_MODEL_PATH (loaded on first use)
+    
+    Returns:
+        AvailabilityModel: The model, or None if none has been trained
+    """
+    global _model, _model_loaded
+    
+    with _model_lock:
+        if not _model_loaded:
+            _model_loaded = True
+            if os.path.exists(AVAILABILITY_MODEL_PATH):
+                try:
+                    _model = AvailabilityModel.load(AVAILABILITY_MODEL_PATH)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Error loading availability model {AVAILABILITY_MODEL_PATH}: {str(e)}")
+    return _model
+
+def name_features(name):
+    """
+    Describe a name for the model
+    
+    Args:
+        name (str): Domain name without TLD
+    
+    Returns:
+        tuple: (features of the name, the subset that is also crossed with the TLD)
+    """
+    segmenter = get_segmenter()
+    words = segmenter.segment(name)
+    probabilities = [segmenter.log_probability(word) for word in words]
+    known = [word for word, probability in zip(words, probabilities) if probability is not None]
+    unknown_letters = sum(len(word) for word, probability in zip(words, probabilities) if probability is None and word.isalpha())
+    
+    # Names built from common words are the ones registered first
+    rarest = min((probability for probability in probabilities if probability is not None), default=None)
+    rarity = "none" if rarest is None else min(int(-rarest), 8)
+    
+    crossed = [
+        f"len={min(len(name), MAX_LENGTH_FEATURE)}",
+        f"words={min(len(words), 4)}",
+        f"known={min(len(known), 4)}",
+        f"unknown={min(unknown_letters, 6)}",
+        f"rarity={rarity}",
+        f"single_word={len(words) == 1 and len(known) == 1}",
+        f"digits={any(char.isdigit() for char in name)}",
+        f"hyphen={'-' in name}"
+    ]
+    features = ["bias"] + crossed + [f"word={word}" for word in known]
+    padded = f"^{name}$"
+    for size in NGRAM_SIZES:
+        features.extend(f"gram={padded[i:i + size]}" for i in range(len(padded) - size + 1))
+    return features, crossed
+
+def train(examples, hash_bits=HASH_BITS, epochs=5, learning_rate=0.02, l2=1e-6, batch_size=256, seed=0):
+    """
+    Fit a model to observed results with mini-batch AdaGrad
+    
+    Args:
+        examples (list): (name, tld, available) tuples
+        hash_bits (int): The model gets 2 ** hash_bits weights
+        epochs (int): Passes over the examples
+        learning_rate (float): AdaGrad step size
+        l2 (float): L2 penalty on the weights
+        batch_size (int): Examples per update
+        seed (int): Shuffling seed
+    
+    Returns:
+        AvailabilityModel: The trained model
+    """
+    examples = list(examples)
+    if not examples:
+        raise ValueError("No examples to train on")
+    rng = random.Random(seed)
+    rng.shuffle(examples)
+    
+    mask = (1 << hash_bits) - 1
+    indices, offsets = _encode_pairs([(name, tld) for name, tld, _ in examples], mask)
+    bounds = np.append(offsets, len(indices))
+    labels = np.array([available for _, _, available in examples], dtype=np.float64)
+    
+    weights = np.zeros(mask + 1)
+    squared_gradients = np.zeros(mask + 1)
+    
+    # Start from the base rate so early updates go to the informative features
+    base_rate = float(np.clip(labels.mean(), 1e-4, 1 - 1e-4))
+    weights[_hash("bias") & mask] = np.log(base_rate / (1 - base_rate))
+    
+    starts = list(range(0, len(examples), batch_size))
+    for _ in range(epochs):
+        rng.shuffle(starts)
+        for start in starts:
+            end = min(start + batch_size, len(examples))
+            batch = indices[bounds[start]:bounds[end]]
+            errors = _sigmoid(np.add.reduceat(weights[batch], offsets[start:end] - bounds[start])) - labels[start:end]
+            
+            # Each example's error goes to every feature it has
+            features, inverse = np.unique(batch, return_inverse=True)
+            gradient = np.bincount(inverse, weights=np.repeat(errors, np.diff(bounds[start:end + 1])))
+            gradient += l2 * weights[features]
+            squared_gradients[features] += gradient ** 2
+            weights[features] -= learning_rate * gradient / (np.sqrt(squared_gradients[features]) + 1e-8)
+    
+    return AvailabilityModel(weights, {
+        "examples": len(examples),
+        "base_rate": base_rate,
+        "epochs": epochs,
+        "trained_at": time.time()
+    })
+
+def load_history(store_path=None):
+    """
+    Read observed results from an availability store
+    
+    Only rows still in the store are available, so the longer results are
+    kept (CACHE_TTL_* and AVAILABILITY_STORE_SWEEP_INTERVAL) the more there
+    is to learn from.
+    
+    Args:
+        store_path (str): SQLite store file (defaults to AVAILABILITY_STORE_PATH)
+    
+    Returns:
+        list: (name, tld, available) tuples
+    """
+    store_path = store_path or AVAILABILITY_STORE_PATH
+    if not store_path or not os.path.exists(store_path):
+        print(f"Error reading availability history: no store at '{store_path}'")
+        return []
+    
+    store = AvailabilityStore(store_path)
+    try:
+        return [
+            (name, tld, available)
+            for name, tld, available, provider, _ in store.iter_history()
+            if provider not in UNTRUSTED_PROVIDERS
+        ]
+    finally:
+        store.close()
+
+def synthetic_history(count, seed=0):
+    """
+    Results labelled by the DEMO_MODE mock engine, for trying the harness
+    without a store
+    
+    Args:
+        count (int): Number of (name, tld) examples
+        seed (int): Name generator seed
+    
+    Returns:
+        list: (name, tld, available) tuples
+    """
+    from services.mock_engine import TLD_AVAILABILITY_RATES, check_mock_batch
+    
+    with open(WORD_LIST_PATH, encoding="utf-8") as lines:
+        words = [line.strip() for line in lines if line.strip().isalpha()]
+    rng = random.Random(seed)
+    tlds = list(TLD_AVAILABILITY_RATES)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    
+    pairs = []
+    while len(pairs) < count:
+        kind = rng.random()
+        if kind < 0.6:
+            name = "".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        elif kind < 0.8:
+            name = rng.choice(words) + str(rng.randint(1, 99))
+        else:
+            name = "".join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        pairs.append((name, rng.choice(tlds)))
+    
+    return [(name, tld, available) for (name, tld), (available, _) in zip(pairs, check_mock_batch(pairs))]
+
+def evaluate(examples, test_fraction=0.2, searches=500, pool_size=150, wanted=10,
+             min_probability=AVAILABILITY_MIN_EXPECTED_VALUE, seed=0, **train_options):
+    """
+    Train on part of the history and replay the rest as simulated searches
+    
+    Names are split between training and test sets (all TLDs of a name go
+    to the same side). Similarity isn't part of the history, so each
+    simulated search is a random pool of held-out results standing in for
+    one search's candidate x TLD cells. The baseline checks them in pool
+    order, as checking strictly by similarity does; the model checks them
+    by P(available) and skips those below min_probability. Both stop once
+    `wanted` are available.
+    
+    Args:
+        examples (list): (name, tld, available) tuples
+        test_fraction (float): Share of names held out
+        searches (int): Number of simulated searches
+        pool_size (int): Cells per simulated search
+        wanted (int): Available results each search is after
+        min_probability (float): Cells below this are never checked
+        seed (int): Pool sampling seed
+        **train_options: Passed to train()
+    
+    Returns:
+        dict: Accuracy and calls-saved metrics
+    """
+    train_set, test_set = [], []
+    for example in examples:
+        held_out = zlib.crc32(example[0].encode("utf-8")) % 1000 < test_fraction * 1000
+        (test_set if held_out else train_set).append(example)
+    if not train_set or not test_set:
+        raise ValueError("Not enough examples to split into training and test sets")
+    
+    model = train(train_set, **train_options)
+    probabilities = model.predict([(name, tld) for name, tld, _ in test_set])
+    labels = np.array([available for _, _, available in test_set], dtype=np.float64)
+    clipped = np.clip(probabilities, 1e-7, 1 - 1e-7)
+    
+    rng = np.random.default_rng(seed)
+    baseline_calls = model_calls = baseline_found = model_found = 0
+    for _ in range(searches):
+        pool = rng.choice(len(test_set), size=min(pool_size, len(test_set)), replace=False)
+        calls, found = _calls_to_fill(labels[pool], wanted)
+        baseline_calls += calls
+        baseline_found += found
+        
+        ranked = pool[np.argsort(-probabilities[pool], kind="stable")]
+        calls, found = _calls_to_fill(labels[ranked[probabilities[ranked] >= min_probability]], wanted)
+        model_calls += calls
+        model_found += found
+    
+    return {
+        "train_examples": len(train_set),
+        "test_examples": len(test_set),
+        "base_rate": float(labels.mean()),
+        "log_loss": float(-np.mean(labels * np.log(clipped) + (1 - labels) * np.log(1 - clipped))),
+        "auc": _auc(labels, probabilities),
+        "searches": searches,
+        "baseline_calls": baseline_calls / searches,
+        "model_calls": model_calls / searches,
+        "baseline_found": baseline_found / searches,
+        "model_found": model_found / searches,
+        "calls_saved": 1 - model_calls / baseline_calls if baseline_calls else 0.0
+    }
+
+def _calls_to_fill(labels, wanted):
+    """(checks made, available found) walking labels in order until `wanted` are available"""
+    if not len(labels):
+        return 0, 0
+    hits = np.cumsum(labels)
+    if hits[-1] < wanted:
+        return len(labels), int(hits[-1])
+    return int(np.searchsorted(hits, wanted)) + 1, wanted
+
+def _auc(labels, scores):
+    """Probability that a random available pair outscores a random taken one"""
+    positives = labels.sum()
+    negatives = len(labels) - positives
+    if not positives or not negatives:
+        return float("nan")
+    ranks = np.empty(len(scores))
+    ranks[np.argsort(scores, kind="stable")] = np.arange(1, len(scores) + 1)
+    return float((ranks[labels == 1].sum() - positives * (positives + 1) / 2) / (positives * negatives))
+
+def _hash(feature):
+    return zlib.crc32(feature.encode("utf-8"))
+
+@lru_cache(maxsize=65536)
+def _name_hashes(name):
+    """Hashes of a name's features, and its TLD-crossed features (unhashed)"""
+    features, crossed = name_features(name)
+    return tuple(_hash(feature) for feature in features), tuple(crossed)
+
+def _encode_pairs(pairs, mask):
+    """
+    Hashed feature indices of many pairs, flattened
+    
+    Returns:
+        tuple: (feature indices, offset of each pair's first index)
+    """
+    indices = []
+    offsets = []
+    for name, tld in pairs:
+        tld = tld.lower().lstrip(".")
+        own, crossed = _name_hashes(name.lower())
+        offsets.append(len(indices))
+        indices.extend(own)
+        indices.append(_hash(f"tld={tld}"))
+        indices.extend(_hash(f"{tld}|{feature}") for feature in crossed)
+    return np.array(indices, dtype=np.int64) & mask, np.array(offsets, dtype=np.int64)
+
+def _sigmoid(values):
+    return 1 / (1 + np.exp(-np.clip(values, -30, 30)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train or evaluate the availability-probability model")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    train_command = commands.add_parser("train", help="Train from the availability store's history")
+    train_command.add_argument("--store", help="SQLite store file (default AVAILABILITY_STORE_PATH)")
+    train_command.add_argument("--output", default=AVAILABILITY_MODEL_PATH, help="Model file to write")
+    train_command.add_argument("--epochs", type=int, default=5, help="Passes over the history (default 5)")
+    
+    evaluate_command = commands.add_parser("evaluate", help="Report accuracy and calls saved on held-out history")
+    source = evaluate_command.add_mutually_exclusive_group()
+    source.add_argument("--store", help="SQLite store file (default AVAILABILITY_STORE_PATH)")
+    source.add_argument("--synthetic", type=int, metavar="COUNT", help="Use COUNT results from the mock engine instead")
+    evaluate_command.add_argument("--searches", type=int, default=500, help="Simulated searches (default 500)")
+    evaluate_command.add_argument("--pool", type=int, default=150, help="Candidate cells per search (default 150)")
+    evaluate_command.add_argument("--wanted", type=int, default=10, help="Available results per search (default 10)")
+    evaluate_command.add_argument("--min-probability", type=float, default=AVAILABILITY_MIN_EXPECTED_VALUE,
+                                  help="Skip cells below this probability")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "train":
+        examples = load_history(args.store)
+        if not examples:
+            return
+        started = time.time()
+        model = train(examples, epochs=args.epochs)
+        model.save(args.output)
+        print(f"Trained on {len(examples)} results in {time.time() - started:.1f}s "
+              f"(base rate {model.metadata['base_rate']:.1%}); wrote {args.output}")
+    else:
+        examples = synthetic_history(args.synthetic) if args.synthetic else load_history(args.store)
+        if not examples:
+            return
+        report = evaluate(examples, searches=args.searches, pool_size=args.pool, wanted=args.wanted,
+                          min_probability=args.min_probability)
+        print(f"Trained on {report['train_examples']}, tested on {report['test_examples']} results "
+              f"(base rate {report['base_rate']:.1%})")
+        print(f"Log loss {report['log_loss']:.3f}, AUC {report['auc']:.3f}")
+        print(f"{report['searches']} searches for {args.wanted} of {args.pool} cells:")
+        print(f"  similarity order: {report['baseline_calls']:.1f} calls, {report['baseline_found']:.1f} found")
+        print(f"  expected value:   {report['model_calls']:.1f} calls, {report['model_found']:.1f} found")
+        print(f"  calls saved: {report['calls_saved']:.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Persistent availability results shared by every worker process.
+
+Results live in a SQLite database in WAL mode, so many processes can read
+while one writes. Writes are buffered and flushed in batches by a
+background thread, which also sweeps expired rows. Lookups from async code
+run in a thread with one batched query, so a busy database never blocks
+the event loop.
+"""
+import asyncio
+import atexit
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from config.settings import (
+    AVAILABILITY_STORE_PATH,
+    AVAILABILITY_STORE_FLUSH_INTERVAL,
+    AVAILABILITY_STORE_BATCH_SIZE,
+    AVAILABILITY_STORE_SWEEP_INTERVAL
+)
+
+AvailabilityRecord = namedtuple("AvailabilityRecord", ["available", "price", "provider", "checked_at"])
+
+# Rows deleted per statement when sweeping expired results
+SWEEP_CHUNK = 5000
+
+# Pairs looked up per SELECT (two bound parameters each)
+LOOKUP_CHUNK = 400
+
+# Seconds a read waits for a locked database before treating its pairs as
+# missing; the writer thread waits much longer (WRITE_BUSY_TIMEOUT)
+READ_BUSY_TIMEOUT = 0.1
+WRITE_BUSY_TIMEOUT = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS availability (
+    name TEXT NOT NULL,
+    tld TEXT NOT NULL,
+    available INTEGER NOT NULL,
+    price REAL NOT NULL,
+    provider TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (name, tld)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS availability_expires_at ON availability (expires_at);
+"""
+
+_store = None
+_store_lock = threading.Lock()
+
+class AvailabilityStore:
+    """SQLite-backed (name, tld) -> AvailabilityRecord store with expiry"""
+    
+    def __init__(self, path, flush_interval=None, batch_size=None, sweep_interval=None):
+        self.path = path
+        self.flush_interval = flush_interval or AVAILABILITY_STORE_FLUSH_INTERVAL
+        self.batch_size = batch_size or AVAILABILITY_STORE_BATCH_SIZE
+        self.sweep_interval = sweep_interval or AVAILABILITY_STORE_SWEEP_INTERVAL
+        
+        self._local = threading.local()
+        self._reader_local = threading.local()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._last_sweep = time.time()
+        
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+        
+        self._writer = threading.Thread(target=self._write_loop, name="availability-store-writer", daemon=True)
+        self._writer.start()
+    
+    def get(self, name, tld):
+        """
+        Look up an unexpired result
+        
+        Returns:
+            AvailabilityRecord: The stored result, or None if missing or expired
+        """
+        return self.get_many([(name, tld)]).get((name, tld))
+    
+    def get_many(self, pairs):
+        """
+        Look up several unexpired results with batched queries
+        
+        Args:
+            pairs (list): List of (name, tld) tuples
+            
+        Returns:
+            dict: Maps each found (name, tld) pair to its AvailabilityRecord
+        """
+        keys = {(name.lower(), tld.lower()): (name, tld) for name, tld in pairs}
+        
+        # Results waiting for the next flush are visible to this process already
+        with self._pending_lock:
+            rows = [self._pending[key] for key in keys if key in self._pending]
+        missing = [key for key in keys if key not in self._pending]
+        
+        try:
+            for start in range(0, len(missing), LOOKUP_CHUNK):
+                chunk = missing[start:start + LOOKUP_CHUNK]
+                rows.extend(self._reader().execute(
+                    "SELECT name, tld, available, price, provider, checked_at, expires_at "
+                    "FROM availability WHERE (name, tld) IN (VALUES " + ", ".join(["(?, ?)"] * len(chunk)) + ")",
+                    [value for key in chunk for value in key]
+                ).fetchall())
+        except sqlite3.OperationalError as e:
+            # Busy or locked: the caller looks the remaining pairs up elsewhere
+            print(f"Error reading availability store: {str(e)}")
+        
+        now = time.time()
+        return {
+            keys[(name, tld)]: AvailabilityRecord(bool(available), price, provider, checked_at)
+            for name, tld, available, price, provider, checked_at, expires_at in rows
+            if expires_at > now
+        }
+    
+    async def get_many_async(self, pairs):
+        """
+        Look up several results without blocking the event loop
+        
+        Returns:
+            dict: Maps each found (name, tld) pair to its AvailabilityRecord
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_many, pairs)
+    
+    def put(self, name, tld, available, price, provider, ttl):
+        """
+        Queue a result for the next batched write
+        
+        Args:
+            name (str): Domain name without TLD
+            tld (str): TLD
+            available (bool): Whether the domain is available
+            price (float): Registration price
+            provider (str): Provider that answered
+            ttl (float): Seconds the result stays valid
+        """
+        now = time.time()
+        key = (name.lower(), tld.lower())
+        with self._pending_lock:
+            self._pending[key] = key + (int(bool(available)), float(price or 0), provider, now, now + ttl)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+    
+    def flush(self):
+        """Write every queued result now"""
+        with self._pending_lock:
+            pending = dict(self._pending)
+        if not pending:
+            return
+        rows = list(pending.values())
+        
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT INTO availability (name, tld, available, price, provider, checked_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (name, tld) DO UPDATE SET available = excluded.available, price = excluded.price, "
+                "provider = excluded.provider, checked_at = excluded.checked_at, expires_at = excluded.expires_at "
+                "WHERE excluded.checked_at >= availability.checked_at",
+                rows
+            )
+        
+        # Keep rows readable from memory until they are committed (unless re-queued since)
+        with self._pending_lock:
+            for key, row in pending.items():
+                if self._pending.get(key) is row:
+                    del self._pending[key]
+    
+    def sweep_expired(self):
+        """
+        Delete expired rows in small chunks so readers are never blocked for long
+        
+        Returns:
+            int: Number of rows deleted
+        """
+        connection = self._connection()
+        deleted = 0
+        while True:
+            with connection:
+                cursor = connection.execute(
+                    "DELETE FROM availability WHERE (name, tld) IN "
+                    "(SELECT name, tld FROM availability WHERE expires_at <= ? LIMIT ?)",
+                    (time.time(), SWEEP_CHUNK)
+                )
+            deleted += cursor.rowcount
+            if cursor.rowcount < SWEEP_CHUNK:
+                return deleted
+    
+    def iter_history(self, batch_size=10000):
+        """
+        Every stored result, including expired rows not yet swept
+        
+        Args:
+            batch_size (int): Rows fetched per round trip
+            
+        Yields:
+            tuple: (name, tld, available, provider, checked_at)
+        """
+        self.flush()
+        cursor = self._connection().execute("SELECT name, tld, available, provider, checked_at FROM availability")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for name, tld, available, provider, checked_at in rows:
+                yield name, tld, bool(available), provider, checked_at
+    
+    def count(self):
+        """Number of stored rows (including expired rows not yet swept)"""
+        return self._connection().execute("SELECT COUNT(*) FROM availability").fetchone()[0]
+    
+    def close(self):
+        """Flush queued results and stop the writer thread"""
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=5)
+        self.flush()
+    
+    def _connection(self):
+        """One connection per thread (sqlite3 connections can't be shared)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=WRITE_BUSY_TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+    
+    def _reader(self):
+        """Per-thread connection for lookups, which give up quickly on a locked database"""
+        connection = getattr(self._reader_local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=READ_BUSY_TIMEOUT)
+            self._reader_local.connection = connection
+        return connection
+    
+    def _write_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+                if time.time() - self._last_sweep >= self.sweep_interval:
+                    self._last_sweep = time.time()
+                    self.sweep_expired()
+            except sqlite3.Error as e:
+                print(f"Error writing availability store: {str(e)}")
+
+def get_availability_store():
+    """
+    Get the process-wide store configured by AVAILABILITY_STORE_PATH
+    
+    Returns:
+        AvailabilityStore: The shared store, or None if it is disabled
+    """
+    global _store
+    
+    if not AVAILABILITY_STORE_PATH:
+        return None
+    
+    with _store_lock:
+        if _store is None:
+            _store = AvailabilityStore(AVAILABILITY_STORE_PATH)
+            atexit.register(_store.close)
+    return _store
@@ -0,0 +1,143 @@
+"""
+Micro-batching of small requests from many callers.
+
+Callers anywhere in the process submit single items; items arriving within
+a short window (or until the batch is full) are handed to one batch
+handler call and each caller gets its own result back. Batches are
+dispatched on the service event loop, so callers on any thread or loop
+share them.
+"""
+import asyncio
+import concurrent.futures
+import threading
+
+from services.single_flight import follow_future
+from services.utils import get_service_loop
+
+# Every batcher created, for get_batcher_stats()
+_batchers = []
+_batchers_lock = threading.Lock()
+
+class MicroBatcher:
+    """Collects items for a window and processes them with one handler call"""
+    
+    def __init__(self, name, handler, window, max_size):
+        """
+        Args:
+            name (str): Name reported by get_batcher_stats()
+            handler (callable): Coroutine function taking a list of unique items
+                and returning a dict of results; items left out resolve to None
+            window (float): Seconds to wait for more items after the first
+            max_size (int): Batch size that is dispatched without waiting
+        """
+        self.name = name
+        self.handler = handler
+        self.window = max(0.0, window)
+        self.max_size = max(1, max_size)
+        
+        self._batch = None
+        self._tasks = set()
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "items": 0, "batches": 0, "errors": 0, "largest_batch": 0}
+        with _batchers_lock:
+            _batchers.append(self)
+    
+    async def submit(self, item):
+        """
+        Queue an item for the next batch and wait for its result
+        
+        Cancelling the caller only stops it waiting; the item is still sent.
+        
+        Args:
+            item: Hashable item (identical items in a batch are sent once)
+        
+        Returns:
+            The handler's result for the item, or None if it was left out
+            (a failing handler's exception is raised in every caller)
+        """
+        return await follow_future(self._enqueue(item))
+    
+    async def submit_many(self, items):
+        """
+        Queue several items and wait for all of their results
+        
+        Returns:
+            dict: Maps each item to its result (None if it was left out)
+        """
+        items = list(dict.fromkeys(items))
+        futures = [self._enqueue(item) for item in items]
+        results = await asyncio.gather(*(follow_future(future) for future in futures))
+        return dict(zip(items, results))
+    
+    def stats(self):
+        """Counters: requests submitted, unique items sent, batches, handler errors and the largest batch"""
+        with self._lock:
+            return dict(self._stats)
+    
+    def _enqueue(self, item):
+        loop = get_service_loop()
+        with self._lock:
+            self._stats["requests"] += 1
+            batch = self._batch
+            opened = batch is None
+            if opened:
+                batch = self._batch = {}
+            future = batch.get(item)
+            if future is None:
+                future = batch[item] = concurrent.futures.Future()
+            full = len(batch) >= self.max_size
+            if full:
+                self._batch = None
+        
+        if full:
+            loop.call_soon_threadsafe(self._dispatch, batch)
+        elif opened:
+            loop.call_soon_threadsafe(self._arm, batch)
+        return future
+    
+    def _arm(self, batch):
+        """Flush the batch once the window has passed (runs on the service loop)"""
+        asyncio.get_running_loop().call_later(self.window, self._flush, batch)
+    
+    def _flush(self, batch):
+        with self._lock:
+            if self._batch is not batch:
+                return  # Already dispatched because it filled up
+            self._batch = None
+        self._dispatch(batch)
+    
+    def _dispatch(self, batch):
+        task = asyncio.get_running_loop().create_task(self._process(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _process(self, batch):
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["items"] += len(batch)
+            self._stats["largest_batch"] = max(self._stats["largest_batch"], len(batch))
+        
+        try:
+            results = await self.handler(list(batch))
+        except BaseException as e:
+            with self._lock:
+                self._stats["errors"] += 1
+            for future in batch.values():
+                future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        
+        for item, future in batch.items():
+            future.set_result(results.get(item))
+
+def get_batcher_stats():
+    """
+    Get the counters of every batcher
+    
+    Returns:
+        dict: Maps batcher name to its counters
+    """
+    with _batchers_lock:
+        batchers = list(_batchers)
+    return {batcher.name: batcher.stats() for batcher in batchers}
@@ -0,0 +1,315 @@
+"""
+Bulk availability checks for large name lists.
+
+Names are streamed from a file (or stdin) in chunks, and a bounded number
+of chunks is checked at a time through check_domain_pairs_async(), so the
+cache, availability store, zone filters, DNS prefilter and GoDaddy bulk
+requests all apply. Results are written in input order as JSONL or CSV.
+Memory use depends on the chunk size and worker count, not the input size.
+
+Every few seconds a checkpoint records how far the input and output have
+got. A crashed or interrupted run started again with the same
+arguments resumes from its checkpoint.
+
+Check a list:
+    python -m services.bulk_checker names.txt results.jsonl --tlds com io
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from config.settings import DEFAULT_TLDS
+from services.domain_service import check_domain_pairs_async
+from services.utils import clean_domain_name, iterate_sync, validate_domain_name
+
+CSV_FIELDS = ["name", "tld", "full_domain", "available", "price"]
+
+async def iter_bulk_availability_async(chunks, tlds, workers=4):
+    """
+    Check chunks of names across TLDs with a bounded number in flight
+    
+    Args:
+        chunks: Iterable of (names, marker) tuples; it is read in a thread,
+            so it may block (e.g. on stdin)
+        tlds (list): TLDs to check each name against
+        workers (int): Most chunks checked at once
+    
+    Yields:
+        tuple: (marker, results) per chunk, in input order; results are
+            availability dicts for each name and TLD
+    """
+    loop = asyncio.get_running_loop()
+    chunks = iter(chunks)
+    pending = deque()
+    
+    async def check(names):
+        return await check_domain_pairs_async([(name, tld) for name in names for tld in tlds])
+    
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                break
+            names, marker = chunk
+            pending.append((marker, asyncio.ensure_future(check(names))))
+            if len(pending) >= max(1, workers):
+                marker, task = pending.popleft()
+                yield marker, await task
+        while pending:
+            marker, task = pending.popleft()
+            yield marker, await task
+    finally:
+        # The consumer may stop early; don't leave lookups running
+        for _, task in pending:
+            task.cancel()
+
+def iter_bulk_availability(chunks, tlds, workers=4):
+    """
+    Check chunks of names across TLDs (synchronous wrapper)
+    
+    Yields:
+        tuple: (marker, results) per chunk, in input order
+    """
+    return iterate_sync(iter_bulk_availability_async(chunks, tlds, workers))
+
+def read_chunks(stream, chunk_size, offset=0):
+    """
+    Read valid domain names from a binary stream in chunks
+    
+    Blank lines and "#" comments are ignored, a TLD on a name is dropped and
+    invalid names are skipped.
+    
+    Args:
+        stream: Binary stream of one name per line
+        chunk_size (int): Names per chunk
+        offset (int): Bytes of the stream already read
+    
+    Yields:
+        tuple: (names, (offset, skipped)) where offset is the stream position
+            after the chunk and skipped counts its invalid names
+    """
+    names = []
+    skipped = 0
+    for raw in stream:
+        offset += len(raw)
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line or line.startswith("#"):
+            continue
+        
+        name = clean_domain_name(line.split()[0].split(",")[0].split(".")[0])
+        if len(name) < 3 or not validate_domain_name(name):
+            skipped += 1
+            continue
+        
+        names.append(name)
+        if len(names) >= chunk_size:
+            yield names, (offset, skipped)
+            names = []
+            skipped = 0
+    if names or skipped:
+        yield names, (offset, skipped)
+
+def load_checkpoint(path, job):
+    """
+    Load a run's checkpoint
+    
+    Args:
+        path (str): Checkpoint file
+        job (dict): Settings of the current run; they must match the checkpoint's
+    
+    Returns:
+        dict: The checkpoint, or None if there is none
+    
+    Raises:
+        ValueError: If the checkpoint belongs to a run with other settings
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return None
+    if checkpoint.get("job") != job:
+        raise ValueError(f"Checkpoint {path} is from a run with other input, TLDs or format")
+    return checkpoint
+
+def save_checkpoint(path, checkpoint):
+    """Write a checkpoint atomically, so a crash leaves the old one or the new one"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def format_results(results, output_format):
+    """
+    Format availability results as JSONL or CSV rows
+    
+    Returns:
+        str: The formatted rows
+    """
+    if output_format == "jsonl":
+        return "".join(json.dumps(result) + "\n" for result in results)
+    rows = io.StringIO()
+    writer = csv.DictWriter(rows, fieldnames=CSV_FIELDS, lineterminator="\n")
+    writer.writerows(results)
+    return rows.getvalue()
+
+class Progress:
+    """Live throughput and ETA readout on stderr"""
+    
+    def __init__(self, total_bytes=None, start_bytes=0, interval=1.0):
+        """
+        Args:
+            total_bytes (int): Input size, if known, for the percentage and ETA
+            start_bytes (int): Input already read by an earlier run
+            interval (float): Seconds between readouts
+        """
+        self.total_bytes = total_bytes
+        self.start_bytes = start_bytes
+        self.interval = interval
+        self.started = time.time()
+        self.last_shown = 0
+        self.names = self.domains = self.available = self.skipped = 0
+    
+    def update(self, position, names, domains, available, skipped, final=False):
+        self.names += names
+        self.domains += domains
+        self.available += available
+        self.skipped += skipped
+        
+        now = time.time()
+        if not final and now - self.last_shown < self.interval:
+            return
+        self.last_shown = now
+        
+        elapsed = max(now - self.started, 1e-9)
+        status = (f"{self.names:,} names, {self.domains:,} domains, {self.available:,} available,"
+                  f" {self.skipped:,} skipped"
+                  f" | {self.domains / elapsed:,.0f} domains/s")
+        if self.total_bytes:
+            done = position / self.total_bytes
+            status += f" | {done:.1%}"
+            # Rate over this run only, so a resumed run's estimate is right
+            rate = (position - self.start_bytes) / elapsed
+            if not final and rate > 0:
+                status += f" | ETA {_format_duration((self.total_bytes - position) / rate)}"
+        sys.stderr.write(f"\r{status}\033[K")
+        if final:
+            sys.stderr.write("\n")
+        sys.stderr.flush()
+
+def _checkpoint(output, path, state):
+    """Make the output durable up to the state's output_bytes, then save the checkpoint"""
+    output.flush()
+    os.fsync(output.fileno())
+    save_checkpoint(path, state)
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check availability of a large list of names")
+    parser.add_argument("input", help="File of names, one per line ('-' for stdin)")
+    parser.add_argument("output", help="Results file (.jsonl or .csv)")
+    parser.add_argument("--tlds", nargs="+", default=DEFAULT_TLDS,
+                        help=f"TLDs to check (default {' '.join(DEFAULT_TLDS)})")
+    parser.add_argument("--format", choices=["jsonl", "csv"],
+                        help="Output format (default from the output extension, else jsonl)")
+    parser.add_argument("--chunk-size", type=int, default=100, help="Names per chunk (default 100)")
+    parser.add_argument("--workers", type=int, default=4, help="Chunks checked at once (default 4)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default OUTPUT.checkpoint)")
+    parser.add_argument("--checkpoint-interval", type=float, default=10.0,
+                        help="Seconds between checkpoints (default 10)")
+    parser.add_argument("--restart", action="store_true", help="Ignore any checkpoint and start over")
+    args = parser.parse_args(argv)
+    
+    tlds = list(dict.fromkeys(tld.strip(".").lower() for tld in args.tlds))
+    output_format = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint"
+    job = {"input": os.path.abspath(args.input) if args.input != "-" else "-", "tlds": tlds, "format": output_format}
+    
+    checkpoint = None
+    if not args.restart:
+        try:
+            checkpoint = load_checkpoint(checkpoint_path, job)
+        except ValueError as e:
+            parser.error(f"{str(e)}; use --restart to start over")
+    
+    if args.input == "-":
+        stream = sys.stdin.buffer
+        total_bytes = None
+    else:
+        stream = open(args.input, "rb")
+        total_bytes = os.path.getsize(args.input) or None
+    
+    offset = 0
+    if checkpoint:
+        offset = checkpoint["input_bytes"]
+        if stream.seekable():
+            stream.seek(offset)
+        else:
+            # stdin: skip what the last run already read
+            skipped_bytes = 0
+            while skipped_bytes < offset:
+                line = stream.readline()
+                if not line:
+                    break
+                skipped_bytes += len(line)
+        print(f"Resuming from checkpoint after {checkpoint['names']:,} names", file=sys.stderr)
+    
+    # Drop anything written after the last checkpoint; it is checked again
+    output = open(args.output, "r+b" if checkpoint else "wb")
+    if checkpoint:
+        output.truncate(checkpoint["output_bytes"])
+        output.seek(checkpoint["output_bytes"])
+    elif output_format == "csv":
+        output.write((",".join(CSV_FIELDS) + "\n").encode("utf-8"))
+    
+    state = checkpoint or {"job": job, "input_bytes": 0, "output_bytes": 0, "names": 0, "available": 0}
+    progress = Progress(total_bytes, offset)
+    last_checkpoint = time.time()
+    
+    try:
+        for (position, skipped), results in iter_bulk_availability(
+                read_chunks(stream, max(1, args.chunk_size), offset), tlds, args.workers):
+            output.write(format_results(results, output_format).encode("utf-8"))
+            names = len(results) // len(tlds)
+            available = sum(1 for result in results if result["available"])
+            state.update(input_bytes=position, output_bytes=output.tell(),
+                         names=state["names"] + names, available=state["available"] + available)
+            progress.update(position, names, len(results), available, skipped)
+            
+            if time.time() - last_checkpoint >= args.checkpoint_interval:
+                _checkpoint(output, checkpoint_path, state)
+                last_checkpoint = time.time()
+    except KeyboardInterrupt:
+        _checkpoint(output, checkpoint_path, state)
+        print("\nInterrupted; run the same command again to resume", file=sys.stderr)
+        sys.exit(130)
+    except Exception as e:
+        # Keep the chunks finished so far
+        _checkpoint(output, checkpoint_path, state)
+        print(f"\nError checking names: {str(e)}; run the same command again to resume", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        output.close()
+        if stream is not sys.stdin.buffer:
+            stream.close()
+    
+    progress.update(state["input_bytes"], 0, 0, 0, 0, final=True)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f"Checked {state['names']:,} names ({state['available']:,} available domains); results in {args.output}",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Bounded TTL + LRU cache engine used by utils.cached.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from config.settings import CACHE_MAX_ENTRIES, CACHE_MAX_BYTES
+
+# How many writes happen between sweeps for expired entries
+SWEEP_INTERVAL = 1000
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry expiration and a stale window
+    
+    Entries are evicted least-recently-used first once either the entry count
+    or the approximate memory footprint exceeds its bound. An expired entry
+    can still be served as "stale" until its stale window ends.
+    """
+    
+    def __init__(self, name, max_entries=None, max_bytes=None):
+        self.name = name
+        self.max_entries = max_entries or CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or CACHE_MAX_BYTES
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._writes = 0
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+    
+    def get(self, key):
+        """
+        Look up a key
+        
+        Returns:
+            tuple: (state, value) where state is "fresh", "stale" or None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, stale_until, size = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return "fresh", value
+                if now < stale_until:
+                    self._entries.move_to_end(key)
+                    self._stats["stale_hits"] += 1
+                    return "stale", value
+                self._remove(key)
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None, None
+    
+    def set(self, key, value, ttl, stale_ttl=0):
+        """
+        Store a value
+        
+        Args:
+            key: Hashable cache key
+            value: Value to store
+            ttl (float): Seconds the value is fresh
+            stale_ttl (float): Extra seconds the value may be served stale
+        """
+        size = _approximate_size(key) + _approximate_size(value)
+        if size > self.max_bytes:
+            return
+        
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, now + ttl, now + ttl + stale_ttl, size)
+            self._bytes += size
+            
+            # Evict least recently used entries until both bounds hold
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+            
+            self._writes += 1
+            if self._writes % SWEEP_INTERVAL == 0:
+                self._sweep(now)
+    
+    def delete(self, key):
+        """Remove a key if present"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+    
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self):
+        """
+        Get cache counters
+        
+        Returns:
+            dict: hits, stale_hits, misses, evictions, expirations, entries and bytes
+        """
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[3]
+    
+    def _sweep(self, now):
+        """Drop entries whose stale window has passed"""
+        expired = [key for key, entry in self._entries.items() if entry[2] <= now]
+        for key in expired:
+            self._remove(key)
+        self._stats["expirations"] += len(expired)
+
+def _approximate_size(obj):
+    """Estimate the memory footprint of a cached key or value"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_approximate_size(k) + _approximate_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_approximate_size(item) for item in obj)
+    return size
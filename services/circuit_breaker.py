@@ -0,0 +1,174 @@
+"""
+Per-provider circuit breakers.
+
+A breaker watches the outcome and latency of a provider's recent calls.
+When too many fail or are too slow it opens and callers skip the provider
+immediately. After a cool-down it lets a few probe calls through
+(half-open) and closes again once a probe succeeds.
+"""
+import threading
+import time
+from collections import deque
+
+from config.settings import (
+    CIRCUIT_WINDOW,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_SLOW_CALL_SECONDS,
+    CIRCUIT_SLOW_CALL_RATE,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_HALF_OPEN_PROBES
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open breaker over a sliding window of calls"""
+    
+    def __init__(self, name, window=None, min_calls=None, failure_rate=None, slow_call_seconds=None,
+                 slow_call_rate=None, open_seconds=None, half_open_probes=None):
+        self.name = name
+        self.min_calls = min_calls or CIRCUIT_MIN_CALLS
+        self.failure_rate = failure_rate or CIRCUIT_FAILURE_RATE
+        self.slow_call_seconds = slow_call_seconds or CIRCUIT_SLOW_CALL_SECONDS
+        self.slow_call_rate = slow_call_rate or CIRCUIT_SLOW_CALL_RATE
+        self.open_seconds = open_seconds or CIRCUIT_OPEN_SECONDS
+        self.half_open_probes = half_open_probes or CIRCUIT_HALF_OPEN_PROBES
+        
+        self._calls = deque(maxlen=window or CIRCUIT_WINDOW)  # (failed, slow) per call
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+    
+    @property
+    def state(self):
+        """Current state ("closed", "open" or "half_open")"""
+        with self._lock:
+            return self._current_state()
+    
+    def allow_request(self):
+        """
+        Check whether a call may go to the provider now
+        
+        Every allowed call must be followed by record_success(),
+        record_failure() or release().
+        
+        Returns:
+            bool: True if the call may proceed
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            self._stats["rejected"] += 1
+            return False
+    
+    def record_success(self, duration):
+        """Record a successful call that took duration seconds"""
+        self._record(False, duration)
+    
+    def record_failure(self, duration):
+        """Record a failed call that took duration seconds"""
+        self._record(True, duration)
+    
+    def release(self):
+        """Give back an allowed call that never completed (e.g. it was cancelled)"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+    
+    def snapshot(self):
+        """
+        Get the breaker's state and counters
+        
+        Returns:
+            dict: state, failure_rate and slow_call_rate over the window, and counters
+        """
+        with self._lock:
+            state = self._current_state()
+            failure_rate, slow_rate = self._rates()
+            return dict(self._stats, state=state, failure_rate=failure_rate, slow_call_rate=slow_rate)
+    
+    def _current_state(self):
+        # An open breaker becomes half-open once its cool-down has passed
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+    
+    def _rates(self):
+        if not self._calls:
+            return 0.0, 0.0
+        failures = sum(1 for failed, _ in self._calls if failed)
+        slow = sum(1 for _, is_slow in self._calls if is_slow)
+        return failures / len(self._calls), slow / len(self._calls)
+    
+    def _record(self, failed, duration):
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            self._stats["calls"] += 1
+            if failed:
+                self._stats["failures"] += 1
+            
+            state = self._current_state()
+            if state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                if failed or slow:
+                    self._open()
+                else:
+                    self._state = CLOSED
+                    self._calls.clear()
+                return
+            if state == OPEN:
+                return  # Late result from a call started before the breaker opened
+            
+            self._calls.append((failed, slow))
+            if len(self._calls) >= self.min_calls:
+                failure_rate, slow_rate = self._rates()
+                if failure_rate >= self.failure_rate or slow_rate >= self.slow_call_rate:
+                    self._open()
+    
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._probes = 0
+        self._calls.clear()
+        self._stats["opened"] += 1
+        print(f"Circuit breaker for {self.name} opened")
+
+def get_breaker(provider):
+    """
+    Get the circuit breaker for a provider
+    
+    Args:
+        provider (str): Provider name
+        
+    Returns:
+        CircuitBreaker: The provider's breaker (created on first use)
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = _breakers[provider] = CircuitBreaker(provider)
+    return breaker
+
+def get_breaker_states():
+    """
+    Get a snapshot of every breaker in use
+    
+    Returns:
+        dict: Maps provider name to CircuitBreaker.snapshot()
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -1,8 +1,7 @@
 """
 Configuration checker to validate application settings on startup
 """
-import os
-import requests
+from functools import lru_cache
 
 def check_azure_openai_config():
     """Check if Azure OpenAI configuration is valid"""
@@ -41,8 +40,9 @@ def check_godaddy_config():
         print("ℹ️ GoDaddy API credentials not found")
         return False
 
+@lru_cache(maxsize=None)
 def check_config():
-    """Run all configuration checks"""
+    """Run all configuration checks (once per process; later calls return the first result)"""
     from config.settings import DEMO_MODE
     
     print("\n=== Domain Finder Configuration Check ===\n")
@@ -0,0 +1,170 @@
+"""
+DNS pre-filter for availability checks.
+
+A registered domain is delegated to name servers, so an NS query for it
+returns answers. Those names can be marked taken without spending a paid
+GoDaddy/WHOIS call. NXDOMAIN and inconclusive answers still go to the
+providers, because a name can be registered without being delegated.
+"""
+import asyncio
+import random
+import struct
+import threading
+import weakref
+
+from config.settings import DNS_RESOLVER, DNS_TIMEOUT, DNS_RETRIES, DNS_CONCURRENCY
+
+REGISTERED = "registered"
+NXDOMAIN = "nxdomain"
+UNKNOWN = "unknown"
+
+# DNS wire-format constants
+QTYPE_NS = 2
+QCLASS_IN = 1
+RCODE_NXDOMAIN = 3
+
+_stats_lock = threading.Lock()
+_stats = {"queries": 0, "registered": 0, "nxdomain": 0, "unknown": 0, "errors": 0}
+_semaphores = weakref.WeakKeyDictionary()
+
+class _DnsProtocol(asyncio.DatagramProtocol):
+    """Waits for the reply matching one query ID"""
+    
+    def __init__(self, query_id):
+        self.query_id = query_id
+        self.reply = asyncio.get_running_loop().create_future()
+    
+    def datagram_received(self, data, addr):
+        if len(data) >= 12 and struct.unpack("!H", data[:2])[0] == self.query_id and not self.reply.done():
+            self.reply.set_result(data)
+    
+    def error_received(self, exc):
+        if not self.reply.done():
+            self.reply.set_exception(exc)
+    
+    def connection_lost(self, exc):
+        if not self.reply.done():
+            self.reply.set_exception(exc or ConnectionError("DNS socket closed"))
+
+async def lookup_status(domain, resolver=None, timeout=None):
+    """
+    Classify a domain by querying its NS records
+    
+    Args:
+        domain (str): Full domain name (e.g. "example.com")
+        resolver (tuple): Optional (host, port) to query instead of DNS_RESOLVER
+        timeout (float): Seconds to wait per attempt (defaults to DNS_TIMEOUT)
+    
+    Returns:
+        str: REGISTERED if the name is delegated, NXDOMAIN if it doesn't exist,
+             UNKNOWN if the answer was empty, an error or a timeout
+    """
+    host, port = resolver or _default_resolver()
+    
+    async with _semaphore():
+        status = UNKNOWN
+        for _ in range(DNS_RETRIES + 1):
+            try:
+                reply = await _query(domain, host, port, timeout or DNS_TIMEOUT)
+            except (OSError, asyncio.TimeoutError):
+                _record("errors")
+                continue
+            except ValueError:
+                # Names that can't be encoded as a query (e.g. a label over 63
+                # characters; UnicodeError is a ValueError) won't do better on a retry
+                _record("errors")
+                break
+            status = _classify(reply)
+            break
+    
+    _record("queries")
+    _record(status)
+    return status
+
+async def find_registered(pairs, resolver=None):
+    """
+    Run NS lookups for many (name, TLD) pairs concurrently
+    
+    Args:
+        pairs (list): List of (domain_name, tld) tuples
+        resolver (tuple): Optional (host, port) to query instead of DNS_RESOLVER
+    
+    Returns:
+        set: The pairs whose names clearly resolve (and are therefore taken)
+    """
+    pairs = list(dict.fromkeys(pairs))
+    statuses = await asyncio.gather(*(lookup_status(f"{name}.{tld}", resolver) for name, tld in pairs))
+    return {pair for pair, status in zip(pairs, statuses) if status == REGISTERED}
+
+def get_dns_stats():
+    """
+    Get pre-filter counters
+    
+    Returns:
+        dict: queries, registered, nxdomain, unknown and errors counts, plus
+              api_calls_saved (lookups answered without a provider call)
+    """
+    with _stats_lock:
+        return dict(_stats, api_calls_saved=_stats["registered"])
+
+def build_query(domain, query_id, qtype=QTYPE_NS):
+    """Build a recursive DNS query packet for one question"""
+    header = struct.pack("!6H", query_id, 0x0100, 1, 0, 0, 0)  # RD flag, one question
+    qname = b"".join(bytes([len(label)]) + label for label in (part.encode("idna") for part in domain.strip(".").split(".")))
+    return header + qname + b"\x00" + struct.pack("!2H", qtype, QCLASS_IN)
+
+def _classify(reply):
+    _, flags, _, answers, _, _ = struct.unpack("!6H", reply[:12])
+    rcode = flags & 0x000F
+    if rcode == RCODE_NXDOMAIN:
+        return NXDOMAIN
+    if rcode == 0 and answers > 0:
+        return REGISTERED
+    return UNKNOWN
+
+async def _query(domain, host, port, timeout):
+    loop = asyncio.get_running_loop()
+    query_id = random.getrandbits(16)
+    query = build_query(domain, query_id)
+    transport, protocol = await loop.create_datagram_endpoint(lambda: _DnsProtocol(query_id), remote_addr=(host, port))
+    try:
+        transport.sendto(query)
+        return await asyncio.wait_for(protocol.reply, timeout)
+    finally:
+        transport.close()
+
+def _semaphore():
+    """Concurrency cap for DNS queries on the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(max(1, DNS_CONCURRENCY))
+    return semaphore
+
+def _default_resolver():
+    """Resolver from DNS_RESOLVER, else the first system name server"""
+    if DNS_RESOLVER:
+        return _parse_resolver(DNS_RESOLVER)
+    try:
+        with open("/etc/resolv.conf") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == "nameserver":
+                    return parts[1], 53
+    except OSError:
+        pass
+    return "8.8.8.8", 53
+
+def _parse_resolver(value):
+    """Parse "host", "host:port" or "[ipv6]:port" """
+    if value.startswith("["):
+        host, _, port = value[1:].partition("]:")
+        return host.rstrip("]"), int(port or 53)
+    if value.count(":") == 1:
+        host, port = value.split(":")
+        return host, int(port)
+    return value, 53
+
+def _record(counter):
+    with _stats_lock:
+        _stats[counter] += 1
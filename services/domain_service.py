@@ -1,49 +1,276 @@
 """
 Service for checking domain availability.
 """
-import requests
+import asyncio
+import contextlib
 import time
-import random
-from config.settings import WHOIS_API_KEY, GODADDY_API_KEY, GODADDY_API_SECRET, DEMO_MODE, GODADDY_API_URL
+import weakref
+from collections import deque
+from functools import lru_cache, partial
+from config.settings import (
+    WHOIS_API_KEY,
+    GODADDY_API_KEY,
+    GODADDY_API_SECRET,
+    DEMO_MODE,
+    GODADDY_API_ENV,
+    GODADDY_API_URL,
+    GODADDY_BULK_LIMIT,
+    LOOKUP_BATCH_WINDOW_MS,
+    LOOKUP_BATCH_MAX_SIZE,
+    MAX_CONCURRENT_LOOKUPS,
+    PROVIDER_CONCURRENCY,
+    CACHE_TTL_AVAILABLE,
+    CACHE_TTL_TAKEN,
+    CACHE_STALE_TTL,
+    HEDGE_REQUESTS,
+    HEDGE_DELAY,
+    HEDGE_PERCENTILE,
+    HEDGE_MIN_DELAY,
+    HEDGE_DEFAULT_DELAY,
+    DNS_PREFILTER
+)
+from services.availability_store import get_availability_store
+from services.batcher import MicroBatcher
+from services.circuit_breaker import get_breaker
+from services.dns_prefilter import REGISTERED, find_registered, lookup_status
+from services.registered_filter import get_registered_filters, is_probably_registered
+from services.http_client import request_async
+from services.mock_engine import check_mock, check_mock_batch
+from services.rate_limiter import throttle_async
+from services.utils import cached, iterate_sync, run_sync
 
-def check_domain_availability(domain_name, tlds):
+# Rate-limit bucket per provider (OTE and PROD have separate GoDaddy quotas)
+_RATE_LIMIT_KEYS = {
+    "godaddy": f"godaddy_{GODADDY_API_ENV.lower()}",
+    "whois": "whois"
+}
+
+# Recent successful call latencies per provider, for adaptive hedge delays
+_latencies = {}
+
+# Samples needed before the hedge delay follows the observed latency
+MIN_LATENCY_SAMPLES = 20
+
+class CircuitOpenError(Exception):
+    """Raised when a provider is skipped because its circuit breaker is open"""
+
+class NoProviderAnswerError(Exception):
+    """Raised when no availability provider could answer a lookup"""
+
+# Per-provider caps on in-flight requests, one set per event loop
+_provider_slots = weakref.WeakKeyDictionary()
+
+def check_domain_availability(domain_name, tlds, max_workers=None):
     """
     Check if a domain is available across multiple TLDs
     
+    Synchronous wrapper around check_domain_availability_async().
+    
     Args:
         domain_name (str): The domain name without TLD
         tlds (list): List of TLDs to check
-        
+        max_workers (int): Maximum parallel lookups (defaults to MAX_CONCURRENT_LOOKUPS)
+    
+    Returns:
+        list: List of dictionaries with availability information, in TLD order
+    """
+    return run_sync(check_domain_availability_async(domain_name, tlds, max_workers))
+
+def check_domain_pairs(pairs, max_workers=None):
+    """
+    Check availability for a list of (name, TLD) pairs in parallel
+    
+    Synchronous wrapper around check_domain_pairs_async().
+    
+    Args:
+        pairs (list): List of (domain_name, tld) tuples
+        max_workers (int): Maximum parallel lookups (defaults to MAX_CONCURRENT_LOOKUPS)
+    
+    Returns:
+        list: List of dictionaries with availability information, in input order
+    """
+    return run_sync(check_domain_pairs_async(pairs, max_workers))
+
+def iter_domain_availability(domain_name, tlds, max_workers=None):
+    """
+    Yield availability results for each TLD as soon as it is known
+    
+    Synchronous wrapper around iter_domain_availability_async().
+    
+    Args:
+        domain_name (str): The domain name without TLD
+        tlds (list): List of TLDs to check
+        max_workers (int): Maximum parallel lookups (defaults to MAX_CONCURRENT_LOOKUPS)
+    
+    Yields:
+        dict: Availability information, in completion order
+    """
+    return iterate_sync(iter_domain_availability_async(domain_name, tlds, max_workers))
+
+async def iter_domain_availability_async(domain_name, tlds, max_workers=None):
+    """
+    Yield availability results for each TLD as soon as it is known
+    
+    Args:
+        domain_name (str): The domain name without TLD
+        tlds (list): List of TLDs to check
+        max_workers (int): Maximum parallel lookups (defaults to MAX_CONCURRENT_LOOKUPS)
+    
+    Yields:
+        dict: Availability information, in completion order
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers or MAX_CONCURRENT_LOOKUPS))
+    
+    async def check(tld):
+        async with semaphore:
+            return (await check_domain_pairs_async([(domain_name, tld)]))[0]
+    
+    tasks = [asyncio.ensure_future(check(tld)) for tld in dict.fromkeys(tlds)]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        # The consumer may stop early; don't leave lookups running
+        for task in tasks:
+            task.cancel()
+
+async def check_domain_availability_async(domain_name, tlds, max_workers=None):
+    """
+    Check if a domain is available across multiple TLDs
+    
+    Args:
+        domain_name (str): The domain name without TLD
+        tlds (list): List of TLDs to check
+        max_workers (int): Maximum parallel lookups (defaults to MAX_CONCURRENT_LOOKUPS)
+    
     Returns:
-        list: List of dictionaries with availability information
+        list: List of dictionaries with availability information, in TLD order
     """
-    results = []
+    return await check_domain_pairs_async([(domain_name, tld) for tld in tlds], max_workers)
+
+async def check_domain_pairs_async(pairs, max_workers=None):
+    """
+    Check availability for a list of (name, TLD) pairs concurrently
+    
+    Args:
+        pairs (list): List of (domain_name, tld) tuples
+        max_workers (int): Maximum parallel lookups (defaults to MAX_CONCURRENT_LOOKUPS)
+    
+    Returns:
+        list: List of dictionaries with availability information, in input order
+    """
+    if not pairs:
+        return []
+    
+    availability = {}
+    exclude = ()
     
-    for tld in tlds:
-        # Create full domain name
-        full_domain = f"{domain_name}.{tld}"
+    # Mock results are cheaper to compute in one batch than to cache
+    if DEMO_MODE:
+        unique_pairs = list(dict.fromkeys(pairs))
+        availability = dict(zip(unique_pairs, check_mock_batch(unique_pairs)))
+    
+    if not DEMO_MODE and len(pairs) > 1:
+        uncached = []
+        for pair in dict.fromkeys(pairs):
+            state, value = _lookup_availability.cache_lookup(*pair)
+            if state == "fresh":
+                availability[pair] = value
+            else:
+                uncached.append(pair)
         
-        # Check availability
-        available, price = _check_availability(domain_name, tld)
+        # Results other worker processes already stored
+        store = get_availability_store()
+        if store is not None and uncached:
+            for pair, record in (await store.get_many_async(uncached)).items():
+                availability[pair] = (record.available, record.price)
+                _lookup_availability.cache_store(availability[pair], *pair)
+            uncached = [pair for pair in uncached if pair not in availability]
         
-        # Add to results
-        results.append({
-            "name": domain_name,
-            "tld": tld,
-            "full_domain": full_domain,
-            "available": available,
-            "price": price
-        })
+        # Names in the offline zone filters are taken; no network call needed
+        if get_registered_filters() and uncached:
+            for pair in uncached:
+                if is_probably_registered(*pair):
+                    availability[pair] = (False, 0)
+                    _lookup_availability.cache_store(availability[pair], *pair)
+            uncached = [pair for pair in uncached if pair not in availability]
+            exclude += ("zone",)
         
-        # Small delay to avoid rate limiting
-        time.sleep(0.1)
+        # Names that clearly resolve in DNS are taken; skip the paid lookups
+        if DNS_PREFILTER and uncached:
+            try:
+                registered = await find_registered(uncached)
+            except Exception as e:
+                # Fail open: the providers can still answer every pair
+                print(f"Error checking domains with find_registered: {str(e)}")
+                registered = set()
+            for pair in registered:
+                availability[pair] = (False, 0)
+                _remember(pair, availability[pair], "dns")
+            uncached = [pair for pair in uncached if pair not in availability]
+            exclude += ("dns",)
+        
+        # Answer as many pairs as possible with a few GoDaddy bulk requests
+        if GODADDY_API_KEY and GODADDY_API_SECRET and len(uncached) > 1:
+            bulk_results = await _check_godaddy_pairs(uncached)
+            for pair, result in bulk_results.items():
+                _remember(pair, result, "godaddy")
+            availability.update(bulk_results)
+            # Pairs GoDaddy could not answer fall back to the remaining providers
+            exclude += ("godaddy",)
     
-    return results
+    semaphore = asyncio.Semaphore(max(1, max_workers or MAX_CONCURRENT_LOOKUPS))
+    
+    async def check(domain_name, tld):
+        async with semaphore:
+            return await _check_availability(domain_name, tld, exclude)
+    
+    pending = [pair for pair in dict.fromkeys(pairs) if pair not in availability]
+    checked = await asyncio.gather(*(check(name, tld) for name, tld in pending))
+    availability.update(zip(pending, checked))
+    
+    return [_result_dict(domain_name, tld, *availability[(domain_name, tld)]) for domain_name, tld in pairs]
+
+def _result_dict(domain_name, tld, available, price):
+    """Build the availability dictionary returned to callers"""
+    return {
+        "name": domain_name,
+        "tld": tld,
+        "full_domain": f"{domain_name}.{tld}",
+        "available": available,
+        "price": price
+    }
+
+def _provider_slot(provider):
+    """Get the in-flight cap for a provider on the running event loop"""
+    loop = asyncio.get_running_loop()
+    slots = _provider_slots.get(loop)
+    if slots is None:
+        slots = {name: asyncio.Semaphore(max(1, limit)) for name, limit in PROVIDER_CONCURRENCY.items()}
+        _provider_slots[loop] = slots
+    return slots.get(provider) or contextlib.nullcontext()
 
-def _check_availability(domain_name, tld):
+def _remember(pair, result, provider):
+    """Cache a result obtained outside _lookup_availability and share it with other workers"""
+    _lookup_availability.cache_store(result, *pair)
+    store = get_availability_store()
+    if store is not None:
+        store.put(*pair, *result, provider, _availability_ttl(result))
+
+def _availability_ttl(result):
+    """Available results go stale quickly; taken domains rarely become free"""
+    available, _ = result
+    return CACHE_TTL_AVAILABLE if available else CACHE_TTL_TAKEN
+
+async def _check_availability(domain_name, tld, exclude=()):
     """
     Check if a specific domain is available using one of multiple methods
     
+    Args:
+        domain_name (str): The domain name without TLD
+        tld (str): TLD to check
+        exclude (tuple): Provider names (or "zone"/"dns" pre-filters) to skip, e.g. already tried in bulk
+    
     Returns:
         tuple: (available, price)
     """
@@ -51,32 +278,219 @@ def _check_availability(domain_name, tld):
     if DEMO_MODE:
         return _check_with_mock(domain_name, tld)
     
-    # Only try real APIs if not in demo mode
-    methods = []
+    try:
+        return await _lookup_availability(domain_name, tld, exclude)
+    except Exception as e:
+        print(f"Error checking {domain_name}.{tld}: {str(e)}")
+    
+    # Fall back to mock data (not cached, so the next call asks the providers again)
+    try:
+        return _check_with_mock(domain_name, tld)
+    except Exception as e:
+        print(f"Error checking domain with _check_with_mock: {str(e)}")
+    
+    # If all methods fail, return as unavailable
+    return False, 0
+
+@cached(ttl=_availability_ttl, stale_ttl=CACHE_STALE_TTL,
+        key=lambda domain_name, tld, exclude=(): (domain_name.lower(), tld.lower()))
+async def _lookup_availability(domain_name, tld, exclude=()):
+    """
+    Look a domain up with the real providers (failures are raised, not cached)
+    
+    Returns:
+        tuple: (available, price)
+    
+    Raises:
+        NoProviderAnswerError: If no provider answered
+    """
+    # Reuse a result any worker process stored recently
+    store = get_availability_store()
+    if store is not None:
+        record = (await store.get_many_async([(domain_name, tld)])).get((domain_name, tld))
+        if record is not None:
+            return record.available, record.price
+    
+    # Names in the offline zone filters are taken; no network call needed
+    if "zone" not in exclude and is_probably_registered(domain_name, tld):
+        return False, 0
+    
+    # Names that clearly resolve in DNS are taken; skip the paid lookups
+    if DNS_PREFILTER and "dns" not in exclude:
+        if await lookup_status(f"{domain_name}.{tld}") == REGISTERED:
+            if store is not None:
+                store.put(domain_name, tld, False, 0, "dns", CACHE_TTL_TAKEN)
+            return False, 0
+    
+    calls = [(provider, partial(_call_provider, provider, method))
+             for provider, method in _provider_chain() if provider not in exclude]
+    
+    # Send the lookup with other callers' lookups in the next GoDaddy bulk request
+    batcher = _godaddy_batcher()
+    batched = batcher is not None and bool(calls) and calls[0][0] == "godaddy"
+    if batched:
+        calls[0] = "godaddy", lambda domain_name, tld: batcher.submit((domain_name, tld))
+    
+    # Race the first two providers when hedging is enabled
+    answer = None
+    if HEDGE_REQUESTS and len(calls) > 1:
+        delay = _hedge_delay(calls[0][0])
+        if batched:
+            # A batched lookup may wait a whole window before it is sent
+            delay += LOOKUP_BATCH_WINDOW_MS / 1000
+        answer = await _check_hedged(domain_name, tld, calls[0], calls[1], delay)
+        calls = calls[2:]
+    
+    if answer is None:
+        answer = await _check_in_order(domain_name, tld, calls)
+    
+    if answer is not None:
+        result, provider = answer
+        if store is not None:
+            store.put(domain_name, tld, *result, provider, _availability_ttl(result))
+        return result
+    
+    raise NoProviderAnswerError("no availability provider answered")
+
+async def _check_in_order(domain_name, tld, calls):
+    """
+    Try providers one after another, skipping any whose circuit is open
+    
+    Args:
+        calls (list): (provider, call) tuples; call(domain_name, tld) returns
+            (available, price), or None if the provider had no answer
+    
+    Returns:
+        tuple: ((available, price), provider) from the first provider that answers, or None
+    """
+    for provider, call in calls:
+        try:
+            result = await call(domain_name, tld)
+        except CircuitOpenError:
+            continue
+        except Exception as e:
+            print(f"Error checking domain with {provider}: {str(e)}")
+            continue
+        if result is not None:
+            return result, provider
+    
+    return None
+
+async def _check_hedged(domain_name, tld, primary, secondary, delay):
+    """
+    Ask the primary provider and, if it hasn't answered within the hedge
+    delay (or has failed), the secondary one too. The first valid answer
+    wins and the other request is cancelled.
+    
+    Args:
+        primary, secondary (tuple): (provider, call) tuples as for _check_in_order()
+        delay (float): Seconds to wait for the primary before asking the secondary
+    
+    Returns:
+        tuple: ((available, price), provider), or None if both failed
+    """
+    async def attempt(provider, call):
+        result = await call(domain_name, tld)
+        if result is None:
+            raise NoProviderAnswerError(f"{provider} had no answer")
+        return result, provider
+    
+    pending = {asyncio.ensure_future(attempt(*primary))}
+    hedged = False
+    
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=None if hedged else delay,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    return task.result()
+                except (CircuitOpenError, NoProviderAnswerError):
+                    pass
+                except Exception as e:
+                    print(f"Error checking domain with hedged request: {str(e)}")
+            
+            # Primary is slow or failed: send the same lookup to the secondary
+            if not hedged:
+                hedged = True
+                pending.add(asyncio.ensure_future(attempt(*secondary)))
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+
+def _hedge_delay(provider):
+    """Fixed HEDGE_DELAY, or the provider's observed HEDGE_PERCENTILE latency"""
+    if HEDGE_DELAY > 0:
+        return HEDGE_DELAY
+    
+    samples = sorted(_latencies.get(provider, ()))
+    if len(samples) < MIN_LATENCY_SAMPLES:
+        return HEDGE_DEFAULT_DELAY
+    
+    index = min(len(samples) - 1, int(len(samples) * HEDGE_PERCENTILE / 100))
+    return max(HEDGE_MIN_DELAY, samples[index])
+
+def get_provider_health():
+    """
+    Get the circuit breaker state of each configured provider
+    
+    Returns:
+        dict: Maps provider name to its breaker snapshot (state, failure and slow-call rates, counters)
+    """
+    return {provider: get_breaker(provider).snapshot() for provider, _ in _provider_chain()}
+
+@lru_cache(maxsize=None)
+def _provider_chain():
+    """Real providers in fallback order (built once from the configured credentials)"""
+    providers = []
     
     # Only add GoDaddy if credentials are provided
     if GODADDY_API_KEY and GODADDY_API_SECRET:
-        methods.append(_check_with_godaddy)
+        providers.append(("godaddy", _check_with_godaddy))
     
     # Only add WHOIS if credentials are provided
     if WHOIS_API_KEY:
-        methods.append(_check_with_whois_api)
+        providers.append(("whois", _check_with_whois_api))
     
-    # Always include mock as fallback
-    methods.append(_check_with_mock)
+    return tuple(providers)
+
+async def _call_provider(provider, method, *args):
+    """
+    Call a provider under its concurrency cap, rate limit and circuit breaker
     
-    # Try each method in order
-    for method in methods:
-        try:
-            return method(domain_name, tld)
-        except Exception as e:
-            print(f"Error checking domain with {method.__name__}: {str(e)}")
-            continue
+    Raises:
+        CircuitOpenError: If the provider's circuit is open
+    """
+    breaker = get_breaker(provider)
+    if not breaker.allow_request():
+        raise CircuitOpenError(f"{provider} circuit is open")
     
-    # If all methods fail, return as unavailable
-    return False, 0
+    try:
+        async with _provider_slot(provider):
+            await throttle_async(_RATE_LIMIT_KEYS.get(provider, provider))
+            # Only the provider call itself counts towards the latency threshold
+            started = time.monotonic()
+            try:
+                result = await method(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                breaker.record_failure(time.monotonic() - started)
+                raise
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    
+    duration = time.monotonic() - started
+    breaker.record_success(duration)
+    _latencies.setdefault(provider, deque(maxlen=500)).append(duration)
+    return result
 
-def _check_with_godaddy(domain_name, tld):
+async def _check_with_godaddy(domain_name, tld):
     """Check domain availability using GoDaddy API"""
     if not GODADDY_API_KEY or not GODADDY_API_SECRET:
         raise ValueError("GoDaddy API credentials not configured")
@@ -93,16 +507,107 @@ def _check_with_godaddy(domain_name, tld):
         "Content-Type": "application/json"
     }
     
-    response = requests.get(url, params=params, headers=headers)
-    if response.status_code == 200:
+    response = await request_async("GET", url, params=params, headers=headers)
+    if response.status == 200:
         data = response.json()
-        available = data.get("available", False)
-        price = data.get("price", 0) / 1000000 if data.get("price") else 9.99  # Convert from microseconds to dollars
-        return available, price
+        return _parse_godaddy_result(data)
     else:
-        raise Exception(f"GoDaddy API error: {response.status_code} - {response.text}")
+        raise Exception(f"GoDaddy API error: {response.status} - {response.text}")
+
+@lru_cache(maxsize=None)
+def _godaddy_batcher():
+    """Process-wide GoDaddy micro-batcher, or None if batching is disabled"""
+    if not GODADDY_API_KEY or not GODADDY_API_SECRET or LOOKUP_BATCH_WINDOW_MS <= 0:
+        return None
+    return MicroBatcher("godaddy", _check_bulk_with_godaddy, LOOKUP_BATCH_WINDOW_MS / 1000, LOOKUP_BATCH_MAX_SIZE)
 
-def _check_with_whois_api(domain_name, tld):
+async def _check_godaddy_pairs(pairs):
+    """
+    Check many domains with GoDaddy bulk requests, shared with other callers'
+    lookups when micro-batching is enabled
+    
+    Returns:
+        dict: Maps (domain_name, tld) to (available, price) for the pairs GoDaddy answered
+    """
+    batcher = _godaddy_batcher()
+    if batcher is None:
+        return await _check_bulk_with_godaddy(pairs)
+    results = await batcher.submit_many(pairs)
+    return {pair: result for pair, result in results.items() if result is not None}
+
+async def _check_bulk_with_godaddy(pairs):
+    """
+    Check many domains using the GoDaddy bulk availability endpoint
+    
+    Pairs are split into chunks of GODADDY_BULK_LIMIT domains that are sent
+    concurrently (subject to the GoDaddy concurrency cap).
+    
+    Args:
+        pairs (list): List of (domain_name, tld) tuples
+    
+    Returns:
+        dict: Maps (domain_name, tld) to (available, price). Pairs in failed
+              chunks or reported in the response's "errors" list are left out.
+    """
+    if not GODADDY_API_KEY or not GODADDY_API_SECRET:
+        raise ValueError("GoDaddy API credentials not configured")
+    
+    unique_pairs = list(dict.fromkeys(pairs))
+    limit = max(1, GODADDY_BULK_LIMIT)
+    chunks = [unique_pairs[i:i + limit] for i in range(0, len(unique_pairs), limit)]
+    
+    chunk_results = await asyncio.gather(
+        *(_call_provider("godaddy", _check_chunk_with_godaddy, chunk) for chunk in chunks),
+        return_exceptions=True
+    )
+    
+    results = {}
+    for chunk_result in chunk_results:
+        if isinstance(chunk_result, CircuitOpenError):
+            continue
+        if isinstance(chunk_result, Exception):
+            print(f"Error checking domains with _check_bulk_with_godaddy: {str(chunk_result)}")
+            continue
+        results.update(chunk_result)
+    
+    return results
+
+async def _check_chunk_with_godaddy(pairs):
+    """Send one GoDaddy bulk availability request and map results back to (name, TLD) pairs"""
+    # GoDaddy echoes the domain back, so key the pairs by lowercase full domain
+    pairs_by_domain = {f"{domain_name}.{tld}".lower(): (domain_name, tld) for domain_name, tld in pairs}
+    
+    url = f"{GODADDY_API_URL}/v1/domains/available"
+    params = {"checkType": "FULL"}
+    headers = {
+        "Authorization": f"sso-key {GODADDY_API_KEY}:{GODADDY_API_SECRET}",
+        "Content-Type": "application/json"
+    }
+    
+    response = await request_async("POST", url, params=params, headers=headers, json=list(pairs_by_domain))
+    # 203 means some domains could not be checked (listed under "errors")
+    if response.status not in (200, 203):
+        raise Exception(f"GoDaddy API error: {response.status} - {response.text}")
+    data = response.json()
+    
+    results = {}
+    for item in data.get("domains", []):
+        pair = pairs_by_domain.get(str(item.get("domain", "")).lower())
+        if pair is not None:
+            results[pair] = _parse_godaddy_result(item)
+    
+    for error in data.get("errors", []):
+        print(f"GoDaddy could not check {error.get('domain')}: {error.get('code')} - {error.get('message')}")
+    
+    return results
+
+def _parse_godaddy_result(data):
+    """Convert a GoDaddy availability record to (available, price)"""
+    available = data.get("available", False)
+    price = data.get("price", 0) / 1000000 if data.get("price") else 9.99  # Convert from microseconds to dollars
+    return available, price
+
+async def _check_with_whois_api(domain_name, tld):
     """Check domain availability using WHOIS API"""
     if not WHOIS_API_KEY:
         raise ValueError("WHOIS API key not configured")
@@ -114,8 +619,8 @@ def _check_with_whois_api(domain_name, tld):
         "outputFormat": "JSON"
     }
     
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
+    response = await request_async("GET", url, params=params)
+    if response.status == 200:
         data = response.json()
         
         # Check if domain is registered
@@ -131,83 +636,11 @@ def _check_with_whois_api(domain_name, tld):
             # If no registry data, assume it's available
             return True, 9.99
     else:
-        raise Exception(f"WHOIS API error: {response.status_code} - {response.text}")
+        raise Exception(f"WHOIS API error: {response.status} - {response.text}")
 
 def _check_with_mock(domain_name, tld):
     """
     Mock domain availability check for demo purposes
     Uses a deterministic algorithm to simulate availability
     """
-    # Seed random with domain name for consistent results
-    random.seed(f"{domain_name}.{tld}")
-    
-    # Common domains are less likely to be available
-    common_words = [
-        "blog", "tech", "cloud", "digital", "web", "online", "app", 
-        "smart", "easy", "best", "top", "pro", "expert", "my", "the",
-        "one", "first", "prime", "elite", "global", "world", "market",
-        "shop", "store", "buy", "sell", "trade", "exchange", "service",
-        "solution", "system", "platform", "network", "connect", "link",
-        "data", "info", "media", "social", "creative", "design", "art",
-        "health", "fitness", "wellness", "food", "diet", "travel", "trip",
-        "vacation", "holiday", "learn", "edu", "study", "course", "class",
-        "finance", "money", "invest", "wealth", "rich", "cash", "crypto",
-        "game", "play", "fun", "mobile", "phone", "tablet", "computer"
-    ]
-    
-    # Length is also a factor (shorter domains are less likely to be available)
-    length_factor = max(0.1, min(0.9, (len(domain_name) - 3) / 10))
-    
-    # Check if domain contains common words
-    word_factor = 0.5
-    for word in common_words:
-        if word in domain_name:
-            word_factor = 0.2
-            break
-    
-    # Availability varies by TLD popularity
-    tld_availability_rates = {
-        "com": 0.05,  # Only 5% of .com domains are available
-        "net": 0.20,
-        "org": 0.25,
-        "io": 0.30,
-        "co": 0.35,
-        "app": 0.60,
-        "dev": 0.65,
-        "ai": 0.40,
-        # Add other TLDs as needed
-    }
-    
-    # Get availability rate for this TLD, default to 30%
-    base_availability_rate = tld_availability_rates.get(tld, 0.30)
-    
-    # Calculate final availability rate
-    availability_rate = base_availability_rate * length_factor * word_factor
-    
-    # Special case for exact search: make most common domains unavailable
-    if len(domain_name) <= 5 and tld == "com":
-        availability_rate = 0.01  # 1% chance for short .com domains
-    
-    # Generate a random number and compare to availability rate
-    is_available = random.random() < availability_rate
-    
-    # Set pricing based on TLD (realistic pricing)
-    tld_pricing = {
-        "com": 11.99,
-        "net": 12.99,
-        "org": 12.99,
-        "io": 49.99,
-        "co": 29.99,
-        "app": 17.99,
-        "dev": 15.99,
-        "ai": 69.99,
-        # Add other TLDs as needed
-    }
-    
-    price = tld_pricing.get(tld, 14.99)
-    
-    # Add some price variation
-    price_variation = random.uniform(0.9, 1.1)
-    price = round(price * price_variation, 2)
-    
-    return is_available, price
\ No newline at end of file
+    return check_mock(domain_name, tld)
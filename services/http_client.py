@@ -0,0 +1,245 @@
+"""
+Shared HTTP session layer used by every provider.
+
+Keeps one process-wide requests.Session for synchronous calls and one
+aiohttp.ClientSession per event loop for the async core. Both use per-host
+keep-alive connection pools, connect/read timeouts and retries with jittered
+backoff that honor Retry-After. Retries are only safe for idempotent lookups;
+callers sending requests that must not be repeated (such as paid Azure
+OpenAI completions) pass retry=False.
+"""
+import asyncio
+import atexit
+import json
+import random
+import threading
+import weakref
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    HTTP_POOL_SIZE,
+    HTTP_POOL_HOSTS,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_MAX_RETRY_AFTER
+)
+
+# Responses worth retrying (rate limited or transient server errors)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Sync sessions: with transport retries (True) and without (False)
+_sessions = {}
+_session_lock = threading.Lock()
+_async_sessions = weakref.WeakKeyDictionary()
+
+# Async connection statistics per host
+_stats_lock = threading.Lock()
+_async_stats = {}
+
+class HttpResponse:
+    """Fully-read response returned by request_async()"""
+    
+    def __init__(self, status, headers, text):
+        self.status = status
+        self.headers = headers
+        self.text = text
+    
+    def json(self):
+        """Parse the response body as JSON"""
+        return json.loads(self.text)
+
+def get_session(retry=True):
+    """
+    Get a process-wide requests session
+    
+    Args:
+        retry (bool): Whether the session retries failed requests (any method)
+    
+    Returns:
+        requests.Session: Session with pooled keep-alive connections
+    """
+    with _session_lock:
+        session = _sessions.get(retry)
+        if session is None:
+            if retry:
+                max_retries = Retry(
+                    total=HTTP_MAX_RETRIES,
+                    backoff_factor=HTTP_BACKOFF_FACTOR,
+                    backoff_jitter=HTTP_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=None,  # Only idempotent lookups use this session
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            else:
+                max_retries = Retry(total=0, read=False, raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE, max_retries=max_retries)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[retry] = session
+    return session
+
+def request(method, url, retry=True, **kwargs):
+    """
+    Make a synchronous HTTP request through a shared session
+    
+    Args:
+        method (str): HTTP method
+        url (str): Request URL
+        retry (bool): Retry failures; pass False for requests that must not be repeated
+        **kwargs: Passed to requests.Session.request (timeout defaults to the configured values)
+        
+    Returns:
+        requests.Response: The response
+    """
+    kwargs.setdefault("timeout", (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+    return get_session(retry).request(method, url, **kwargs)
+
+def get_async_session():
+    """
+    Get the aiohttp session for the running event loop
+    
+    Returns:
+        aiohttp.ClientSession: Session with per-host connection pools
+    """
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(_on_request_start)
+        trace_config.on_connection_create_end.append(_on_connection_created)
+        trace_config.on_connection_reuseconn.append(_on_connection_reused)
+        
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE * HTTP_POOL_HOSTS, limit_per_host=HTTP_POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=HTTP_CONNECT_TIMEOUT, sock_read=HTTP_READ_TIMEOUT),
+            trace_configs=[trace_config]
+        )
+        _async_sessions[loop] = session
+    return session
+
+async def close_async_session():
+    """Close the aiohttp session of the running event loop (if any)"""
+    session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+async def request_async(method, url, retry=True, **kwargs):
+    """
+    Make an HTTP request through the shared aiohttp session
+    
+    Unless retry is False, retries connection errors, timeouts and
+    RETRY_STATUSES responses up to HTTP_MAX_RETRIES times with jittered
+    exponential backoff, waiting for Retry-After when the server sends it.
+    
+    Args:
+        method (str): HTTP method
+        url (str): Request URL
+        retry (bool): Retry failures; pass False for requests that must not be repeated
+        **kwargs: Passed to aiohttp.ClientSession.request
+        
+    Returns:
+        HttpResponse: The final response, fully read
+    """
+    session = get_async_session()
+    max_retries = HTTP_MAX_RETRIES if retry else 0
+    attempt = 0
+    
+    while True:
+        retry_after = None
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                text = await response.text()
+                if response.status not in RETRY_STATUSES or attempt >= max_retries:
+                    return HttpResponse(response.status, response.headers, text)
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= max_retries:
+                raise
+        
+        _record(urlsplit(url).hostname, "retries")
+        await asyncio.sleep(_backoff_delay(attempt, retry_after))
+        attempt += 1
+
+@atexit.register
+def _close_async_sessions():
+    """Close sessions whose loops are still running in background threads"""
+    for loop, session in list(_async_sessions.items()):
+        if session.closed or not loop.is_running():
+            continue
+        try:
+            asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=1)
+        except Exception:
+            pass
+
+def get_http_stats():
+    """
+    Get connection reuse statistics for the shared sessions
+    
+    Returns:
+        dict: Maps host to a dict with requests, new_connections,
+              reused_connections and retries counts
+    """
+    with _stats_lock:
+        stats = {host: dict(counts) for host, counts in _async_stats.items()}
+    
+    # The sync sessions keep their own counters on each urllib3 pool
+    with _session_lock:
+        pool_managers = [session.get_adapter("https://").poolmanager for session in _sessions.values()]
+    pools = [pool_manager.pools.get(key) for pool_manager in pool_managers for key in pool_manager.pools.keys()]
+    for pool in filter(None, pools):
+        counts = stats.setdefault(pool.host, _empty_stats())
+        counts["requests"] += pool.num_requests
+        counts["new_connections"] += pool.num_connections
+        counts["reused_connections"] += max(0, pool.num_requests - pool.num_connections)
+    
+    return stats
+
+def _empty_stats():
+    return {"requests": 0, "new_connections": 0, "reused_connections": 0, "retries": 0}
+
+def _record(host, counter):
+    with _stats_lock:
+        _async_stats.setdefault(host, _empty_stats())[counter] += 1
+
+async def _on_request_start(session, context, params):
+    context.host = params.url.host
+    _record(context.host, "requests")
+
+async def _on_connection_created(session, context, params):
+    _record(getattr(context, "host", None), "new_connections")
+
+async def _on_connection_reused(session, context, params):
+    _record(getattr(context, "host", None), "reused_connections")
+
+def _backoff_delay(attempt, retry_after=None):
+    """Full-jitter exponential backoff, or the server's Retry-After when given"""
+    if retry_after is not None:
+        return min(retry_after, HTTP_MAX_RETRY_AFTER)
+    return random.uniform(0, HTTP_BACKOFF_FACTOR * (2 ** attempt))
+
+def _parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
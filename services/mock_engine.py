@@ -0,0 +1,113 @@
+"""
+Deterministic mock availability engine for DEMO_MODE and load tests.
+
+Each (name, TLD) pair draws its randomness from a hash of the pair instead
+of seeding the global RNG, so results are stable across runs and processes
+and never disturb random state elsewhere. Batches are scored with NumPy.
+"""
+import hashlib
+import re
+
+import numpy as np
+
+# Common domains are less likely to be available
+COMMON_WORDS = (
+    "blog", "tech", "cloud", "digital", "web", "online", "app",
+    "smart", "easy", "best", "top", "pro", "expert", "my", "the",
+    "one", "first", "prime", "elite", "global", "world", "market",
+    "shop", "store", "buy", "sell", "trade", "exchange", "service",
+    "solution", "system", "platform", "network", "connect", "link",
+    "data", "info", "media", "social", "creative", "design", "art",
+    "health", "fitness", "wellness", "food", "diet", "travel", "trip",
+    "vacation", "holiday", "learn", "edu", "study", "course", "class",
+    "finance", "money", "invest", "wealth", "rich", "cash", "crypto",
+    "game", "play", "fun", "mobile", "phone", "tablet", "computer"
+)
+
+# One alternation finds any common word in a single scan of the name
+_COMMON_WORD_PATTERN = re.compile("|".join(sorted(map(re.escape, COMMON_WORDS), key=len, reverse=True)))
+
+# Availability varies by TLD popularity
+TLD_AVAILABILITY_RATES = {
+    "com": 0.05,  # Only 5% of .com domains are available
+    "net": 0.20,
+    "org": 0.25,
+    "io": 0.30,
+    "co": 0.35,
+    "app": 0.60,
+    "dev": 0.65,
+    "ai": 0.40
+}
+DEFAULT_AVAILABILITY_RATE = 0.30
+
+# Realistic pricing per TLD
+TLD_PRICING = {
+    "com": 11.99,
+    "net": 12.99,
+    "org": 12.99,
+    "io": 49.99,
+    "co": 29.99,
+    "app": 17.99,
+    "dev": 15.99,
+    "ai": 69.99
+}
+DEFAULT_PRICE = 14.99
+
+# Scales a 64-bit hash to a float in [0, 1)
+_UNIT = 1.0 / 2 ** 64
+
+def check_mock_batch(pairs):
+    """
+    Simulate availability for many (name, TLD) pairs at once
+    
+    Args:
+        pairs (list): List of (domain_name, tld) tuples
+        
+    Returns:
+        list: (available, price) tuples in input order
+    """
+    if not pairs:
+        return []
+    
+    names = [name for name, _ in pairs]
+    tlds = [tld for _, tld in pairs]
+    
+    # Common-word detection once per distinct name (names repeat across TLDs)
+    has_common_word = {name: _COMMON_WORD_PATTERN.search(name) is not None for name in set(names)}
+    
+    draws = np.array([_pair_draws(name, tld) for name, tld in pairs], dtype=np.uint64).reshape(-1, 2)
+    availability_draw = draws[:, 0] * _UNIT
+    price_draw = draws[:, 1] * _UNIT
+    
+    lengths = np.fromiter((len(name) for name in names), dtype=np.float64, count=len(names))
+    common = np.fromiter((has_common_word[name] for name in names), dtype=bool, count=len(names))
+    is_com = np.fromiter((tld == "com" for tld in tlds), dtype=bool, count=len(tlds))
+    base_rates = np.fromiter((TLD_AVAILABILITY_RATES.get(tld, DEFAULT_AVAILABILITY_RATE) for tld in tlds), dtype=np.float64, count=len(tlds))
+    base_prices = np.fromiter((TLD_PRICING.get(tld, DEFAULT_PRICE) for tld in tlds), dtype=np.float64, count=len(tlds))
+    
+    # Shorter domains and common words are less likely to be available
+    length_factor = np.clip((lengths - 3) / 10, 0.1, 0.9)
+    word_factor = np.where(common, 0.2, 0.5)
+    rates = base_rates * length_factor * word_factor
+    
+    # Short .com domains are almost always taken
+    rates = np.where((lengths <= 5) & is_com, 0.01, rates)
+    
+    available = availability_draw < rates
+    prices = np.round(base_prices * (0.9 + 0.2 * price_draw), 2)
+    
+    return list(zip(available.tolist(), prices.tolist()))
+
+def check_mock(domain_name, tld):
+    """
+    Simulate availability for one domain
+    
+    Returns:
+        tuple: (available, price)
+    """
+    return check_mock_batch([(domain_name, tld)])[0]
+
+def _pair_draws(domain_name, tld):
+    """Two independent 64-bit values derived from the full domain name"""
+    digest = hashlib.blake2b(f"{domain_name}.{tld}".encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
@@ -0,0 +1,326 @@
+"""
+Typo and lookalike permutation engine for brand-protection runs.
+
+Enumerates names within one or two edits of a domain using the usual
+typosquatting strategies, streaming them in batches so millions of
+candidates can be written out without keeping the names themselves in
+memory. Duplicates are removed with a compact open-addressing set of
+64-bit string hashes (16 bytes or less per name).
+
+Write every distance-2 permutation of a domain:
+    python -m services.permutations example.com --distance 2 -o example.txt
+"""
+import argparse
+import sys
+import time
+from itertools import compress
+
+import numpy as np
+
+# Characters allowed in a domain label
+ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789-"
+MAX_LABEL_LENGTH = 63
+
+# A label cannot start or end with a hyphen
+_EDGE_ALPHABET = ALPHABET.replace("-", "")
+
+# Popular TLDs tried by the tld_swap strategy
+DEFAULT_TLDS = ["com", "net", "org", "io", "co", "ai", "app", "dev", "in", "co.in", "info", "biz", "xyz", "online", "site"]
+
+KEYBOARD_ROWS = ["1234567890-", "qwertyuiop", "asdfghjkl", "zxcvbnm"]
+VOWELS = "aeiou"
+
+# ASCII lookalikes (single characters and short sequences)
+HOMOGLYPHS = {
+    "0": ["o"], "1": ["l", "i"], "2": ["z"], "5": ["s"], "6": ["b"], "8": ["b"], "9": ["g", "q"],
+    "a": ["4"], "b": ["6", "8"], "d": ["cl"], "e": ["3"], "g": ["9", "q"], "i": ["1", "l", "j"],
+    "j": ["i"], "l": ["1", "i"], "m": ["rn", "nn"], "o": ["0"], "q": ["g", "9"], "s": ["5"],
+    "u": ["v"], "v": ["u"], "w": ["vv"], "z": ["2"],
+    "rn": ["m"], "nn": ["m"], "vv": ["w"], "cl": ["d"]
+}
+
+# Names generated between dedupe passes
+BATCH_SIZE = 65536
+
+def _keyboard_neighbours():
+    """Keys next to each key on a QWERTY keyboard (rows are offset by half a key)"""
+    neighbours = {}
+    for row, keys in enumerate(KEYBOARD_ROWS):
+        for i, key in enumerate(keys):
+            nearby = []
+            for other_row, offsets in ((row - 1, (0, 1)), (row, (-1, 1)), (row + 1, (-1, 0))):
+                if 0 <= other_row < len(KEYBOARD_ROWS):
+                    for offset in offsets:
+                        if 0 <= i + offset < len(KEYBOARD_ROWS[other_row]):
+                            nearby.append(KEYBOARD_ROWS[other_row][i + offset])
+            neighbours[key] = nearby
+    return neighbours
+
+def _bit_flips():
+    """Valid characters one flipped bit away from each valid character"""
+    return {
+        char: [chr(ord(char) ^ (1 << bit)) for bit in range(8) if chr(ord(char) ^ (1 << bit)) in ALPHABET]
+        for char in ALPHABET
+    }
+
+# Single-character substitution tables
+SUBSTITUTIONS = {
+    "replacement": {char: [other for other in ALPHABET if other != char] for char in ALPHABET},
+    "keyboard": _keyboard_neighbours(),
+    "vowel_swap": {vowel: [other for other in VOWELS if other != vowel] for vowel in VOWELS},
+    "bitsquatting": _bit_flips()
+}
+
+# Characters to insert before each character (skipping the character itself)
+_INNER_INSERTS = {char: ALPHABET.replace(char, "") for char in ALPHABET}
+_EDGE_INSERTS = {char: _EDGE_ALPHABET.replace(char, "") for char in ALPHABET}
+
+# Substitution tables as strings, for inner positions and for the first/last character
+_SUBSTITUTION_TABLES = {
+    strategy: (
+        {char: "".join(others) for char, others in table.items()},
+        {char: "".join(others).replace("-", "") for char, others in table.items()}
+    )
+    for strategy, table in SUBSTITUTIONS.items()
+}
+
+STRATEGIES = (
+    "insertion", "deletion", "transposition", "replacement", "keyboard",
+    "homoglyph", "vowel_swap", "hyphenation", "bitsquatting", "tld_swap"
+)
+
+def iter_permutations(domain, strategies=None, distance=1, tlds=None):
+    """
+    Stream unique permutations of a domain
+    
+    Args:
+        domain (str): Domain to permute (e.g. "example.com")
+        strategies (iterable): Strategy names to enable (defaults to STRATEGIES)
+        distance (int): 1 or 2 edits away from the name
+        tlds (list): TLDs for the tld_swap strategy (defaults to DEFAULT_TLDS)
+    
+    Yields:
+        str: Full domain names, without the input domain itself
+    """
+    for batch in iter_permutation_batches(domain, strategies, distance, tlds):
+        yield from batch
+
+def iter_permutation_batches(domain, strategies=None, distance=1, tlds=None):
+    """
+    Stream unique permutations of a domain in batches
+    
+    Args:
+        domain (str): Domain to permute (e.g. "example.com")
+        strategies (iterable): Strategy names to enable (defaults to STRATEGIES)
+        distance (int): 1 or 2 edits away from the name
+        tlds (list): TLDs for the tld_swap strategy (defaults to DEFAULT_TLDS)
+        
+    Yields:
+        list: Full domain names, without the input domain itself
+    """
+    for names, suffix in _name_batches(domain, strategies, distance, tlds):
+        yield [name + suffix for name in names]
+
+def write_permutations(domain, output, strategies=None, distance=1, tlds=None):
+    """
+    Write unique permutations of a domain, one per line
+    
+    Args:
+        domain (str): Domain to permute (e.g. "example.com")
+        output: Writable text file
+        strategies (iterable): Strategy names to enable (defaults to STRATEGIES)
+        distance (int): 1 or 2 edits away from the name
+        tlds (list): TLDs for the tld_swap strategy (defaults to DEFAULT_TLDS)
+        
+    Returns:
+        int: Number of names written
+    """
+    count = 0
+    for names, suffix in _name_batches(domain, strategies, distance, tlds):
+        # Joining with the suffix adds the TLD without building each string separately
+        line_end = f"{suffix}\n"
+        output.write(line_end.join(names))
+        output.write(line_end)
+        count += len(names)
+    return count
+
+def _name_batches(domain, strategies, distance, tlds):
+    """Yield (names, ".tld") batches of unique permutations"""
+    strategies = set(STRATEGIES if strategies is None else strategies)
+    unknown = strategies - set(STRATEGIES)
+    if unknown:
+        raise ValueError(f"Unknown permutation strategies: {', '.join(sorted(unknown))}")
+    if distance not in (1, 2):
+        raise ValueError("distance must be 1 or 2")
+    
+    name, _, tld = domain.lower().strip().partition(".")
+    tld = tld or "com"
+    suffix = f".{tld}"
+    
+    if "tld_swap" in strategies:
+        for other in dict.fromkeys(tlds or DEFAULT_TLDS):
+            if other != tld:
+                yield [name], f".{other}"
+    
+    edits = strategies - {"tld_swap"}
+    if not edits:
+        return
+    
+    seen = HashSet()
+    seen.add_many([name])
+    
+    # Distance 1 is small enough to keep; distance 2 is streamed from it
+    first = _unique(seen, _edits(name, edits))
+    for start in range(0, len(first), BATCH_SIZE):
+        yield first[start:start + BATCH_SIZE], suffix
+    
+    if distance == 2:
+        pending = []
+        for candidate in first:
+            pending += _edits(candidate, edits)
+            if len(pending) >= BATCH_SIZE:
+                yield _unique(seen, pending), suffix
+                pending = []
+        if pending:
+            yield _unique(seen, pending), suffix
+
+def _edits(name, strategies):
+    """All single-edit variants of a name for the enabled strategies (may repeat)"""
+    last = len(name) - 1
+    candidates = []
+    if "insertion" in strategies:
+        # Inserting a character next to the same character gives the same name
+        # either side, so only insert it after the run
+        points = [(name[:i], name[i:], (_INNER_INSERTS if 0 < i else _EDGE_INSERTS)[name[i]]) for i in range(len(name))]
+        points.append((name, "", _EDGE_ALPHABET))
+        candidates += [head + char + tail for head, tail, chars in points for char in chars]
+    elif "hyphenation" in strategies:
+        candidates += [name[:i] + "-" + name[i:] for i in range(1, len(name))]
+    if "deletion" in strategies and len(name) > 1:
+        candidates += [name[:i] + name[i + 1:] for i in range(len(name)) if i == 0 or name[i] != name[i - 1]]
+    if "transposition" in strategies:
+        candidates += [name[:i] + name[i + 1] + name[i] + name[i + 2:] for i in range(last) if name[i] != name[i + 1]]
+    for strategy, (inner, edge) in _SUBSTITUTION_TABLES.items():
+        # Every single-character substitution is already a replacement
+        if strategy in strategies and (strategy == "replacement" or "replacement" not in strategies):
+            points = [(name[:i], name[i + 1:], (inner if 0 < i < last else edge).get(name[i], "")) for i in range(len(name))]
+            candidates += [head + char + tail for head, tail, chars in points for char in chars]
+    if "homoglyph" in strategies:
+        for pattern, lookalikes in HOMOGLYPHS.items():
+            start = name.find(pattern)
+            while start != -1:
+                candidates += [name[:start] + lookalike + name[start + len(pattern):] for lookalike in lookalikes]
+                start = name.find(pattern, start + 1)
+    
+    # Edits that move or expose an existing hyphen, or grow a long name, can
+    # leave an invalid label
+    if "-" in name or len(name) >= MAX_LABEL_LENGTH:
+        candidates = [
+            candidate for candidate in candidates
+            if candidate and candidate[0] != "-" and candidate[-1] != "-" and len(candidate) <= MAX_LABEL_LENGTH
+        ]
+    return candidates
+
+def _unique(seen, names):
+    """Names not seen before, in order, without repeats"""
+    names = list(dict.fromkeys(names))
+    if not names:
+        return []
+    return list(compress(names, seen.add_many(names)))
+
+class HashSet:
+    """
+    Set of 64-bit name hashes in one open-addressing NumPy table
+    
+    Uses 8 bytes per slot at a load factor of at most one half. Two different
+    names colliding on all 64 bits would be treated as the same name; with
+    millions of names the chance of that is around one in a million.
+    """
+    
+    def __init__(self, capacity=1 << 16):
+        size = 1
+        while size < capacity * 2:
+            size <<= 1
+        self._table = np.zeros(size, dtype=np.uint64)
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def add_many(self, names):
+        """
+        Add distinct names to the set
+        
+        Args:
+            names (list): Names to add, without repeats
+        
+        Returns:
+            numpy.ndarray: True for each name that was not in the set yet
+        """
+        keys = np.fromiter(map(hash, names), dtype=np.int64, count=len(names)).view(np.uint64)
+        keys[keys == 0] = 1  # 0 marks an empty slot
+        
+        while (self._count + len(keys)) * 2 > len(self._table):
+            self._grow()
+        
+        inserted = self._insert(keys)
+        self._count += int(inserted.sum())
+        return inserted
+    
+    def _grow(self):
+        keys = self._table[self._table != 0]
+        self._table = np.zeros(len(self._table) * 2, dtype=np.uint64)
+        self._insert(keys)
+    
+    def _insert(self, keys):
+        """Insert distinct keys with vectorized linear probing; True where a key was new"""
+        mask = np.uint64(len(self._table) - 1)
+        slots = keys & mask
+        inserted = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        while len(pending):
+            pending_keys = keys[pending]
+            pending_slots = slots[pending]
+            current = self._table[pending_slots]
+            empty = current == 0
+            
+            # Several keys may claim the same empty slot; the last write wins
+            self._table[pending_slots[empty]] = pending_keys[empty]
+            won = empty & (self._table[pending_slots] == pending_keys)
+            inserted[pending[won]] = True
+            
+            # Keys already present are done; the others probe the next slot
+            pending = pending[~(won | (current == pending_keys))]
+            slots[pending] = (slots[pending] + np.uint64(1)) & mask
+        return inserted
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate typo and lookalike permutations of a domain")
+    parser.add_argument("domain", help="Domain to permute (e.g. example.com)")
+    parser.add_argument("-d", "--distance", type=int, choices=(1, 2), default=1, help="Number of edits (default 1)")
+    parser.add_argument("-s", "--strategies", help=f"Comma-separated strategies (default all: {','.join(STRATEGIES)})")
+    parser.add_argument("-x", "--exclude", help="Comma-separated strategies to leave out")
+    parser.add_argument("--tlds", help="Comma-separated TLDs for tld_swap")
+    parser.add_argument("-o", "--output", default="-", help="Output file ('-' for stdout)")
+    args = parser.parse_args(argv)
+    
+    strategies = set(args.strategies.split(",")) if args.strategies else set(STRATEGIES)
+    if args.exclude:
+        strategies -= set(args.exclude.split(","))
+    tlds = args.tlds.split(",") if args.tlds else None
+    
+    started = time.time()
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        count = write_permutations(args.domain, output, strategies, args.distance, tlds)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    elapsed = time.time() - started
+    print(f"Wrote {count} permutations in {elapsed:.1f}s ({count / max(elapsed, 1e-9):,.0f}/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,675 @@
+"""
+Phonetic keys and a sound-alike word index.
+
+Soundex and Double Metaphone map a word to short keys that stay the same
+for words that sound alike ("fone" and "phone" both give FN). The index
+maps those keys to the words in WORD_LIST_PATH. It is built offline into
+one file of open-addressing hash tables that is memory-mapped on first
+use, so a lookup is a couple of reads and loading costs nothing up front.
+
+Build the index (done automatically on first use if it is missing or older
+than the word list):
+    python -m services.phonetic build data/words.txt data/phonetic.idx
+"""
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+import threading
+
+from config.settings import PHONETIC_INDEX_PATH, WORD_LIST_PATH
+
+ALGORITHMS = ("soundex", "metaphone")
+
+MAGIC = b"DFPHON01"
+HEADER = struct.Struct("<8sI")  # magic, word count
+TABLE = struct.Struct("<III")  # slot count, slots offset, postings offset (one per algorithm)
+SLOT = struct.Struct("<III")  # key code, first posting, posting count
+
+# Shortest word worth suggesting
+MIN_WORD_LENGTH = 3
+
+_SOUNDEX_CODES = {}
+for _letters, _code in (("BFPV", "1"), ("CGJKQSXZ", "2"), ("DT", "3"), ("L", "4"), ("MN", "5"), ("R", "6")):
+    for _letter in _letters:
+        _SOUNDEX_CODES[_letter] = _code
+
+_index = None
+_index_lock = threading.Lock()
+
+def soundex(word):
+    """
+    American Soundex key
+    
+    Args:
+        word (str): Word to encode (non-letters are ignored)
+    
+    Returns:
+        str: Four-character key such as "R163", or "" if there are no letters
+    """
+    letters = [char for char in word.upper() if "A" <= char <= "Z"]
+    if not letters:
+        return ""
+    
+    key = letters[0]
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        code = _SOUNDEX_CODES.get(char, "")
+        if code and code != previous:
+            key += code
+            if len(key) == 4:
+                break
+        # H and W do not separate letters with the same code; vowels do
+        if char not in "HW":
+            previous = code
+    return key.ljust(4, "0")
+
+def double_metaphone(word):
+    """
+    Double Metaphone keys (Lawrence Philips' algorithm)
+    
+    Args:
+        word (str): Word to encode
+    
+    Returns:
+        tuple: (primary, secondary) keys of up to four characters; the
+        secondary key equals the primary one when there is no alternative
+    """
+    word = "".join(char for char in word.upper() if char.isalpha())
+    if not word:
+        return "", ""
+    return _DoubleMetaphone(word).encode()
+
+def phonetic_keys(word, algorithm="metaphone"):
+    """
+    Distinct keys of a word for one algorithm
+    
+    Args:
+        word (str): Word to encode
+        algorithm (str): "soundex" or "metaphone"
+    
+    Returns:
+        list: Non-empty keys
+    """
+    if algorithm == "soundex":
+        keys = [soundex(word)]
+    elif algorithm == "metaphone":
+        keys = double_metaphone(word)
+    else:
+        raise ValueError(f"Unknown phonetic algorithm: {algorithm}")
+    return [key for key in dict.fromkeys(keys) if key]
+
+class _DoubleMetaphone:
+    """State for encoding one word"""
+    
+    VOWELS = "AEIOUY"
+    
+    def __init__(self, word):
+        self.word = word
+        self.last = len(word) - 1
+        # Reads past the end see spaces, as in the reference implementation
+        self.padded = word + " " * 6
+        self.primary = ""
+        self.secondary = ""
+        self.slavo_germanic = any(part in word for part in ("W", "K", "CZ", "WITZ"))
+    
+    def at(self, start, length, *options):
+        return start >= 0 and self.padded[start:start + length] in options
+    
+    def char(self, position):
+        return self.padded[position] if position >= 0 else ""
+    
+    def is_vowel(self, position):
+        return position >= 0 and self.padded[position] in self.VOWELS
+    
+    def add(self, primary, secondary=None):
+        self.primary += primary
+        self.secondary += primary if secondary is None else secondary
+    
+    def encode(self):
+        word = self.word
+        position = 0
+        
+        # Silent first letters
+        if self.at(0, 2, "GN", "KN", "PN", "WR", "PS"):
+            position = 1
+        # Initial X sounds like S (Xavier)
+        if word[0] == "X":
+            self.add("S")
+            position = 1
+        
+        while position <= self.last and (len(self.primary) < 4 or len(self.secondary) < 4):
+            char = word[position]
+            handler = getattr(self, f"_{char}", None)
+            if char in self.VOWELS:
+                # Only a leading vowel is kept
+                if position == 0:
+                    self.add("A")
+                position += 1
+            elif handler is not None:
+                position = handler(position)
+            else:
+                position += 1
+        return self.primary[:4], self.secondary[:4]
+    
+    def _simple(self, position, code):
+        self.add(code)
+        return position + (2 if self.char(position + 1) == self.word[position] else 1)
+    
+    def _B(self, position):
+        return self._simple(position, "P")
+    
+    def _F(self, position):
+        return self._simple(position, "F")
+    
+    def _K(self, position):
+        return self._simple(position, "K")
+    
+    def _N(self, position):
+        return self._simple(position, "N")
+    
+    def _Q(self, position):
+        return self._simple(position, "K")
+    
+    def _V(self, position):
+        return self._simple(position, "F")
+    
+    def _C(self, position):
+        at, char = self.at, self.char
+        # Various Germanic spellings
+        if (position > 1 and not self.is_vowel(position - 2) and at(position - 1, 3, "ACH")
+                and char(position + 2) != "I"
+                and (char(position + 2) != "E" or at(position - 2, 6, "BACHER", "MACHER"))):
+            self.add("K")
+            return position + 2
+        if position == 0 and at(position, 6, "CAESAR"):
+            self.add("S")
+            return position + 2
+        if at(position, 4, "CHIA"):
+            self.add("K")
+            return position + 2
+        if at(position, 2, "CH"):
+            if position > 0 and at(position, 4, "CHAE"):
+                self.add("K", "X")
+                return position + 2
+            # Greek roots (chemistry, chorus)
+            if (position == 0 and (at(position + 1, 5, "HARAC", "HARIS") or at(position + 1, 3, "HOR", "HYM", "HIA", "HEM"))
+                    and not at(0, 5, "CHORE")):
+                self.add("K")
+                return position + 2
+            if (at(0, 4, "VAN ", "VON ") or at(0, 3, "SCH") or at(position - 2, 6, "ORCHES", "ARCHIT", "ORCHID")
+                    or at(position + 2, 1, "T", "S")
+                    or ((at(position - 1, 1, "A", "O", "U", "E") or position == 0)
+                        and at(position + 2, 1, "L", "R", "N", "M", "B", "H", "F", "V", "W", " "))):
+                self.add("K")
+            elif position > 0:
+                if at(0, 2, "MC"):
+                    self.add("K")
+                else:
+                    self.add("X", "K")
+            else:
+                self.add("X")
+            return position + 2
+        if at(position, 2, "CZ") and not at(position - 2, 4, "WICZ"):
+            self.add("S", "X")
+            return position + 2
+        if at(position + 1, 3, "CIA"):
+            self.add("X")
+            return position + 3
+        if at(position, 2, "CC") and not (position == 1 and self.word[0] == "M"):
+            if at(position + 2, 1, "I", "E", "H") and not at(position + 2, 2, "HU"):
+                if (position == 1 and self.word[0] == "A") or at(position - 1, 5, "UCCEE", "UCCES"):
+                    self.add("KS")
+                else:
+                    self.add("X")
+                return position + 3
+            self.add("K")
+            return position + 2
+        if at(position, 2, "CK", "CG", "CQ"):
+            self.add("K")
+            return position + 2
+        if at(position, 2, "CI", "CE", "CY"):
+            if at(position, 3, "CIO", "CIE", "CIA"):
+                self.add("S", "X")
+            else:
+                self.add("S")
+            return position + 2
+        self.add("K")
+        if at(position + 1, 1, "C", "K", "Q") and not at(position + 1, 2, "CE", "CI"):
+            return position + 2
+        return position + 1
+    
+    def _D(self, position):
+        if self.at(position, 2, "DG"):
+            if self.at(position + 2, 1, "I", "E", "Y"):
+                self.add("J")
+                return position + 3
+            self.add("TK")
+            return position + 2
+        self.add("T")
+        return position + (2 if self.at(position, 2, "DT", "DD") else 1)
+    
+    def _G(self, position):
+        at, char = self.at, self.char
+        if char(position + 1) == "H":
+            if position > 0 and not self.is_vowel(position - 1):
+                self.add("K")
+                return position + 2
+            if position == 0:
+                self.add("J" if char(position + 2) == "I" else "K")
+                return position + 2
+            # Silent in "bough", "daughter"
+            if ((position > 1 and at(position - 2, 1, "B", "H", "D"))
+                    or (position > 2 and at(position - 3, 1, "B", "H", "D"))
+                    or (position > 3 and at(position - 4, 1, "B", "H"))):
+                return position + 2
+            # "laugh", "tough"
+            if position > 2 and char(position - 1) == "U" and at(position - 3, 1, "C", "G", "L", "R", "T"):
+                self.add("F")
+            elif position > 0 and char(position - 1) != "I":
+                self.add("K")
+            return position + 2
+        if char(position + 1) == "N":
+            if position == 1 and self.is_vowel(0) and not self.slavo_germanic:
+                self.add("KN", "N")
+            elif not at(position + 2, 2, "EY") and char(position + 1) != "Y" and not self.slavo_germanic:
+                self.add("N", "KN")
+            else:
+                self.add("KN")
+            return position + 2
+        if at(position + 1, 2, "LI") and not self.slavo_germanic:
+            self.add("KL", "L")
+            return position + 2
+        if position == 0 and (char(position + 1) == "Y" or at(position + 1, 2, "ES", "EP", "EB", "EL", "EY", "IB", "IL", "IN", "IE", "EI", "ER")):
+            self.add("K", "J")
+            return position + 2
+        if ((at(position + 1, 2, "ER") or char(position + 1) == "Y") and not at(0, 6, "DANGER", "RANGER", "MANGER")
+                and not at(position - 1, 1, "E", "I") and not at(position - 1, 3, "RGY", "OGY")):
+            self.add("K", "J")
+            return position + 2
+        if at(position + 1, 1, "E", "I", "Y") or at(position - 1, 4, "AGGI", "OGGI"):
+            if at(0, 4, "VAN ", "VON ") or at(0, 3, "SCH") or at(position + 1, 2, "ET"):
+                self.add("K")
+            elif at(position + 1, 3, "IER") and position + 3 > self.last:
+                self.add("J")
+            else:
+                self.add("J", "K")
+            return position + 2
+        return self._simple(position, "K")
+    
+    def _H(self, position):
+        # Only kept between vowels or at the start before a vowel
+        if (position == 0 or self.is_vowel(position - 1)) and self.is_vowel(position + 1):
+            self.add("H")
+            return position + 2
+        return position + 1
+    
+    def _J(self, position):
+        at, char = self.at, self.char
+        if at(position, 4, "JOSE") or at(0, 4, "SAN "):
+            if (position == 0 and char(position + 4) == " ") or at(0, 4, "SAN "):
+                self.add("H")
+            else:
+                self.add("J", "H")
+            return position + 1
+        if position == 0:
+            self.add("J", "A")
+        elif self.is_vowel(position - 1) and not self.slavo_germanic and char(position + 1) in ("A", "O"):
+            self.add("J", "H")
+        elif position == self.last:
+            self.add("J", "")
+        elif not at(position + 1, 1, "L", "T", "K", "S", "N", "M", "B", "Z") and not at(position - 1, 1, "S", "K", "L"):
+            self.add("J")
+        return position + (2 if char(position + 1) == "J" else 1)
+    
+    def _L(self, position):
+        at = self.at
+        if self.char(position + 1) == "L":
+            # Spanish "-illo", "-illa"
+            if ((position == self.last - 2 and at(position - 1, 4, "ILLO", "ILLA", "ALLE"))
+                    or ((at(self.last - 1, 2, "AS", "OS") or at(self.last, 1, "A", "O")) and at(position - 1, 4, "ALLE"))):
+                self.add("L", "")
+            else:
+                self.add("L")
+            return position + 2
+        self.add("L")
+        return position + 1
+    
+    def _M(self, position):
+        self.add("M")
+        # "dumb", "thumb"
+        if (self.at(position - 1, 3, "UMB") and (position + 1 == self.last or self.at(position + 2, 2, "ER"))) or self.char(position + 1) == "M":
+            return position + 2
+        return position + 1
+    
+    def _P(self, position):
+        if self.char(position + 1) == "H":
+            self.add("F")
+            return position + 2
+        self.add("P")
+        return position + (2 if self.char(position + 1) in ("P", "B") else 1)
+    
+    def _R(self, position):
+        # French "-ier"
+        if (position == self.last and not self.slavo_germanic and self.at(position - 2, 2, "IE")
+                and not self.at(position - 4, 2, "ME", "MA")):
+            self.add("", "R")
+        else:
+            self.add("R")
+        return position + (2 if self.char(position + 1) == "R" else 1)
+    
+    def _S(self, position):
+        at, char = self.at, self.char
+        # "island", "carlisle"
+        if at(position - 1, 3, "ISL", "YSL"):
+            return position + 1
+        if position == 0 and at(position, 5, "SUGAR"):
+            self.add("X", "S")
+            return position + 1
+        if at(position, 2, "SH"):
+            self.add("S" if at(position + 1, 4, "HEIM", "HOEK", "HOLM", "HOLZ") else "X")
+            return position + 2
+        if at(position, 3, "SIO", "SIA") or at(position, 4, "SIAN"):
+            if self.slavo_germanic:
+                self.add("S")
+            else:
+                self.add("S", "X")
+            return position + 3
+        if (position == 0 and at(position + 1, 1, "M", "N", "L", "W")) or at(position + 1, 1, "Z"):
+            self.add("S", "X")
+            return position + (2 if at(position + 1, 1, "Z") else 1)
+        if at(position, 2, "SC"):
+            if char(position + 2) == "H":
+                if at(position + 3, 2, "OO", "ER", "EN", "UY", "ED", "EM"):
+                    if at(position + 3, 2, "ER", "EN"):
+                        self.add("X", "SK")
+                    else:
+                        self.add("SK")
+                elif position == 0 and not self.is_vowel(3) and char(3) != "W":
+                    self.add("X", "S")
+                else:
+                    self.add("X")
+                return position + 3
+            if at(position + 2, 1, "I", "E", "Y"):
+                self.add("S")
+            else:
+                self.add("SK")
+            return position + 3
+        # French "-ais", "-ois"
+        if position == self.last and at(position - 2, 2, "AI", "OI"):
+            self.add("", "S")
+        else:
+            self.add("S")
+        return position + (2 if at(position + 1, 1, "S", "Z") else 1)
+    
+    def _T(self, position):
+        at = self.at
+        if at(position, 4, "TION"):
+            self.add("X")
+            return position + 3
+        if at(position, 3, "TIA", "TCH"):
+            self.add("X")
+            return position + 3
+        if at(position, 2, "TH") or at(position, 3, "TTH"):
+            if at(position + 2, 2, "OM", "AM") or at(0, 4, "VAN ", "VON ") or at(0, 3, "SCH"):
+                self.add("T")
+            else:
+                self.add("0", "T")
+            return position + 2
+        self.add("T")
+        return position + (2 if at(position + 1, 1, "T", "D") else 1)
+    
+    def _W(self, position):
+        at = self.at
+        if at(position, 2, "WR"):
+            self.add("R")
+            return position + 2
+        if position == 0 and (self.is_vowel(position + 1) or at(position, 2, "WH")):
+            if self.is_vowel(position + 1):
+                self.add("A", "F")
+            else:
+                self.add("A")
+        # Polish "-ewski", or a silent final W
+        if (position == self.last and self.is_vowel(position - 1)) or at(position - 1, 5, "EWSKI", "EWSKY", "OWSKI", "OWSKY") or at(0, 3, "SCH"):
+            self.add("", "F")
+            return position + 1
+        if at(position, 4, "WICZ", "WITZ"):
+            self.add("TS", "FX")
+            return position + 4
+        return position + 1
+    
+    def _X(self, position):
+        # French "-eaux", "-oux"
+        if not (position == self.last and (self.at(position - 3, 3, "IAU", "EAU") or self.at(position - 2, 2, "AU", "OU"))):
+            self.add("KS")
+        return position + (2 if self.at(position + 1, 1, "C", "X") else 1)
+    
+    def _Z(self, position):
+        if self.char(position + 1) == "H":
+            self.add("J")
+            return position + 2
+        if self.at(position + 1, 2, "ZO", "ZI", "ZA") or (self.slavo_germanic and position > 0 and self.char(position - 1) != "T"):
+            self.add("S", "TS")
+        else:
+            self.add("S")
+        return position + (2 if self.char(position + 1) == "Z" else 1)
+
+class PhoneticIndex:
+    """Read-only, memory-mapped index from phonetic keys to words"""
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.word_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a phonetic index")
+        self._tables = {
+            algorithm: TABLE.unpack_from(self._mmap, HEADER.size + i * TABLE.size)
+            for i, algorithm in enumerate(ALGORITHMS)
+        }
+        self._words_offset = HEADER.size + len(ALGORITHMS) * TABLE.size
+    
+    def words_for_key(self, key, algorithm="metaphone"):
+        """
+        Words with a given phonetic key
+        
+        Args:
+            key (str): Key from soundex() or double_metaphone()
+            algorithm (str): Algorithm the key came from
+        
+        Returns:
+            list: Matching words, most common first
+        """
+        slot_count, slots_offset, postings_offset = self._tables[algorithm]
+        code = _key_code(key)
+        if not code or not slot_count:
+            return []
+        
+        slot = code % slot_count
+        while True:
+            slot_code, first, count = SLOT.unpack_from(self._mmap, slots_offset + slot * SLOT.size)
+            if slot_code == code:
+                word_ids = struct.unpack_from(f"<{count}I", self._mmap, postings_offset + first * 4)
+                return [self._word(word_id) for word_id in word_ids]
+            if not slot_code:
+                return []
+            slot = (slot + 1) % slot_count
+    
+    def sound_alikes(self, word, algorithm="metaphone"):
+        """
+        Words that sound like a word (excluding the word itself)
+        
+        Args:
+            word (str): Word to match
+            algorithm (str): "soundex" or "metaphone"
+        
+        Returns:
+            list: Matching words, most common first for each key
+        """
+        word = word.lower()
+        matches = {}
+        for key in phonetic_keys(word, algorithm):
+            for match in self.words_for_key(key, algorithm):
+                if match != word:
+                    matches[match] = None
+        return list(matches)
+    
+    def __contains__(self, word):
+        word = word.lower()
+        return any(word in self.words_for_key(key) for key in phonetic_keys(word))
+    
+    def _word(self, word_id):
+        start, end = struct.unpack_from("<II", self._mmap, self._words_offset + word_id * 4)
+        blob = self._words_offset + (self.word_count + 1) * 4
+        return self._mmap[blob + start:blob + end].decode("utf-8")
+    
+    def close(self):
+        self._mmap.close()
+
+def get_phonetic_index():
+    """
+    Get the sound-alike index at PHONETIC_INDEX_PATH (mapped on first use)
+    
+    The index is (re)built from WORD_LIST_PATH first if it is missing or
+    older than the word list.
+    
+    Returns:
+        PhoneticIndex: The index, or None if it cannot be loaded or built
+    """
+    global _index
+    
+    with _index_lock:
+        if _index is None:
+            try:
+                if _index_is_stale():
+                    with open(WORD_LIST_PATH, encoding="utf-8") as words:
+                        build_index(words, PHONETIC_INDEX_PATH)
+                _index = PhoneticIndex(PHONETIC_INDEX_PATH)
+            except (OSError, ValueError) as e:
+                print(f"Error loading phonetic index {PHONETIC_INDEX_PATH}: {str(e)}")
+                _index = False
+    return _index or None
+
+def sound_alikes(word, algorithm="metaphone"):
+    """Words from the word list that sound like a word (empty if there is no index)"""
+    index = get_phonetic_index()
+    return index.sound_alikes(word, algorithm) if index else []
+
+def build_index(words, output_path):
+    """
+    Build an index file from a word list
+    
+    Args:
+        words: Iterable of word-list lines, "word" (most common first) or
+            "word count" (ordered by count), as Segmenter.from_lines reads them
+        output_path (str): Index file to write
+    
+    Returns:
+        int: Number of words indexed
+    """
+    counts = {}
+    for rank, line in enumerate(words, 1):
+        fields = line.split()
+        if not fields:
+            continue
+        word = fields[0].lower()
+        if len(word) >= MIN_WORD_LENGTH and word.isalpha() and word.isascii():
+            # Zipf's law for plain lists, as in Segmenter.from_lines
+            count = float(fields[1]) if len(fields) > 1 else 1e6 / rank
+            counts[word] = counts.get(word, 0) + count
+    vocabulary = sorted(counts, key=counts.get, reverse=True)
+    
+    tables = []
+    for algorithm in ALGORITHMS:
+        postings = {}
+        for word_id, word in enumerate(vocabulary):
+            for key in phonetic_keys(word, algorithm):
+                postings.setdefault(_key_code(key), []).append(word_id)
+        tables.append(postings)
+    
+    encoded = [word.encode("utf-8") for word in vocabulary]
+    word_offsets = [0]
+    for word in encoded:
+        word_offsets.append(word_offsets[-1] + len(word))
+    
+    # Sections: header, table directory, word offsets, word bytes, then the
+    # slots and postings of each algorithm
+    position = HEADER.size + len(ALGORITHMS) * TABLE.size + len(word_offsets) * 4 + word_offsets[-1]
+    directory = []
+    sections = []
+    for postings in tables:
+        slot_count = max(1, len(postings) * 2)
+        slots = [(0, 0, 0)] * slot_count
+        flat = []
+        for code, word_ids in postings.items():
+            slot = code % slot_count
+            while slots[slot][0]:
+                slot = (slot + 1) % slot_count
+            slots[slot] = (code, len(flat), len(word_ids))
+            flat.extend(word_ids)
+        slot_bytes = b"".join(SLOT.pack(*slot) for slot in slots)
+        posting_bytes = struct.pack(f"<{len(flat)}I", *flat)
+        directory.append(TABLE.pack(slot_count, position, position + len(slot_bytes)))
+        sections.append(slot_bytes + posting_bytes)
+        position += len(slot_bytes) + len(posting_bytes)
+    
+    # A temp file of its own, so processes building at once can't mix their writes
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(output_path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(vocabulary)))
+            f.write(b"".join(directory))
+            f.write(struct.pack(f"<{len(word_offsets)}I", *word_offsets))
+            f.write(b"".join(encoded))
+            f.write(b"".join(sections))
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return len(vocabulary)
+
+def _index_is_stale():
+    """True if the index is missing or older than the word list it was built from"""
+    if not os.path.exists(PHONETIC_INDEX_PATH):
+        return True
+    try:
+        return os.path.getmtime(WORD_LIST_PATH) > os.path.getmtime(PHONETIC_INDEX_PATH)
+    except OSError:
+        return False  # No word list; keep using the index
+
+def _key_code(key):
+    """Pack a key of up to six characters (0-9, A-Z) into a non-zero integer"""
+    code = 0
+    for char in key[:6]:
+        code = code * 37 + (ord(char) - 47 if char.isdigit() else ord(char) - 54)
+    return code
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the sound-alike word index")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build = commands.add_parser("build", help="Build an index from a word list")
+    build.add_argument("words", help="Word list, one word per line, most common first")
+    build.add_argument("output", help="Index file to write")
+    
+    lookup = commands.add_parser("lookup", help="Show keys and sound-alikes of words")
+    lookup.add_argument("words", nargs="+", help="Words to look up")
+    lookup.add_argument("--index", default=PHONETIC_INDEX_PATH, help="Index file")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "build":
+        with open(args.words, encoding="utf-8") as words:
+            count = build_index(words, args.output)
+        print(f"Indexed {count} words into {args.output}")
+    else:
+        index = PhoneticIndex(args.index)
+        for word in args.words:
+            print(f"{word}: soundex={soundex(word)} metaphone={'/'.join(double_metaphone(word))}")
+            for algorithm in ALGORITHMS:
+                print(f"  {algorithm}: {', '.join(index.sound_alikes(word, algorithm)) or '-'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Token-bucket rate limiting for provider APIs.
+
+Each provider has one bucket that refills at its contracted rate and holds
+up to its burst size. Callers that find the bucket empty wait for their
+turn (blocking or async) instead of failing.
+"""
+import asyncio
+import threading
+import time
+
+from config.settings import PROVIDER_RATE_LIMITS
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    
+    Tokens are reserved up front, so waiting callers are served in arrival
+    order and the long-run rate never exceeds the configured one.
+    """
+    
+    def __init__(self, name, rate, burst):
+        self.name = name
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0}
+    
+    def reserve(self, tokens=1):
+        """
+        Take tokens now and return how long the caller must wait before using them
+        
+        Returns:
+            float: Seconds to wait (0 if the tokens were available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            delay = -self._tokens / self.rate if self._tokens < 0 and self.rate > 0 else 0.0
+            
+            self._stats["acquired"] += 1
+            if delay > 0:
+                self._stats["waited"] += 1
+                self._stats["total_wait"] += delay
+                self._stats["max_wait"] = max(self._stats["max_wait"], delay)
+        return delay
+    
+    def acquire(self, tokens=1):
+        """
+        Block until tokens are available
+        
+        Returns:
+            float: Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+    
+    async def acquire_async(self, tokens=1):
+        """
+        Wait without blocking the event loop until tokens are available
+        
+        Returns:
+            float: Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+    
+    def stats(self):
+        """
+        Get wait-time metrics
+        
+        Returns:
+            dict: acquired, waited, total_wait, max_wait and avg_wait (seconds)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["avg_wait"] = stats["total_wait"] / stats["waited"] if stats["waited"] else 0.0
+        return stats
+
+def get_bucket(provider):
+    """
+    Get the bucket for a provider configured in PROVIDER_RATE_LIMITS
+    
+    Args:
+        provider (str): Provider name (e.g. "godaddy_prod", "whois")
+        
+    Returns:
+        TokenBucket: The provider's bucket, or None if it is not rate limited
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(provider)
+        if bucket is None and provider in PROVIDER_RATE_LIMITS:
+            rate, burst = PROVIDER_RATE_LIMITS[provider]
+            bucket = _buckets[provider] = TokenBucket(provider, rate, burst)
+    return bucket
+
+def register_bucket(bucket):
+    """Make a bucket visible to get_rate_limit_stats() (used by utils.rate_limit)"""
+    with _buckets_lock:
+        _buckets[bucket.name] = bucket
+
+def throttle(provider, tokens=1):
+    """Block until the provider allows another request (no-op if it isn't limited)"""
+    bucket = get_bucket(provider)
+    return bucket.acquire(tokens) if bucket else 0.0
+
+async def throttle_async(provider, tokens=1):
+    """Wait until the provider allows another request (no-op if it isn't limited)"""
+    bucket = get_bucket(provider)
+    return await bucket.acquire_async(tokens) if bucket else 0.0
+
+def get_rate_limit_stats():
+    """
+    Get wait-time metrics for every bucket in use
+    
+    Returns:
+        dict: Maps bucket name to its metrics
+    """
+    with _buckets_lock:
+        buckets = list(_buckets.values())
+    return {bucket.name: bucket.stats() for bucket in buckets}
@@ -0,0 +1,267 @@
+"""
+Offline registered-domain filter built from TLD zone files.
+
+A zone file (or any list of registered names) is streamed into a Bloom
+filter saved on disk. At runtime the file is memory-mapped read-only, so
+it loads instantly and every worker process shares the same pages.
+A name missing from the filter is definitely not in the zone; a name
+found in it is registered, up to the configured false-positive rate.
+
+Build a filter:
+    python -m services.registered_filter build com.zone com.bloom --tld com
+"""
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+from config.settings import REGISTERED_FILTER_PATHS
+
+MAGIC = b"DFBLOOM1"
+HEADER = struct.Struct("!8sQIQ")  # magic, bit count, hash count, inserted names
+MASK64 = (1 << 64) - 1
+
+# Names hashed per NumPy batch while building
+BUILD_BATCH = 1_000_000
+
+# Record fields that may come before the type: a TTL (e.g. "172800" or "2d")
+# or a class. A line starting with one has no owner.
+_TTL = re.compile(r"^(\d+[smhdw]?)+$", re.IGNORECASE)
+_CLASSES = {"IN", "CH", "HS", "CS"}
+
+_filters = None
+_filters_lock = threading.Lock()
+
+class RegisteredFilter:
+    """Read-only, memory-mapped Bloom filter of registered domains"""
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.num_bits, self.num_hashes, self.count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a registered-domain filter")
+    
+    def might_be_registered(self, domain_name, tld):
+        """
+        Check a name against the filter
+        
+        Returns:
+            bool: False if the name is definitely not in the zone, True if it probably is
+        """
+        mm = self._mmap
+        for position in _positions(_domain_key(domain_name, tld), self.num_bits, self.num_hashes):
+            if not mm[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def close(self):
+        self._mmap.close()
+
+def get_registered_filters():
+    """
+    Get the filters listed in REGISTERED_FILTER_PATHS (mapped on first use)
+    
+    Returns:
+        list: RegisteredFilter objects (empty if none are configured)
+    """
+    global _filters
+    
+    with _filters_lock:
+        if _filters is None:
+            _filters = []
+            for path in REGISTERED_FILTER_PATHS:
+                try:
+                    _filters.append(RegisteredFilter(path))
+                except (OSError, ValueError) as e:
+                    print(f"Error loading registered-domain filter {path}: {str(e)}")
+    return _filters
+
+def is_probably_registered(domain_name, tld):
+    """True if any configured filter contains the name"""
+    return any(f.might_be_registered(domain_name, tld) for f in get_registered_filters())
+
+def iter_zone_names(lines, tld=None):
+    """
+    Yield registered domain names from zone-file or plain-list lines
+    
+    Zone files yield the owner of each NS record (relative owners are
+    completed with $ORIGIN). Plain lists yield one name per line, with tld
+    appended when the name has no dot.
+    
+    Args:
+        lines: Iterable of text lines
+        tld (str): TLD for plain lists and zone files without $ORIGIN
+    
+    Yields:
+        str: Lowercase full domain names, consecutive duplicates removed
+    """
+    origin = (tld or "").strip(".").lower()
+    owner = None
+    last = None
+    
+    for line in lines:
+        line = line.split(";", 1)[0]
+        # Continuation records (leading whitespace) reuse the previous owner
+        continuation = line[:1].isspace()
+        line = line.strip()
+        if not line:
+            continue
+        tokens = line.split()
+        
+        if tokens[0].upper() == "$ORIGIN" and len(tokens) > 1:
+            origin = tokens[1].strip(".").lower()
+            continue
+        if tokens[0].startswith("$"):
+            continue
+        
+        if len(tokens) == 1:
+            name = tokens[0].lower()
+        else:
+            # Zone record; continuation lines reuse the previous record's owner
+            fields = tokens
+            if not continuation:
+                leading = 0
+                while leading < min(3, len(tokens)) and _is_ttl_or_class(tokens[leading]):
+                    leading += 1
+                # One or two leading TTL/class fields: the owner is missing (the
+                # line lost its indentation), so the record can't be attributed.
+                # Three means the first is an owner that looks like one ("in 3600 IN NS").
+                if 0 < leading < 3:
+                    continue
+                owner = tokens[0].lower()
+                fields = tokens[1:]
+            
+            # Only delegations (NS records) mark registered names
+            if owner is None or "NS" not in (token.upper() for token in fields[:3]):
+                continue
+            name = owner
+        
+        if name.endswith("."):
+            name = name[:-1]
+        elif origin and (len(tokens) > 1 or "." not in name):
+            name = f"{name}.{origin}"
+        
+        if name != last and name.count(".") >= 1:
+            last = name
+            yield name
+
+def _is_ttl_or_class(token):
+    return bool(_TTL.match(token)) or token.upper() in _CLASSES
+
+def build_filter(names, output_path, capacity, error_rate=0.01):
+    """
+    Stream names into a Bloom filter file
+    
+    Memory use is the bit array (about 1.2 bytes per name at 1% error rate)
+    plus one hashing batch, regardless of how large the input is.
+    
+    Args:
+        names: Iterable of full domain names
+        output_path (str): File to write
+        capacity (int): Expected number of names
+        error_rate (float): Target false-positive rate at capacity
+    
+    Returns:
+        int: Number of names inserted
+    """
+    import numpy as np
+    
+    capacity = max(1, int(capacity))
+    num_bits = max(64, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+    num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+    bits = np.zeros((num_bits + 7) // 8, dtype=np.uint8)
+    
+    count = 0
+    batch = []
+    
+    def flush(batch):
+        h1 = np.fromiter((h for h, _ in batch), dtype=np.uint64, count=len(batch))
+        h2 = np.fromiter((h for _, h in batch), dtype=np.uint64, count=len(batch))
+        for i in range(num_hashes):
+            # uint64 arithmetic wraps exactly like the masked lookup in _positions()
+            positions = (h1 + np.uint64(i) * h2) % np.uint64(num_bits)
+            np.bitwise_or.at(bits, positions >> np.uint64(3), np.left_shift(1, positions & np.uint64(7)).astype(np.uint8))
+    
+    for name in names:
+        batch.append(_hash_pair(name.encode("utf-8")))
+        count += 1
+        if len(batch) >= BUILD_BATCH:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    
+    # A temp file of its own, so processes building at once can't mix their writes
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(output_path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, num_bits, num_hashes, count))
+            bits.tofile(f)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return count
+
+def _domain_key(domain_name, tld):
+    return f"{domain_name}.{tld}".lower().encode("utf-8")
+
+def _hash_pair(key):
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+def _positions(key, num_bits, num_hashes):
+    h1, h2 = _hash_pair(key)
+    for i in range(num_hashes):
+        yield ((h1 + i * h2) & MASK64) % num_bits
+
+def _open_lines(path):
+    return sys.stdin if path == "-" else open(path, encoding="utf-8", errors="replace")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query a registered-domain Bloom filter")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build = commands.add_parser("build", help="Stream a zone file or name list into a filter")
+    build.add_argument("input", help="Zone file or name list ('-' for stdin)")
+    build.add_argument("output", help="Filter file to write")
+    build.add_argument("--tld", help="TLD for plain lists or zone files without $ORIGIN")
+    build.add_argument("--capacity", type=int, help="Expected number of names (counted from the file if omitted)")
+    build.add_argument("--error-rate", type=float, default=0.01, help="False-positive rate (default 0.01)")
+    
+    check = commands.add_parser("check", help="Look names up in a filter")
+    check.add_argument("filter", help="Filter file")
+    check.add_argument("domains", nargs="+", help="Full domain names (e.g. example.com)")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "build":
+        capacity = args.capacity
+        if capacity is None:
+            if args.input == "-":
+                parser.error("--capacity is required when reading from stdin")
+            with _open_lines(args.input) as lines:
+                capacity = sum(1 for _ in iter_zone_names(lines, args.tld))
+        
+        started = time.time()
+        with _open_lines(args.input) as lines:
+            count = build_filter(iter_zone_names(lines, args.tld), args.output, capacity, args.error_rate)
+        print(f"Inserted {count} names into {args.output} in {time.time() - started:.1f}s")
+    else:
+        registered_filter = RegisteredFilter(args.filter)
+        for domain in args.domains:
+            name, _, tld = domain.partition(".")
+            status = "probably registered" if registered_filter.might_be_registered(name, tld) else "not in zone"
+            print(f"{domain}: {status}")
+
+if __name__ == "__main__":
+    main()
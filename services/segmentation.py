@@ -0,0 +1,198 @@
+"""
+Word segmentation for compound domain names.
+
+Splits run-together names into their most probable words ("mithaimagic"
+-> ["mithai", "magic"]) with a unigram language model over WORD_LIST_PATH.
+Dictionary words are found with a trie walk from each position and the
+best split is chosen by dynamic programming; results are memoized.
+
+The word list may hold "word count" lines; plain lists are taken to be in
+frequency order and get Zipf-law counts from their rank.
+"""
+import math
+import re
+import threading
+from functools import lru_cache
+
+from config.settings import WORD_LIST_PATH
+
+# Longest piece of unknown letters considered as one word
+MAX_UNKNOWN_LENGTH = 20
+
+# Log10 probability of an unknown word of length n is UNKNOWN_LOG_PROB - n,
+# so long unknown pieces are much less likely than dictionary words
+UNKNOWN_LOG_PROB = -5.0
+
+# Letters are segmented; digit runs are kept as words and anything else
+# (spaces, hyphens, punctuation) only separates words
+_RUNS = re.compile(r"[a-z]+|[0-9]+")
+
+_END = ""  # Trie key marking the end of a word
+
+_segmenter = None
+_segmenter_lock = threading.Lock()
+
+class Segmenter:
+    """Unigram word segmenter"""
+    
+    def __init__(self, counts):
+        """
+        Args:
+            counts (dict): Maps each dictionary word to its count
+        """
+        total = sum(counts.values()) or 1
+        self.trie = {}
+        self.max_word_length = 0
+        for word, count in counts.items():
+            node = self.trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[_END] = math.log10(count / total)
+            self.max_word_length = max(self.max_word_length, len(word))
+        self.segment_run = lru_cache(maxsize=4096)(self._segment_run)
+    
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        Build a segmenter from word-list lines
+        
+        Args:
+            lines: Iterable of "word" or "word count" lines; plain words are
+                taken to be most common first
+        
+        Returns:
+            Segmenter: The segmenter
+        """
+        counts = {}
+        for rank, line in enumerate(lines, 1):
+            fields = line.split()
+            if not fields or not fields[0].isalpha():
+                continue
+            word = fields[0].lower()
+            # Zipf's law: frequency falls off as 1 / rank
+            count = float(fields[1]) if len(fields) > 1 else 1e6 / rank
+            counts[word] = counts.get(word, 0) + count
+        return cls(counts)
+    
+    def segment(self, text):
+        """
+        Split text into its most probable words
+        
+        Args:
+            text (str): Text such as a domain name or a phrase
+        
+        Returns:
+            list: Words in order (digit runs are kept as words)
+        """
+        words = []
+        for run in _RUNS.findall(text.lower()):
+            if run.isdigit():
+                words.append(run)
+            else:
+                words.extend(self.segment_run(run)[0])
+        return words
+    
+    def score(self, text):
+        """Log10 probability of the best segmentation of a run of letters"""
+        return self.segment_run(text.lower())[1]
+    
+    def log_probability(self, word):
+        """Log10 probability of a dictionary word, or None if it isn't one"""
+        node = self.trie
+        for char in word.lower():
+            node = node.get(char)
+            if node is None:
+                return None
+        return node.get(_END)
+    
+    def __contains__(self, word):
+        return self.log_probability(word) is not None
+    
+    def _segment_run(self, text):
+        """Best (words, log probability) for a run of letters"""
+        length = len(text)
+        # best[i]: (log probability, end of first word) for text[i:]
+        best = [None] * (length + 1)
+        best[length] = (0.0, length)
+        for start in range(length - 1, -1, -1):
+            candidates = []
+            
+            # Dictionary words starting here
+            node = self.trie
+            for end in range(start, min(length, start + self.max_word_length)):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                if _END in node:
+                    candidates.append((node[_END] + best[end + 1][0], end + 1))
+            
+            # Unknown pieces, shorter ones first
+            for end in range(start + 1, min(length, start + MAX_UNKNOWN_LENGTH) + 1):
+                candidates.append((UNKNOWN_LOG_PROB - (end - start) + best[end][0], end))
+            
+            best[start] = max(candidates)
+        
+        words = []
+        position = 0
+        while position < length:
+            end = best[position][1]
+            words.append(text[position:end])
+            position = end
+        return words, best[0][0]
+
+def get_segmenter():
+    """
+    Get the segmenter for WORD_LIST_PATH (built on first use)
+    
+    Returns:
+        Segmenter: The segmenter (with an empty dictionary if the word list is missing)
+    """
+    global _segmenter
+    
+    with _segmenter_lock:
+        if _segmenter is None:
+            try:
+                with open(WORD_LIST_PATH, encoding="utf-8") as lines:
+                    _segmenter = Segmenter.from_lines(lines)
+            except OSError as e:
+                print(f"Error loading word list {WORD_LIST_PATH}: {str(e)}")
+                _segmenter = Segmenter({})
+    return _segmenter
+
+def segment(text):
+    """
+    Split text into its most probable words
+    
+    Args:
+        text (str): Text such as a domain name
+    
+    Returns:
+        list: Words in order, e.g. ["mithai", "magic"] for "mithaimagic"
+    """
+    return get_segmenter().segment(text)
+
+def is_word(word):
+    """True if the word is in the dictionary"""
+    return word in get_segmenter()
+
+def split_compound(word):
+    """
+    Split a run-together word only when it cleanly splits into dictionary words
+    
+    Words in the dictionary, and words whose best split leaves unknown pieces
+    ("delivery" -> "deli" + "very" where "deli" isn't known), are kept whole,
+    so ordinary words aren't broken apart by a small word list.
+    
+    Args:
+        word (str): A single token, e.g. "mithaimagic"
+    
+    Returns:
+        list: The words, e.g. ["mithai", "magic"], or [word]
+    """
+    segmenter = get_segmenter()
+    if not word.isalpha() or word in segmenter:
+        return [word]
+    words = segmenter.segment(word)
+    if len(words) > 1 and all(part in segmenter for part in words):
+        return words
+    return [word]
@@ -1,92 +1,325 @@
 """
 Service for finding similar domain names that are available.
 """
-import random
-import time
-from difflib import SequenceMatcher
-from services.domain_service import check_domain_availability
-from config.settings import AZURE_OPENAI_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_DEPLOYMENT, AZURE_OPENAI_API_VERSION
+import asyncio
+import heapq
+import re
+from itertools import islice
+
+import numpy as np
+
+from services.availability_model import get_availability_model
+from services.domain_service import check_domain_pairs_async
+from services.permutations import MAX_LABEL_LENGTH
+from services.phonetic import get_phonetic_index
+from services.registered_filter import is_probably_registered
+from services.segmentation import segment
+from services.similarity import similarity, similarity_scores
+from services.utils import iterate_sync, run_sync
+from config.settings import AZURE_OPENAI_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_DEPLOYMENT, AZURE_OPENAI_API_VERSION, MAX_CONCURRENT_LOOKUPS, AVAILABILITY_MIN_EXPECTED_VALUE
 
 def find_similar_domains(domain_name, tlds, max_count=15, similarity_threshold=70):
     """
     Find similar domain names that are available.
     
+    Synchronous wrapper around find_similar_domains_async().
+    
     Args:
         domain_name (str): The original domain name to find alternatives for
         tlds (list): List of TLDs to check
         max_count (int): Maximum number of similar domains to return
         similarity_threshold (int): Minimum similarity score (0-100) for suggestions
-        
+    
     Returns:
         list: List of dictionaries with similar domain suggestions
     """
-    print(f"Finding similar domains for '{domain_name}' with TLDs: {tlds}")
+    return run_sync(find_similar_domains_async(domain_name, tlds, max_count, similarity_threshold))
+
+def iter_similar_domains(domain_name, tlds, max_count=15, similarity_threshold=70):
+    """
+    Yield available similar domains as soon as each is confirmed.
+    
+    Synchronous wrapper around iter_similar_domains_async().
+    
+    Args:
+        domain_name (str): The original domain name to find alternatives for
+        tlds (list): List of TLDs to check
+        max_count (int): Maximum number of similar domains to return
+        similarity_threshold (int): Minimum similarity score (0-100) for suggestions
+    
+    Yields:
+        dict: Similar domain suggestion (same items as find_similar_domains, in confirmation order)
+    """
+    return iterate_sync(iter_similar_domains_async(domain_name, tlds, max_count, similarity_threshold))
+
+async def find_similar_domains_async(domain_name, tlds, max_count=15, similarity_threshold=70):
+    """
+    Find similar domain names that are available.
     
-    # First try to generate alternatives using algorithmic method
-    suggestions = generate_alternatives_algorithmic(domain_name, max_count * 3)
-    print(f"Generated {len(suggestions)} algorithmic suggestions")
+    Args:
+        domain_name (str): The original domain name to find alternatives for
+        tlds (list): List of TLDs to check
+        max_count (int): Maximum number of similar domains to return
+        similarity_threshold (int): Minimum similarity score (0-100) for suggestions
     
-    # Calculate similarity scores
+    Returns:
+        list: List of dictionaries with similar domain suggestions
+    """
+    ranked = [item async for item in _iter_ranked_similar_domains(domain_name, tlds, max_count, similarity_threshold)]
+    
+    # Keep similarity order
+    ranked.sort(key=lambda item: item[0])
+    available_suggestions = [suggestion for _, suggestion in ranked]
+    
+    print(f"Found {len(available_suggestions)} available similar domains")
+    return available_suggestions
+
+async def iter_similar_domains_async(domain_name, tlds, max_count=15, similarity_threshold=70):
+    """
+    Yield available similar domains as soon as each is confirmed.
+    
+    Yields exactly the suggestions find_similar_domains_async() returns, but
+    in the order they are confirmed rather than by similarity.
+    
+    Args:
+        domain_name (str): The original domain name to find alternatives for
+        tlds (list): List of TLDs to check
+        max_count (int): Maximum number of similar domains to return
+        similarity_threshold (int): Minimum similarity score (0-100) for suggestions
+    
+    Yields:
+        dict: Similar domain suggestion with name, similarity, tld and price
+    """
+    async for _, suggestion in _iter_ranked_similar_domains(domain_name, tlds, max_count, similarity_threshold):
+        yield suggestion
+
+def _rank_candidates(domain_name, max_count, similarity_threshold):
+    """Generate, score and dedupe candidate names (highest similarity first)"""
+    wanted = max_count * 2
     scored_suggestions = []
-    for suggestion in suggestions:
-        # Skip exact matches or too short suggestions
-        if suggestion == domain_name or len(suggestion) < 3:
-            continue
-            
-        # Calculate similarity score
-        similarity = calculate_similarity(domain_name, suggestion)
-        similarity_percent = int(similarity * 100)
+    generated = 0
+    
+    # Candidates come most similar first, so stop once enough meet the threshold
+    alternatives = iter_alternatives(domain_name)
+    while len(scored_suggestions) < wanted:
+        batch = list(islice(alternatives, wanted))
+        if not batch:
+            break
+        generated += len(batch)
+        
+        # Score the batch at once; ones that cannot reach the threshold are skipped early
+        scores = similarity_scores(domain_name, batch, threshold=similarity_threshold)
         
         # Only include if it meets the threshold
-        if similarity_percent >= similarity_threshold:
-            scored_suggestions.append({
-                "name": suggestion,
-                "similarity": similarity_percent
-            })
+        for suggestion, score in zip(batch, scores.astype(int)):
+            if score >= similarity_threshold:
+                scored_suggestions.append({
+                    "name": suggestion,
+                    "similarity": int(score)
+                })
+    
+    print(f"Generated {generated} algorithmic suggestions")
     
     # Sort by similarity score (highest first)
     scored_suggestions.sort(key=lambda x: x["similarity"], reverse=True)
     print(f"Found {len(scored_suggestions)} suggestions that meet the similarity threshold")
     
-    # Remove duplicates while preserving order
-    unique_suggestions = []
-    unique_names = set()
-    for suggestion in scored_suggestions:
-        if suggestion["name"] not in unique_names:
-            unique_suggestions.append(suggestion)
-            unique_names.add(suggestion["name"])
-    
-    # Limit to max_count unique suggestions
-    unique_suggestions = unique_suggestions[:max_count * 2]
-    print(f"After removing duplicates, have {len(unique_suggestions)} suggestions")
-    
-    # Check availability for each suggested domain
-    available_suggestions = []
-    for suggestion in unique_suggestions:
-        # First check one TLD at a time to avoid checking all TLDs for each suggestion
-        for tld in tlds:
-            # Check availability
-            try:
-                results = check_domain_availability(suggestion["name"], [tld])
-                
-                # If available, add to available suggestions
-                if results and results[0]["available"]:
-                    # Add TLD and price to suggestion
-                    suggestion["tld"] = results[0]["tld"]
-                    suggestion["price"] = results[0]["price"]
-                    available_suggestions.append(suggestion.copy())
-                    
-                    # Stop checking other TLDs once we found an available one
+    # Limit to max_count * 2 suggestions (the generator already dropped duplicates)
+    return scored_suggestions[:wanted]
+
+async def _iter_ranked_similar_domains(domain_name, tlds, max_count, similarity_threshold):
+    """
+    Yield (similarity rank, suggestion) for each available similar domain
+    once it is certain to be among the max_count results
+    """
+    print(f"Finding similar domains for '{domain_name}' with TLDs: {tlds}")
+    unique_suggestions = _rank_candidates(domain_name, max_count, similarity_threshold)
+    tlds = list(dict.fromkeys(tlds))
+    order, skipped = _order_by_expected_value(unique_suggestions, tlds)
+    names = [unique_suggestions[index]["name"] for index in order]
+    
+    async for position, result in _schedule_candidates(names, tlds, max_count, skipped=skipped):
+        index = order[position]
+        yield index, _with_availability(unique_suggestions[index], result)
+
+def _order_by_expected_value(suggestions, tlds):
+    """
+    Order candidates by expected value when an availability model is trained
+    
+    A cell's expected value is the candidate's similarity times the model's
+    P(available) for that TLD. Cells below AVAILABILITY_MIN_EXPECTED_VALUE are
+    skipped, and candidates are ordered by similarity times the chance that
+    one of their remaining TLDs is available.
+    
+    Returns:
+        tuple: (candidate indices in check order, set of (position in that
+        order, TLD position) cells to skip)
+    """
+    model = get_availability_model()
+    if model is None or not suggestions or not tlds:
+        return list(range(len(suggestions))), set()
+    
+    similarities = np.array([suggestion["similarity"] for suggestion in suggestions]) / 100
+    probabilities = model.predict_matrix([suggestion["name"] for suggestion in suggestions], tlds)
+    worth_checking = similarities[:, None] * probabilities >= AVAILABILITY_MIN_EXPECTED_VALUE
+    
+    # Treat the TLDs as independent: P(any available) = 1 - P(all taken)
+    values = similarities * (1 - np.prod(np.where(worth_checking, 1 - probabilities, 1), axis=1))
+    order = np.argsort(-values, kind="stable").tolist()
+    skipped = {
+        (position, int(tld_position))
+        for position, index in enumerate(order)
+        for tld_position in np.flatnonzero(~worth_checking[index])
+    }
+    return order, skipped
+
+async def _schedule_candidates(names, tlds, max_count, max_workers=None, skipped=None):
+    """
+    Check the candidate x TLD matrix concurrently
+    
+    A candidate takes the first TLD (in preference order) that is available.
+    Only candidates that can still be among the first max_count available ones
+    are checked; their remaining TLDs are dropped as soon as a preferred TLD is
+    available, and lookups that can no longer change the outcome are cancelled.
+    
+    Args:
+        names (list): Candidate names, best first
+        tlds (list): TLDs in preference order
+        max_count (int): Number of available candidates wanted
+        max_workers (int): Maximum parallel lookups (defaults to MAX_CONCURRENT_LOOKUPS)
+        skipped (set): (index, position) cells treated as taken without a lookup
+    
+    Yields:
+        tuple: (candidate index, availability dict) once the candidate is
+        certain to be among the first max_count available ones
+    """
+    # answers[index][position]: None until known, then True/False
+    answers = [[None] * len(tlds) for _ in names]
+    results = {}
+    running = {}
+    reported = set()
+    limit = max(1, max_workers or MAX_CONCURRENT_LOOKUPS)
+    
+    # Names in the offline zone filters are taken; never schedule them
+    for index, name in enumerate(names):
+        for position, tld in enumerate(tlds):
+            if is_probably_registered(name, tld):
+                answers[index][position] = False
+    for index, position in skipped or ():
+        answers[index][position] = False
+    
+    async def check(index, position):
+        return (await check_domain_pairs_async([(names[index], tlds[position])]))[0]
+    
+    try:
+        while True:
+            settled, open_cells = _survey(answers, max_count)
+            for index, position in settled:
+                if index not in reported:
+                    reported.add(index)
+                    yield index, results[(index, position)]
+            
+            # Cancel lookups whose answer can no longer matter
+            for task, cell in list(running.items()):
+                if cell not in open_cells:
+                    task.cancel()
+                    del running[task]
+            
+            if not open_cells:
+                break
+            
+            # Start the preferred TLD of every candidate still in the running
+            # first, best candidates first within each TLD
+            for index, position in sorted(open_cells - set(running.values()), key=lambda cell: (cell[1], cell[0])):
+                if len(running) >= limit:
                     break
-            except Exception as e:
-                print(f"Error checking domain {suggestion['name']}.{tld}: {str(e)}")
-        
-        # Stop if we have enough suggestions
-        if len(available_suggestions) >= max_count:
-            break
+                running[asyncio.ensure_future(check(index, position))] = (index, position)
+            
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, position = running.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    print(f"Error checking similar domain {names[index]}.{tlds[position]}: {str(e)}")
+                    answers[index][position] = False
+                    continue
+                answers[index][position] = result["available"]
+                if result["available"]:
+                    results[(index, position)] = result
+    finally:
+        # The consumer may stop early or enough results may already be settled
+        for task in running:
+            task.cancel()
+
+def _survey(answers, max_count):
+    """
+    Work out where the candidate x TLD search stands
     
-    print(f"Found {len(available_suggestions)} available similar domains")
-    return available_suggestions
+    Walks candidates best first, stopping once max_count of them are
+    available or may still turn out available.
+    
+    Returns:
+        tuple: ([(index, position)] of candidates settled as available,
+        set of (index, position) cells that still need checking)
+    """
+    settled = []
+    open_cells = set()
+    ahead = 0
+    for index, row in enumerate(answers):
+        if ahead >= max_count:
+            break
+        unknown = []
+        for position, answer in enumerate(row):
+            if answer:
+                break
+            if answer is None:
+                unknown.append((index, position))
+        else:
+            if not unknown:
+                continue  # Taken with every TLD
+            position = None
+        
+        ahead += 1
+        if unknown:
+            open_cells.update(unknown)
+        else:
+            settled.append((index, position))
+    return settled, open_cells
+
+def _with_availability(suggestion, result):
+    """Copy a scored suggestion and add the TLD and price it is available with"""
+    suggestion = suggestion.copy()
+    suggestion["tld"] = result["tld"]
+    suggestion["price"] = result["price"]
+    return suggestion
+
+# Common prefixes and suffixes for domain names
+PREFIXES = ["my", "the", "get", "try", "go", "best", "top", "pro", "smart", "easy", "e"]
+SUFFIXES = ["hub", "spot", "zone", "app", "site", "web", "now", "pro", "hq", "online", "center", "tech", "place"]
+
+# Similar sounding characters
+VOWEL_REPLACEMENTS = {"a": ["e"], "e": ["a", "i"], "i": ["y", "e"], "o": ["u", "0"], "u": ["oo"]}
+CONSONANT_REPLACEMENTS = {
+    "c": ["k", "s"], "k": ["c"], "s": ["z"], "z": ["s"],
+    "ph": ["f"], "f": ["ph"], "x": ["ks"], "ck": ["k", "c"],
+    "q": ["kw"], "w": ["v"], "v": ["w"], "j": ["g"], "g": ["j"]
+}
+
+# Names that need no cleaning
+_VALID_NAME = re.compile(r"[a-z0-9-]*")
+
+# Words used to join the words of a compound name
+CONNECTING_WORDS = ["my", "and", "the"]
+
+# Synonyms for common words (very simplified)
+COMMON_WORD_SYNONYMS = {
+    "big": ["large", "huge", "mega"],
+    "small": ["tiny", "mini", "little"],
+    "good": ["great", "best", "top"],
+    "fast": ["quick", "rapid", "swift"],
+    "smart": ["clever", "bright", "wise"]
+}
 
 def generate_alternatives_algorithmic(domain_name, count=50):
     """
@@ -95,109 +328,174 @@ def generate_alternatives_algorithmic(domain_name, count=50):
     Args:
         domain_name (str): The original domain name
         count (int): Maximum number of alternatives to generate
-        
+    
     Returns:
-        list: List of similar domain names
+        list: List of similar domain names, most similar first
+    """
+    return list(islice(iter_alternatives(domain_name), count))
+
+def iter_alternatives(domain_name):
     """
-    suggestions = []
+    Lazily generate similar domain name alternatives, most similar first
     
-    # Common prefixes and suffixes for domain names
-    prefixes = ["my", "the", "get", "try", "go", "best", "top", "pro", "smart", "easy", "e"]
-    suffixes = ["hub", "spot", "zone", "app", "site", "web", "now", "pro", "hq", "online", "center", "tech", "place"]
+    Each mutation strategy yields its candidates in descending expected
+    similarity and the strategies are merged through a priority queue, so
+    only as many candidates are built as the caller consumes.
     
-    # 1. Add/change prefix
-    for prefix in prefixes:
-        if not domain_name.startswith(prefix):
-            suggestions.append(f"{prefix}{domain_name}")
+    Args:
+        domain_name (str): The original domain name
     
-    # 2. Add/change suffix
+    Yields:
+        str: Cleaned, unique alternative names
+    """
+    strategies = [
+        _prefix_alternatives(domain_name),
+        _suffix_alternatives(domain_name),
+        _vowel_alternatives(domain_name),
+        _consonant_alternatives(domain_name),
+        _double_letter_alternatives(domain_name),
+        _split_alternatives(domain_name),
+        _synonym_alternatives(domain_name),
+        _number_alternatives(domain_name),
+        _phonetic_alternatives(domain_name)
+    ]
+    
+    seen = {domain_name}
+    for _, suggestion in heapq.merge(*strategies, key=lambda item: -item[0]):
+        # Remove any invalid characters
+        if not _VALID_NAME.fullmatch(suggestion):
+            suggestion = ''.join(c for c in suggestion if c.isalnum() or c == '-')
+        
+        # Skip if too short, too long for a DNS label or duplicated
+        if 3 <= len(suggestion) <= MAX_LABEL_LENGTH and suggestion not in seen:
+            seen.add(suggestion)
+            yield suggestion
+
+def _expected_similarity(length, removed, added):
+    """
+    Similarity (indel ratio) after removing and adding characters
+    
+    The untouched characters are still a common subsequence, so the real
+    score is never lower than this.
+    """
+    total = 2 * length - removed + added
+    return 2 * (length - removed) / total if total else 1.0
+
+def _prefix_alternatives(domain_name):
+    """1. Add/change prefix"""
+    prefixes = sorted((prefix for prefix in PREFIXES if not domain_name.startswith(prefix)), key=len)
+    for prefix in prefixes:
+        yield _expected_similarity(len(domain_name), 0, len(prefix)), f"{prefix}{domain_name}"
+
+def _suffix_alternatives(domain_name):
+    """2. Add/change suffix"""
+    suffixes = sorted((suffix for suffix in SUFFIXES if not domain_name.endswith(suffix)), key=len)
     for suffix in suffixes:
-        if not domain_name.endswith(suffix):
-            suggestions.append(f"{domain_name}{suffix}")
-    
-    # 3. Remove vowels or replace with similar sounding characters
-    vowels = "aeiou"
-    vowel_replacements = {"a": ["e"], "e": ["a", "i"], "i": ["y", "e"], "o": ["u", "0"], "u": ["oo"]}
-    
-    for i in range(len(domain_name)):
-        if domain_name[i] in vowels:
-            # Try removing the vowel if it wouldn't make the domain too short
-            if len(domain_name) > 4:
-                new_name = domain_name[:i] + domain_name[i+1:]
-                suggestions.append(new_name)
-            
-            # Try replacing the vowel
-            for replacement in vowel_replacements.get(domain_name[i], []):
-                new_name = domain_name[:i] + replacement + domain_name[i+1:]
-                suggestions.append(new_name)
-    
-    # 4. Replace similar sounding consonants
-    consonant_replacements = {
-        "c": ["k", "s"], "k": ["c"], "s": ["z"], "z": ["s"],
-        "ph": ["f"], "f": ["ph"], "x": ["ks"], "ck": ["k", "c"],
-        "q": ["kw"], "w": ["v"], "v": ["w"], "j": ["g"], "g": ["j"]
-    }
+        yield _expected_similarity(len(domain_name), 0, len(suffix)), f"{domain_name}{suffix}"
+
+def _vowel_alternatives(domain_name):
+    """3. Remove vowels or replace with similar sounding characters"""
+    vowel_positions = [i for i, char in enumerate(domain_name) if char in VOWEL_REPLACEMENTS]
+    
+    # Try removing the vowel if it wouldn't make the domain too short
+    if len(domain_name) > 4:
+        score = _expected_similarity(len(domain_name), 1, 0)
+        for i in vowel_positions:
+            yield score, domain_name[:i] + domain_name[i+1:]
     
-    for old, replacements in consonant_replacements.items():
-        if old in domain_name:
+    # Try replacing the vowel, shorter replacements first
+    for length in sorted({len(r) for replacements in VOWEL_REPLACEMENTS.values() for r in replacements}):
+        score = _expected_similarity(len(domain_name), 1, length)
+        for i in vowel_positions:
+            for replacement in VOWEL_REPLACEMENTS[domain_name[i]]:
+                if len(replacement) == length:
+                    yield score, domain_name[:i] + replacement + domain_name[i+1:]
+
+def _consonant_alternatives(domain_name):
+    """4. Replace similar sounding consonants"""
+    alternatives = []
+    for old, replacements in CONSONANT_REPLACEMENTS.items():
+        occurrences = domain_name.count(old)
+        if occurrences:
             for new in replacements:
-                suggestions.append(domain_name.replace(old, new))
+                score = _expected_similarity(len(domain_name), occurrences * len(old), occurrences * len(new))
+                alternatives.append((score, domain_name.replace(old, new)))
     
-    # 5. Add/remove double letters
+    alternatives.sort(key=lambda item: -item[0])
+    return iter(alternatives)
+
+def _double_letter_alternatives(domain_name):
+    """5. Add/remove double letters"""
+    # Doubling a letter only adds one, which keeps more of the name than removing one
     for i in range(len(domain_name) - 1):
-        # Double a letter
         if domain_name[i] != domain_name[i+1]:
-            new_name = domain_name[:i+1] + domain_name[i] + domain_name[i+1:]
-            suggestions.append(new_name)
-        
-        # Remove a double letter
-        if domain_name[i] == domain_name[i+1]:
-            new_name = domain_name[:i] + domain_name[i+1:]
-            suggestions.append(new_name)
-    
-    # 6. Mixed case alternatives (camelCase, etc.)
-    if len(domain_name) > 5:
-        for i in range(1, len(domain_name) - 1):
-            # Try splitting at this position
-            first_part = domain_name[:i]
-            second_part = domain_name[i:]
-            
-            # Combine with common connecting words
-            suggestions.append(f"{first_part}and{second_part}")
-            suggestions.append(f"{first_part}my{second_part}")
-            suggestions.append(f"{first_part}the{second_part}")
-    
-    # 7. Synonyms for common words (very simplified)
-    common_word_synonyms = {
-        "big": ["large", "huge", "mega"],
-        "small": ["tiny", "mini", "little"],
-        "good": ["great", "best", "top"],
-        "fast": ["quick", "rapid", "swift"],
-        "smart": ["clever", "bright", "wise"]
-    }
+            yield _expected_similarity(len(domain_name), 0, 1), domain_name[:i+1] + domain_name[i] + domain_name[i+1:]
     
-    for word, synonyms in common_word_synonyms.items():
-        if word in domain_name:
-            for synonym in synonyms:
-                suggestions.append(domain_name.replace(word, synonym))
+    # Removing any letter of a run gives the same name, so only try the first
+    for i in range(len(domain_name) - 1):
+        if domain_name[i] == domain_name[i+1] and (i == 0 or domain_name[i-1] != domain_name[i]):
+            yield _expected_similarity(len(domain_name), 1, 0), domain_name[:i] + domain_name[i+1:]
+
+def _split_alternatives(domain_name):
+    """6. Join the words of the name with a connecting word"""
+    boundaries = [start for start, _ in _word_spans(domain_name)[1:]]
+    for word in sorted(CONNECTING_WORDS, key=len):
+        score = _expected_similarity(len(domain_name), 0, len(word))
+        for i in boundaries:
+            # Don't double up connectors ("myandcake")
+            if domain_name[:i].endswith(word) or domain_name[i:].startswith(word):
+                continue
+            yield score, f"{domain_name[:i]}{word}{domain_name[i:]}"
+
+def _synonym_alternatives(domain_name):
+    """7. Synonyms for common words"""
+    alternatives = []
+    for start, end in _word_spans(domain_name):
+        word = domain_name[start:end]
+        for synonym in COMMON_WORD_SYNONYMS.get(word, []):
+            score = _expected_similarity(len(domain_name), len(word), len(synonym))
+            alternatives.append((score, domain_name[:start] + synonym + domain_name[end:]))
     
-    # 8. Add numbers at the end
+    alternatives.sort(key=lambda item: -item[0])
+    return iter(alternatives)
+
+def _number_alternatives(domain_name):
+    """8. Add numbers at the end"""
     for i in range(1, 10):
-        suggestions.append(f"{domain_name}{i}")
+        yield _expected_similarity(len(domain_name), 0, 1), f"{domain_name}{i}"
+
+def _phonetic_alternatives(domain_name):
+    """9. Swap the name, or one of its words, for sound-alike words"""
+    index = get_phonetic_index()
+    if index is None:
+        return iter(())
     
-    # Filter and prepare the final list
-    cleaned_suggestions = []
-    for suggestion in suggestions:
-        # Remove any invalid characters
-        clean_suggestion = ''.join(c for c in suggestion if c.isalnum() or c == '-')
-        
-        # Skip if too short or duplicated
-        if len(clean_suggestion) >= 3 and clean_suggestion != domain_name and clean_suggestion not in cleaned_suggestions:
-            cleaned_suggestions.append(clean_suggestion)
+    alternatives = {alike: None for alike in index.sound_alikes(domain_name)}
+    spans = _word_spans(domain_name)
+    if len(spans) > 1:
+        for start, end in spans:
+            word = domain_name[start:end]
+            if word in index:
+                alternatives.update((domain_name[:start] + alike + domain_name[end:], None) for alike in index.sound_alikes(word))
+    
+    scored = [(similarity(domain_name, alternative), alternative) for alternative in alternatives]
+    scored.sort(key=lambda item: -item[0])
+    return iter(scored)
+
+def _word_spans(domain_name):
+    """
+    (start, end) positions of the words in a compound name
     
-    # Randomize and limit to count
-    random.shuffle(cleaned_suggestions)
-    return cleaned_suggestions[:count]
+    Digit runs count as words; hyphens only separate them.
+    """
+    spans = []
+    lowered = domain_name.lower()
+    position = 0
+    for word in segment(lowered):
+        start = lowered.index(word, position)
+        position = start + len(word)
+        spans.append((start, position))
+    return spans
 
 def calculate_similarity(str1, str2):
     """
@@ -206,9 +504,9 @@ def calculate_similarity(str1, str2):
     Args:
         str1 (str): First string
         str2 (str): Second string
-        
+    
     Returns:
         float: Similarity score between 0 and 1
     """
-    # Use SequenceMatcher for a good balance of speed and accuracy
-    return SequenceMatcher(None, str1, str2).ratio()
\ No newline at end of file
+    # Same 0-1 scale as difflib's SequenceMatcher ratio, computed exactly
+    return similarity(str1, str2)
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""
+String similarity scoring for domain name suggestions.
+
+Scores are on the same 0-1 scale as difflib's SequenceMatcher.ratio():
+
+- indel: 2 * LCS / (len1 + len2), the exact form of SequenceMatcher's
+  ratio (which approximates the LCS with a greedy block search)
+- levenshtein: 1 - edit distance / longer length
+- damerau: as levenshtein, but an adjacent transposition costs one edit
+  (optimal string alignment distance)
+- jaro_winkler: Jaro similarity with Winkler's common-prefix boost
+
+Single pairs use bit-parallel algorithms (Myers/Hyyrö) on Python integers.
+Batches are first narrowed with cheap upper bounds from the lengths and
+character histograms, then scored with NumPy one query character at a
+time across every remaining candidate.
+"""
+import numpy as np
+
+METRICS = ("indel", "levenshtein", "damerau", "jaro_winkler")
+DEFAULT_METRIC = "indel"
+
+# Below this many candidates the per-pair bit-parallel code is faster
+NUMPY_MIN_BATCH = 32
+
+# Winkler prefix boost
+_PREFIX_SCALE = 0.1
+_MAX_PREFIX = 4
+
+# Histogram buckets: a-z, 0-9, "-" and one bucket for everything else.
+# Merging characters can only raise the overlap, so bounds stay valid.
+_BUCKETS = np.full(128, 37, dtype=np.intp)
+_BUCKETS[ord("a"):ord("z") + 1] = np.arange(26)
+_BUCKETS[ord("0"):ord("9") + 1] = np.arange(26, 36)
+_BUCKETS[ord("-")] = 36
+_BUCKET_COUNT = 38
+
+# Guards float comparisons of bounds against thresholds
+_EPSILON = 1e-9
+
+def similarity(str1, str2, metric=DEFAULT_METRIC):
+    """
+    Calculate string similarity between 0 and 1
+    
+    Args:
+        str1 (str): First string
+        str2 (str): Second string
+        metric (str): One of METRICS
+    
+    Returns:
+        float: Similarity score between 0 and 1
+    """
+    if metric == "indel":
+        total = len(str1) + len(str2)
+        return 2.0 * lcs_length(str1, str2) / total if total else 1.0
+    if metric in ("levenshtein", "damerau"):
+        longest = max(len(str1), len(str2))
+        if not longest:
+            return 1.0
+        distance = damerau_distance(str1, str2) if metric == "damerau" else levenshtein_distance(str1, str2)
+        return 1.0 - distance / longest
+    if metric == "jaro_winkler":
+        return jaro_winkler(str1, str2)
+    raise ValueError(f"Unknown similarity metric: {metric}")
+
+def similarity_scores(query, candidates, metric=DEFAULT_METRIC, threshold=0):
+    """
+    Score one query against many candidates
+    
+    Candidates whose upper bound is below the threshold are rejected before
+    the full computation and score 0.
+    
+    Args:
+        query (str): String to compare against
+        candidates (list): Candidate strings
+        metric (str): One of METRICS
+        threshold (float): Minimum score of interest (0-100)
+    
+    Returns:
+        numpy.ndarray: Float scores (0-100), one per candidate
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown similarity metric: {metric}")
+    
+    scores = np.zeros(len(candidates))
+    if not len(candidates):
+        return scores
+    
+    codes, lengths = _encode(candidates)
+    query_codes = np.array([ord(c) for c in query], dtype=np.int32)
+    survivors = np.arange(len(candidates))
+    
+    if threshold > 0:
+        # Length ratio: needs nothing but the lengths
+        keep = _upper_bound(metric, len(query), lengths, np.minimum(len(query), lengths)) * 100 + _EPSILON >= threshold
+        survivors = survivors[keep]
+        
+        # Character histograms: at most the shared characters can match
+        if len(survivors):
+            overlap = np.minimum(_histograms(codes[survivors]), _histograms(query_codes[None, :])).sum(axis=1)
+            keep = _upper_bound(metric, len(query), lengths[survivors], overlap) * 100 + _EPSILON >= threshold
+            survivors = survivors[keep]
+    
+    if not len(survivors):
+        return scores
+    
+    if not query or len(survivors) < NUMPY_MIN_BATCH:
+        scores[survivors] = [similarity(query, candidates[index], metric) * 100 for index in survivors]
+        return scores
+    
+    survivor_lengths = lengths[survivors]
+    survivor_codes = codes[survivors, :max(1, survivor_lengths.max())]
+    if metric == "jaro_winkler":
+        scores[survivors] = 100.0 * _jaro_winkler_numpy(query_codes, survivor_codes, survivor_lengths)
+    elif metric == "indel":
+        total = len(query) + survivor_lengths
+        common = _lcs_numpy(query_codes, survivor_codes, survivor_lengths)
+        scores[survivors] = np.where(total > 0, 200.0 * common / np.maximum(total, 1), 100.0)
+    else:
+        longest = np.maximum(len(query), survivor_lengths)
+        distance = _edit_distance_numpy(query_codes, survivor_codes, survivor_lengths, metric == "damerau")
+        scores[survivors] = np.where(longest > 0, 100.0 * (1.0 - distance / np.maximum(longest, 1)), 100.0)
+    return scores
+
+def lcs_length(str1, str2):
+    """
+    Length of the longest common subsequence (bit-parallel)
+    
+    Args:
+        str1 (str): First string
+        str2 (str): Second string
+    
+    Returns:
+        int: LCS length
+    """
+    if not str1 or not str2:
+        return 0
+    mask = (1 << len(str1)) - 1
+    match = _match_masks(str1)
+    row = mask
+    for char in str2:
+        common = row & match.get(char, 0)
+        row = ((row + common) | (row - common)) & mask
+    return len(str1) - bin(row).count("1")
+
+def levenshtein_distance(str1, str2):
+    """
+    Levenshtein edit distance (Myers' bit-parallel algorithm)
+    
+    Args:
+        str1 (str): First string
+        str2 (str): Second string
+    
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions
+    """
+    return _bit_parallel_distance(str1, str2, False)
+
+def damerau_distance(str1, str2):
+    """
+    Optimal string alignment distance (Hyyrö's bit-parallel algorithm)
+    
+    Like Levenshtein, but swapping two adjacent characters is one edit.
+    
+    Args:
+        str1 (str): First string
+        str2 (str): Second string
+    
+    Returns:
+        int: Minimum number of edits, counting adjacent transpositions
+    """
+    return _bit_parallel_distance(str1, str2, True)
+
+def jaro_winkler(str1, str2):
+    """
+    Jaro-Winkler similarity
+    
+    Args:
+        str1 (str): First string
+        str2 (str): Second string
+    
+    Returns:
+        float: Similarity score between 0 and 1
+    """
+    if str1 == str2:
+        return 1.0
+    if not str1 or not str2:
+        return 0.0
+    
+    window = max(0, max(len(str1), len(str2)) // 2 - 1)
+    used = [False] * len(str2)
+    matched1 = []
+    for i, char in enumerate(str1):
+        for j in range(max(0, i - window), min(len(str2), i + window + 1)):
+            if not used[j] and str2[j] == char:
+                used[j] = True
+                matched1.append(char)
+                break
+    
+    matches = len(matched1)
+    if not matches:
+        return 0.0
+    
+    matched2 = [char for char, hit in zip(str2, used) if hit]
+    transpositions = sum(a != b for a, b in zip(matched1, matched2)) // 2
+    jaro = (matches / len(str1) + matches / len(str2) + (matches - transpositions) / matches) / 3
+    
+    prefix = 0
+    for a, b in zip(str1[:_MAX_PREFIX], str2[:_MAX_PREFIX]):
+        if a != b:
+            break
+        prefix += 1
+    return jaro + prefix * _PREFIX_SCALE * (1 - jaro)
+
+def _match_masks(text):
+    """Map each character to the bit mask of its positions in text"""
+    masks = {}
+    for position, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+def _bit_parallel_distance(str1, str2, transpositions):
+    """Myers/Hyyrö edit distance, optionally with adjacent transpositions"""
+    if not str1:
+        return len(str2)
+    if not str2:
+        return len(str1)
+    
+    mask = (1 << len(str1)) - 1
+    last = 1 << (len(str1) - 1)
+    match = _match_masks(str1)
+    positive, negative = mask, 0
+    previous_diagonal, previous_match = 0, 0
+    distance = len(str1)
+    
+    for char in str2:
+        current = match.get(char, 0)
+        diagonal = (((current & positive) + positive) ^ positive) | current | negative
+        if transpositions:
+            diagonal |= ((~previous_diagonal & current) << 1) & previous_match
+            previous_diagonal, previous_match = diagonal, current
+        horizontal_positive = (negative | ~(diagonal | positive)) & mask
+        horizontal_negative = diagonal & positive
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+        shifted = ((horizontal_positive << 1) | 1) & mask
+        negative = shifted & diagonal
+        positive = ((horizontal_negative << 1) | ~(shifted | diagonal)) & mask
+    return distance
+
+def _encode(strings):
+    """Code points as a padded (n, longest) matrix, padding with -1"""
+    lengths = np.fromiter(map(len, strings), dtype=np.intp, count=len(strings))
+    codes = np.full((len(strings), max(1, lengths.max())), -1, dtype=np.int32)
+    flat = np.frombuffer("".join(strings).encode("utf-32-le"), dtype=np.uint32).astype(np.int32)
+    rows = np.repeat(np.arange(len(strings)), lengths)
+    columns = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    codes[rows, columns] = flat
+    return codes, lengths
+
+def _histograms(codes):
+    """Character bucket counts for each row of a padded code matrix"""
+    valid = codes >= 0
+    buckets = np.where(codes < len(_BUCKETS), _BUCKETS[np.clip(codes, 0, len(_BUCKETS) - 1)], _BUCKET_COUNT - 1)
+    cells = np.arange(len(codes))[:, None] * _BUCKET_COUNT + buckets
+    return np.bincount(cells[valid], minlength=len(codes) * _BUCKET_COUNT).reshape(len(codes), _BUCKET_COUNT)
+
+def _upper_bound(metric, query_length, lengths, matches):
+    """Best possible score (0-1) when at most `matches` characters can match"""
+    lengths = lengths.astype(float)
+    if metric == "indel":
+        total = query_length + lengths
+        return np.where(total > 0, 2.0 * matches / np.maximum(total, 1), 1.0)
+    if metric in ("levenshtein", "damerau"):
+        longest = np.maximum(query_length, lengths)
+        return np.where(longest > 0, matches / np.maximum(longest, 1), 1.0)
+    # Jaro with every possible match and no transpositions, then the full prefix boost
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jaro = np.where(
+            (query_length > 0) & (lengths > 0),
+            (matches / max(query_length, 1) + matches / np.maximum(lengths, 1) + (matches > 0)) / 3,
+            (query_length == lengths).astype(float)
+        )
+    return jaro + _MAX_PREFIX * _PREFIX_SCALE * (1 - jaro)
+
+def _lcs_numpy(query_codes, codes, lengths):
+    """LCS lengths of the query against each row, one query character per step"""
+    row = np.zeros((len(codes), codes.shape[1] + 1), dtype=np.intp)
+    for char in query_codes:
+        # L[i][j] = max(L[i-1][j], L[i-1][j-1] + match, L[i][j-1]); the last
+        # term is a running maximum along the row
+        step = row.copy()
+        np.maximum(step[:, 1:], row[:, :-1] + (codes == char), out=step[:, 1:])
+        row = np.maximum.accumulate(step, axis=1)
+    return row[np.arange(len(codes)), lengths]
+
+def _edit_distance_numpy(query_codes, codes, lengths, transpositions):
+    """Edit distances of the query against each row, one query character per step"""
+    columns = np.arange(codes.shape[1] + 1)
+    row = np.broadcast_to(columns, (len(codes), len(columns))).copy()
+    previous_row = None
+    for i, char in enumerate(query_codes, 1):
+        step = np.empty_like(row)
+        step[:, 0] = i
+        step[:, 1:] = np.minimum(row[:, 1:] + 1, row[:, :-1] + (codes != char))
+        if transpositions and i > 1:
+            # a[i-1] == b[j-2] and a[i-2] == b[j-1]
+            swapped = (codes[:, :-1] == char) & (codes[:, 1:] == query_codes[i - 2])
+            np.minimum(step[:, 2:], np.where(swapped, previous_row[:, :-2] + 1, step[:, 2:]), out=step[:, 2:])
+        # D[i][j] = min(step[j], D[i][j-1] + 1) = j + running min of (step[k] - k)
+        previous_row, row = row, np.minimum.accumulate(step - columns, axis=1) + columns
+    return row[np.arange(len(codes)), lengths]
+
+def _jaro_winkler_numpy(query_codes, codes, lengths):
+    """Jaro-Winkler similarity of the query against each row"""
+    count, width = codes.shape
+    rows = np.arange(count)
+    columns = np.arange(width)
+    window = np.maximum(0, np.maximum(len(query_codes), lengths) // 2 - 1)[:, None]
+    
+    # Each query character takes the first unused equal character in its window
+    used = np.zeros(codes.shape, dtype=bool)
+    query_matched = np.zeros((count, len(query_codes)), dtype=bool)
+    for i, char in enumerate(query_codes):
+        candidates = (codes == char) & ~used & (np.abs(columns - i) <= window)
+        first = candidates.argmax(axis=1)
+        hit = candidates[rows, first]
+        used[rows[hit], first[hit]] = True
+        query_matched[:, i] = hit
+    
+    matches = used.sum(axis=1)
+    
+    # Half the matched characters that appear in a different order
+    slots = min(len(query_codes), width)
+    query_order = np.full((count, slots), -1, dtype=np.int32)
+    rank = np.cumsum(query_matched, axis=1) - 1
+    hit_rows, hit_positions = np.nonzero(query_matched)
+    query_order[hit_rows, rank[hit_rows, hit_positions]] = query_codes[hit_positions]
+    candidate_order = np.full((count, slots), -1, dtype=np.int32)
+    rank = np.cumsum(used, axis=1) - 1
+    hit_rows, hit_columns = np.nonzero(used)
+    candidate_order[hit_rows, rank[hit_rows, hit_columns]] = codes[hit_rows, hit_columns]
+    transpositions = (query_order != candidate_order).sum(axis=1) // 2
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jaro = np.where(
+            matches > 0,
+            (matches / len(query_codes) + matches / np.maximum(lengths, 1) + (matches - transpositions) / np.maximum(matches, 1)) / 3,
+            0.0
+        )
+    
+    # Common prefix, up to _MAX_PREFIX characters
+    span = min(_MAX_PREFIX, len(query_codes), width)
+    prefix = np.cumprod(codes[:, :span] == query_codes[:span], axis=1).sum(axis=1)
+    return jaro + prefix * _PREFIX_SCALE * (1 - jaro)
@@ -0,0 +1,267 @@
+"""
+Request coalescing ("single flight") for identical in-flight calls.
+
+Concurrent callers asking for the same key share one call: the first
+caller makes it and the others wait for its result or its error. Every
+call settles a concurrent.futures.Future, so threads and coroutines on any
+event loop can share a call, and a coroutine's call is only cancelled once
+every caller waiting for it has been cancelled.
+"""
+import asyncio
+import concurrent.futures
+import threading
+from functools import wraps
+
+# Every flight created, for get_single_flight_stats()
+_flights = []
+_flights_lock = threading.Lock()
+
+class _Call:
+    """One in-flight call and the callers waiting for it"""
+    
+    __slots__ = ("future", "loop", "task", "waiters")
+    
+    def __init__(self):
+        self.future = concurrent.futures.Future()
+        self.loop = None
+        self.task = None
+        self.waiters = 0
+
+class SingleFlight:
+    """Thread-safe key -> in-flight call registry"""
+    
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "shared": 0, "errors": 0}
+        with _flights_lock:
+            _flights.append(self)
+    
+    def do(self, key, func, *args, **kwargs):
+        """
+        Call func, or wait for an identical call already in flight (blocking)
+        
+        Args:
+            key: Hashable key identifying identical calls
+            func (callable): Plain function to call
+        
+        Returns:
+            The shared call's result (its exception is raised in every caller)
+        """
+        while True:
+            call, leader = self._join(key)
+            try:
+                if leader:
+                    self._run(key, call, func, args, kwargs)
+                return call.future.result()
+            except concurrent.futures.CancelledError:
+                # An async call whose own callers all went away; start over
+                if not call.future.cancelled():
+                    raise
+            finally:
+                self._leave(call)
+    
+    async def do_async(self, key, func, *args, **kwargs):
+        """
+        Await func(*args, **kwargs), or an identical call already in flight
+        
+        Args:
+            key: Hashable key identifying identical calls
+            func (callable): Coroutine function to call
+        
+        Returns:
+            The shared call's result (its exception is raised in every caller)
+        """
+        while True:
+            call, leader = self._join(key)
+            try:
+                if leader:
+                    self._start(key, call, func, args, kwargs)
+                return await follow_future(call.future)
+            except asyncio.CancelledError:
+                if not call.future.cancelled():
+                    # This caller was cancelled, not the call
+                    self._abandon(key, call)
+                    raise
+            finally:
+                self._leave(call)
+    
+    def start_async(self, key, func, *args, **kwargs):
+        """
+        Start func in the background unless an identical call is in flight
+        (must be called from a running event loop)
+        
+        Returns:
+            concurrent.futures.Future: The call's future
+        """
+        call, leader = self._join(key)
+        self._leave(call)
+        if leader:
+            self._start(key, call, func, args, kwargs)
+        return call.future
+    
+    def stats(self):
+        """Counters: calls made, calls shared (saved), errors and calls in flight"""
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+    
+    def _join(self, key):
+        """Return (call, leader): leader is True if this caller must make the call"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["calls"] += 1
+            else:
+                self._stats["shared"] += 1
+            call.waiters += 1
+            return call, leader
+    
+    def _leave(self, call):
+        with self._lock:
+            call.waiters -= 1
+    
+    def _finish(self, key, call, failed):
+        """Forget a call that is about to settle; later callers start a new one"""
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+            if failed:
+                self._stats["errors"] += 1
+    
+    def _run(self, key, call, func, args, kwargs):
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key, call, True)
+            call.future.set_exception(e)
+        else:
+            self._finish(key, call, False)
+            call.future.set_result(result)
+    
+    def _start(self, key, call, func, args, kwargs):
+        call.loop = asyncio.get_running_loop()
+        try:
+            call.task = call.loop.create_task(func(*args, **kwargs))
+        except BaseException as e:
+            self._finish(key, call, True)
+            call.future.set_exception(e)
+            return
+        call.task.add_done_callback(lambda task: self._settle(key, call, task))
+    
+    def _settle(self, key, call, task):
+        if task.cancelled():
+            self._finish(key, call, False)
+            call.future.cancel()
+        elif task.exception() is not None:
+            self._finish(key, call, True)
+            call.future.set_exception(task.exception())
+        else:
+            self._finish(key, call, False)
+            call.future.set_result(task.result())
+    
+    def _abandon(self, key, call):
+        """Cancel a coroutine's call once its last waiting caller is cancelled"""
+        with self._lock:
+            if call.waiters > 1 or call.task is None or call.future.done():
+                return
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call.loop.call_soon_threadsafe(call.task.cancel)
+
+def single_flight(key=None, name=None):
+    """
+    Decorator coalescing concurrent identical calls (plain or async functions)
+    
+    Args:
+        key (callable): Optional function building the key from the call arguments
+        name (str): Name reported by get_single_flight_stats() (defaults to the function's)
+    """
+    def decorator(func):
+        flight = SingleFlight(name or f"{func.__module__}.{func.__qualname__}")
+        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                flight_key = call_key(key, args, kwargs)
+                if flight_key is None:
+                    return await func(*args, **kwargs)
+                return await flight.do_async(flight_key, func, *args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                flight_key = call_key(key, args, kwargs)
+                if flight_key is None:
+                    return func(*args, **kwargs)
+                return flight.do(flight_key, func, *args, **kwargs)
+        
+        wrapper.flight = flight
+        return wrapper
+    return decorator
+
+def call_key(key, args, kwargs):
+    """
+    Build the key identifying a call
+    
+    Args:
+        key (callable): Optional function building the key from the call arguments
+        args (tuple): Positional arguments
+        kwargs (dict): Keyword arguments
+    
+    Returns:
+        The key, or None if it isn't hashable (such calls are never shared)
+    """
+    flight_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+    try:
+        hash(flight_key)
+    except TypeError:
+        return None
+    return flight_key
+
+def get_single_flight_stats():
+    """
+    Get the counters of every flight
+    
+    Returns:
+        dict: Maps flight name to its counters ("shared" is the number of calls saved)
+    """
+    with _flights_lock:
+        flights = list(_flights)
+    return {flight.name: flight.stats() for flight in flights}
+
+def follow_future(future):
+    """
+    Get an asyncio future (on the running loop) that follows a concurrent one
+    
+    Unlike asyncio.wrap_future(), cancelling it leaves the shared future
+    alone, so one waiter giving up doesn't affect the others.
+    
+    Args:
+        future (concurrent.futures.Future): Future settled by any thread
+    
+    Returns:
+        asyncio.Future: Future with the same outcome
+    """
+    loop = asyncio.get_running_loop()
+    waiter = loop.create_future()
+    
+    def copy(done):
+        if waiter.done():
+            return
+        if done.cancelled():
+            waiter.cancel()
+        elif done.exception() is not None:
+            waiter.set_exception(done.exception())
+        else:
+            waiter.set_result(done.result())
+    
+    def settle(done):
+        try:
+            loop.call_soon_threadsafe(copy, done)
+        except RuntimeError:
+            pass  # The waiting caller's loop has closed
+    
+    future.add_done_callback(settle)
+    return waiter
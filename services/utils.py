@@ -1,45 +1,213 @@
 import re
 import json
-import hashlib
-import time
+import asyncio
+import queue
+import threading
 from functools import wraps
+from services.cache import TTLCache
+from services.rate_limiter import TokenBucket, register_bucket
+from services.single_flight import SingleFlight, call_key
 
-# Cache mechanism
-_cache = {}
+# Every cache created by the decorator, for get_cache_stats()
+_caches = []
 
-def cached(expiration=3600):
+def cached(expiration=3600, ttl=None, stale_ttl=0, key=None, max_entries=None, max_bytes=None):
     """
-    Decorator for caching function results
+    Decorator for caching function results (plain or async functions)
+    
+    Concurrent misses for the same key share one call (see single_flight),
+    including its error. Expired results inside the stale window are
+    returned immediately while a single background refresh runs.
     
     Args:
         expiration (int): Cache expiration time in seconds
+        ttl (callable): Optional function mapping a result to its expiration time
+        stale_ttl (int): Seconds an expired result may still be served while it is refreshed
+        key (callable): Optional function building the cache key from the call arguments
+        max_entries (int): Maximum number of cached results (defaults to CACHE_MAX_ENTRIES)
+        max_bytes (int): Approximate memory bound in bytes (defaults to CACHE_MAX_BYTES)
     """
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Create a cache key from function name and arguments
-            key = f"{func.__name__}:{hashlib.md5(str(args).encode() + str(kwargs).encode()).hexdigest()}"
+        name = f"{func.__module__}.{func.__qualname__}"
+        cache = TTLCache(name, max_entries, max_bytes)
+        flight = SingleFlight(name)
+        _caches.append(cache)
+        
+        def store(cache_key, result):
+            cache.set(cache_key, result, ttl(result) if ttl else expiration, stale_ttl)
+        
+        if asyncio.iscoroutinefunction(func):
+            async def load(cache_key, args, kwargs):
+                result = await func(*args, **kwargs)
+                store(cache_key, result)
+                return result
+            
+            def report_refresh(future):
+                if not future.cancelled() and future.exception() is not None:
+                    print(f"Error refreshing cached {func.__name__}: {str(future.exception())}")
             
-            # Check if result is in cache and not expired
-            if key in _cache:
-                result, timestamp = _cache[key]
-                if time.time() - timestamp < expiration:
-                    return result
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                cache_key = call_key(key, args, kwargs)
+                if cache_key is None:
+                    return await func(*args, **kwargs)
+                
+                state, value = cache.get(cache_key)
+                if state == "fresh":
+                    return value
+                if state == "stale":
+                    flight.start_async(cache_key, load, cache_key, args, kwargs).add_done_callback(report_refresh)
+                    return value
+                
+                return await flight.do_async(cache_key, load, cache_key, args, kwargs)
+        else:
+            def load(cache_key, args, kwargs):
+                result = func(*args, **kwargs)
+                store(cache_key, result)
+                return result
             
-            # Call the function and cache the result
-            result = func(*args, **kwargs)
-            _cache[key] = (result, time.time())
-            return result
+            def refresh(cache_key, args, kwargs):
+                try:
+                    flight.do(cache_key, load, cache_key, args, kwargs)
+                except Exception as e:
+                    print(f"Error refreshing cached {func.__name__}: {str(e)}")
+            
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = call_key(key, args, kwargs)
+                if cache_key is None:
+                    return func(*args, **kwargs)
+                
+                state, value = cache.get(cache_key)
+                if state == "fresh":
+                    return value
+                if state == "stale":
+                    threading.Thread(target=refresh, args=(cache_key, args, kwargs), daemon=True).start()
+                    return value
+                
+                return flight.do(cache_key, load, cache_key, args, kwargs)
+        
+        def cache_lookup(*args, **kwargs):
+            """Look up a result without calling the function: returns (state, value)"""
+            cache_key = call_key(key, args, kwargs)
+            return cache.get(cache_key) if cache_key is not None else (None, None)
+        
+        def cache_store(result, *args, **kwargs):
+            """Store a result obtained elsewhere (e.g. from a batch request)"""
+            cache_key = call_key(key, args, kwargs)
+            if cache_key is not None:
+                store(cache_key, result)
+        
+        wrapper.cache = cache
+        wrapper.flight = flight
+        wrapper.cache_lookup = cache_lookup
+        wrapper.cache_store = cache_store
         return wrapper
     return decorator
 
+def get_cache_stats():
+    """
+    Get hit/miss/eviction counters for every cached function
+    
+    Returns:
+        dict: Maps cache name to its counters
+    """
+    return {cache.name: cache.stats() for cache in _caches}
+
+# Background event loop used by the synchronous service wrappers
+_loop = None
+_loop_lock = threading.Lock()
+
+def get_service_loop():
+    """
+    Get the process-wide event loop that runs the async service core
+    
+    The loop is started in a daemon thread on first use and shared by every
+    synchronous wrapper, so connection pools and other loop-bound state can be
+    reused across calls.
+    
+    Returns:
+        asyncio.AbstractEventLoop: The running background loop
+    """
+    global _loop
+    
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="domain-service-loop", daemon=True)
+            thread.start()
+            _loop = loop
+    return _loop
+
+def run_sync(coro):
+    """
+    Run a coroutine on the service loop and block until it finishes
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result (exceptions are re-raised in the caller)
+    """
+    loop = get_service_loop()
+    
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    
+    # Blocking the service loop on itself would deadlock
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the service event loop; await the coroutine instead")
+    
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+def iterate_sync(async_iterable):
+    """
+    Iterate an async generator from synchronous code
+    
+    The generator runs on the service loop and each item is handed over as
+    soon as it is produced. Closing the returned generator early cancels the
+    async one.
+    
+    Args:
+        async_iterable: Async generator to consume
+    
+    Yields:
+        Each item the async generator produces
+    """
+    finished = object()
+    items = queue.Queue()
+    
+    async def pump():
+        try:
+            async for item in async_iterable:
+                items.put((item, None))
+        except BaseException as e:
+            items.put((finished, e))
+            raise
+        items.put((finished, None))
+    
+    future = asyncio.run_coroutine_threadsafe(pump(), get_service_loop())
+    try:
+        while True:
+            item, error = items.get()
+            if item is finished:
+                if error is not None and not isinstance(error, asyncio.CancelledError):
+                    raise error
+                return
+            yield item
+    finally:
+        future.cancel()
+
 def validate_domain_name(domain_name):
     """
     Validate if a string is a valid domain name
     
     Args:
         domain_name (str): Domain name to validate
-        
+    
     Returns:
         bool: True if valid, False otherwise
     """
@@ -57,7 +225,7 @@ def clean_domain_name(domain_name):
     
     Args:
         domain_name (str): Domain name to clean
-        
+    
     Returns:
         str: Cleaned domain name
     """
@@ -74,32 +242,32 @@ def clean_domain_name(domain_name):
 
 def rate_limit(max_calls, time_frame=60):
     """
-    Decorator for rate limiting function calls
+    Decorator for rate limiting function calls (plain or async functions)
+    
+    Each decorated function gets its own token bucket that allows bursts of
+    max_calls and refills at max_calls per time_frame. Calls over the limit
+    wait for a token instead of failing.
     
     Args:
         max_calls (int): Maximum calls allowed in time frame
         time_frame (int): Time frame in seconds
     """
-    calls = []
-    
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            current_time = time.time()
-            
-            # Remove calls older than time_frame
-            while calls and calls[0] < current_time - time_frame:
-                calls.pop(0)
-            
-            # Check if we've reached the limit
-            if len(calls) >= max_calls:
-                raise Exception(f"Rate limit exceeded: {max_calls} calls per {time_frame} seconds")
-            
-            # Add current call time
-            calls.append(current_time)
-            
-            # Call the function
-            return func(*args, **kwargs)
+        bucket = TokenBucket(f"{func.__module__}.{func.__qualname__}", max_calls / time_frame, max_calls)
+        register_bucket(bucket)
+        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                await bucket.acquire_async()
+                return await func(*args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                bucket.acquire()
+                return func(*args, **kwargs)
+        
+        wrapper.bucket = bucket
         return wrapper
     return decorator
 
@@ -109,7 +277,7 @@ def parse_keyword_list(text):
     
     Args:
         text (str): Text containing keywords
-        
+    
     Returns:
         list: List of keywords
     """
@@ -143,7 +311,7 @@ def load_from_json(filename):
     
     Args:
         filename (str): File path
-        
+    
     Returns:
         Data from the file or None if file doesn't exist
     """